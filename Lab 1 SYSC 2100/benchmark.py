@@ -0,0 +1,237 @@
+# SYSC 2100 Winter 2024 - Lab 1
+#
+# A benchmark of the Lab 1 text-processing functions, for finding
+# performance regressions.
+#
+# Synthetic corpora are generated from the words in sons_of_martha.txt and
+# two_cities.txt. The number of words, the size of the vocabulary and the
+# skew of the word frequencies (the exponent s of a Zipf distribution, in
+# which the k'th most common word occurs in proportion to 1 / k ** s) can
+# be chosen, and the same seed always produces the same corpus. Each
+# function is timed (the best of several runs), then run once more with
+# tracemalloc to record its peak memory. The results are written to a
+# JSON file, and the results of an earlier run can be compared with them:
+#
+#    python benchmark.py --output before.json
+#    (change the code)
+#    python benchmark.py --output after.json --compare before.json
+
+__author__ = 'James Gohl'
+__student_number__ = '101299043'
+
+import argparse
+import bisect
+import itertools
+import json
+import os
+import platform
+import random
+import string
+import subprocess
+import tempfile
+import tracemalloc
+from time import perf_counter
+
+from build_word_list import build_word_list
+from concordance import build_concordance
+from word_histogram import (build_histogram, build_histogram_arrays,
+                            most_frequent_word, np, words_with_frequency)
+
+SOURCES = ['sons_of_martha.txt', 'two_cities.txt']
+WORDS_PER_LINE = 10
+
+
+def source_tokens(sources: list[str]) -> list[str]:
+    """Return the list of distinct whitespace-separated tokens (with their
+    punctuation and capitalization) in the source files, in the order they
+    first appear.
+    """
+    tokens = {}
+    for source in sources:
+        with open(source, encoding='utf-8') as infile:
+            for token in infile.read().split():
+                tokens.setdefault(token, None)
+    return list(tokens)
+
+
+def make_vocabulary(tokens: list[str], size: int) -> list[str]:
+    """Return a list of size tokens that are distinct words. If there
+    aren't enough source tokens, new ones are made by adding a number to
+    the letters of a source token, before any trailing punctuation; e.g.,
+    'Martha,' -> 'Martha2,'.
+    """
+    vocabulary = []
+    seen = set()
+    for i in itertools.count():
+        if len(vocabulary) == size:
+            break
+        token = tokens[i % len(tokens)]
+        suffix = i // len(tokens)
+        if suffix > 0:
+            word = token.rstrip(string.punctuation)
+            token = word + str(suffix) + token[len(word):]
+        # Make sure the tokens are still distinct words after punctuation
+        # is removed and they are converted to lower case.
+        word = token.strip(string.punctuation).lower()
+        if word != '' and word not in seen:
+            seen.add(word)
+            vocabulary.append(token)
+    return vocabulary
+
+
+def make_zipf_corpus(directory: str, num_words: int, vocabulary_size: int,
+                     skew: float, seed: int = 2100) -> str:
+    """Write a corpus of num_words words, drawn from a vocabulary of
+    vocabulary_size tokens with Zipf-distributed frequencies, to a new file
+    in directory, and return the file's name.
+    """
+    vocabulary = make_vocabulary(source_tokens(SOURCES), vocabulary_size)
+    rng = random.Random(seed)
+    rng.shuffle(vocabulary)  # so the common words aren't all from one file
+    cum_weights = list(itertools.accumulate(
+        1 / k ** skew for k in range(1, vocabulary_size + 1)))
+    total = cum_weights[-1]
+
+    filename = os.path.join(directory, 'zipf_{0}_{1}_{2}.txt'.format(
+        num_words, vocabulary_size, skew))
+    with open(filename, 'w', encoding='utf-8') as outfile:
+        written = 0
+        while written < num_words:
+            n = min(WORDS_PER_LINE, num_words - written)
+            # The same as rng.choices(vocabulary, cum_weights=cum_weights,
+            # k=n), which doesn't guarantee the same results in every
+            # version of Python.
+            line = [vocabulary[bisect.bisect(cum_weights,
+                                             rng.random() * total)]
+                    for i in range(n)]
+            outfile.write(' '.join(line) + '\n')
+            written += n
+    return filename
+
+
+def benchmarks(filename: str) -> dict:
+    """Return a dictionary of name/function pairs. Each function runs one
+    benchmark on the corpus in the file with the specified filename.
+
+    most_frequent_word and words_with_frequency are timed on a histogram
+    that is built beforehand. If NumPy is installed, the array form of the
+    histogram is benchmarked too.
+    """
+    hist = build_histogram(filename)
+    functions = {
+        'build_word_list': lambda: build_word_list(filename),
+        'build_histogram': lambda: build_histogram(filename),
+        'most_frequent_word': lambda: most_frequent_word(hist),
+        'words_with_frequency': lambda: words_with_frequency(hist, 1),
+        'build_concordance': lambda: build_concordance(filename)}
+    if np is not None:
+        pair = build_histogram_arrays(filename)
+        functions.update({
+            'build_histogram_arrays': lambda: build_histogram_arrays(filename),
+            'most_frequent_word (arrays)': lambda: most_frequent_word(pair),
+            'words_with_frequency (arrays)':
+                lambda: words_with_frequency(pair, 1)})
+    return functions
+
+
+def measure(function, repeats: int) -> tuple[float, int]:
+    """Return the best time of repeats calls of function, in seconds, and
+    the peak memory (in bytes) allocated during one more call.
+    """
+    best = float('inf')
+    for i in range(repeats):
+        start_time = perf_counter()
+        function()
+        best = min(best, perf_counter() - start_time)
+
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def git_commit() -> str:
+    """Return the hash of the current commit, or None if it isn't known."""
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'],
+                              capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(sizes: list[int], vocabulary_sizes: list[int], skews: list[float],
+        repeats: int, seed: int) -> dict:
+    """Run every benchmark on a corpus for each combination of size,
+    vocabulary size and skew, and return the results.
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for num_words, vocabulary_size, skew in itertools.product(
+                sizes, vocabulary_sizes, skews):
+            filename = make_zipf_corpus(tmpdir, num_words, vocabulary_size,
+                                        skew, seed)
+            corpus = os.path.basename(filename)
+            print(corpus)
+            for name, function in benchmarks(filename).items():
+                best, peak = measure(function, repeats)
+                print(f"\t{name:29} Time: {best:8.4f} sec  "
+                      f"Peak: {peak // 1024:8} KiB")
+                results.append({'corpus': corpus, 'function': name,
+                                'words': num_words,
+                                'vocabulary': vocabulary_size,
+                                'skew': skew, 'time': best,
+                                'peak_memory': peak})
+            os.remove(filename)
+    return {'commit': git_commit(),
+            'python': platform.python_version(),
+            'seed': seed, 'repeats': repeats, 'results': results}
+
+
+def compare(old: dict, new: dict) -> None:
+    """Print the ratio of the new time to the old time, and of the new peak
+    memory to the old peak memory, for every benchmark in both results.
+    """
+    old_results = {(result['corpus'], result['function']): result
+                   for result in old['results']}
+    print(f"Compared with {old.get('commit')}: new / old (< 1 is better)")
+    for result in new['results']:
+        key = (result['corpus'], result['function'])
+        if key not in old_results:
+            continue
+        before = old_results[key]
+        time_ratio = result['time'] / max(before['time'], 1e-9)
+        memory_ratio = result['peak_memory'] / max(before['peak_memory'], 1)
+        print(f"\t{key[0]:32} {key[1]:29} Time: {time_ratio:6.2f}  "
+              f"Peak: {memory_ratio:6.2f}")
+
+
+# You are permitted to change this script.
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Benchmark the Lab 1 text-processing functions.')
+    parser.add_argument('--words', type=int, nargs='+', default=[200000],
+                        help='number of words in each corpus')
+    parser.add_argument('--vocabulary', type=int, nargs='+',
+                        default=[1000, 20000],
+                        help='number of distinct words in each corpus')
+    parser.add_argument('--skew', type=float, nargs='+', default=[1.1],
+                        help='exponent of the Zipf distribution')
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=2100)
+    parser.add_argument('--output', default='benchmark.json',
+                        help='file to write the results to')
+    parser.add_argument('--compare', metavar='JSON',
+                        help='results of an earlier run to compare with')
+    args = parser.parse_args()
+
+    results = run(args.words, args.vocabulary, args.skew, args.repeats,
+                  args.seed)
+    with open(args.output, 'w') as outfile:
+        json.dump(results, outfile, indent=2)
+    print('Results written to', args.output)
+
+    if args.compare is not None:
+        with open(args.compare) as infile:
+            compare(json.load(infile), results)
@@ -4,86 +4,283 @@ Lab 1, Part 1, Exercise 1
 Case study: a function that uses Python's str, list and set abstract
 data types.
 """
-import string
+import sys
+from array import array
+from collections.abc import Sequence
 
-# For information about the string module
-# - type help(string) at the shell prompt, or
-# - read 'Practical Programming', Chapter 7, 'Using Methods'
+from sketches import HyperLogLog
+from text_reader import BLOCK_SIZE, iter_blocks, open_mapped
+from tokenizer import DEFAULT_TOKENIZER, Tokenizer
 
+# For information about the text_reader and tokenizer modules, type
+# help(text_reader) or help(tokenizer) at the shell prompt.
 
-def build_word_list(filename: str) -> list[str]:
+
+def build_word_list(filename: str, compact: bool = False,
+                    tokenizer: Tokenizer = DEFAULT_TOKENIZER
+                    ) -> 'list[str] | WordList':
     """Return a list of all the distinct words in the text file with the
     specified filename, sorted in ascending order.
 
+    If compact is True, the words are returned in a WordList instead of a
+    list, which uses much less memory for a large vocabulary. The words are
+    still collected in a set of strs first, so this reduces the memory that
+    is kept after the call more than the peak memory used during it.
+
+    The words are found by the specified tokenizer.
+
     >>> word_list = build_word_list('sons_of_martha.txt')
     >>> word_list
     >>> len(word_list)  # How many different words are in the file?
     """
-    # Algorithm: read a line from a text file and split the line into a
-    # list of words. For each word in the list, remve any punctuation marks
-    # before or after the word, convert the word to lower case, then put the
-    # word in a set. (This is a simple way to discard duplicate words).
-    # These steps are repeated until every line has been read and processed,
-    # after which a new list is created, containing the words from the set.
-    # The list is then sorted and returned.
-
-    infile = open(filename, "r")
+    # Algorithm: map the text file into memory and split each block of the
+    # file into a list of raw tokens (the bytes between whitespace
+    # characters). Put the raw tokens in a set. (This is a simple way to
+    # discard duplicate tokens). Then, for each distinct raw token, remove
+    # any punctuation marks before or after the word, convert the word to
+    # lower case, then put the word in a set. Finally, a new list is created,
+    # containing the words from the set. The list is then sorted and
+    # returned.
+
+    raw_set = set()
+    with open_mapped(filename) as buf:
+        for block in iter_blocks(buf):
+            # Split each block into a list of raw tokens.
+            # By default, the split method removes all whitespace; e.g.,
+            # b'  Hello,    world!   '.split() returns this list:
+            #
+            #    [b'Hello,', b'world!']
+            #
+            # Notice that the punctuation marks have not been removed.
+            # Converting the whole block to lower case first (if the
+            # tokenizer allows it) means that b'Hello,' and b'hello,' are
+            # stored once.
+
+            if tokenizer.folds_raw_case:
+                block = block.lower()
+            raw_set.update(block.split())
+
+    # The file has been closed. Each distinct raw token is now decoded and
+    # tokenized: by default, its leading and trailing punctuation is
+    # removed, and it is converted to lower case.
+    #
+    # Examples:
+    #  tokenizer.words(b'Hello,') returns ['hello'].
+    #  tokenizer.words(b'-') returns [], because stripping the punctuation
+    #  leaves the empty string, ''.
+
     word_set = set()
+    for raw in raw_set:
+        # Storing the words in a set discards any duplicates.
+        # Interning the words means that any other interned copy of the
+        # same word (e.g., a dictionary key) shares the same str object.
+        # A WordList doesn't keep the str objects, so its words aren't
+        # interned.
+        words = tokenizer.words(raw)
+        word_set.update(words if compact else map(sys.intern, words))
+
+    # The raw tokens are no longer needed.
+    del raw_set
 
-    for line in infile:
-
-        # Split each line into a list of words.
-        # By default, the split method removes all whitespace; e.g.,
-        # '  Hello,    world!   '.split() returns this list:
-        #
-        #    ['Hello,', 'world!']
-        #
-        # and not:
-        #
-        #    ['  Hello,', '    world!   ']
-        #
-        # Notice that the punctuation marks have not been removed.
-
-        word_list = line.split()
-
-        # For each word, first remove any leading or trailing punctuation,
-        # then convert the the word to lower case.
-        #
-        # Examples:
-        #  'Hello,'.strip(string.punctuation) returns 'Hello'.
-        #  'Hello'.lower() returns 'hello'.
-
-        for word in word_list:
-            word = word.strip(string.punctuation).lower()
-
-            # This statement is equivalent to:
-            # word = word.strip(string.punctuation)
-            # word = word.lower()
-
-            # Store the word is the set.
-            # Discard any empty strings that are created when punctuation
-            # marks are removed.
-            # For example, if variable word is a hyphen, '-',
-            # word.strip(string.punctuation) returns the empty string, ''.
-
-            if word != '':
-                # Storing the words in a set discards any duplicates.
-                word_set.add(word)
+    if compact:
+        # Sort the words into descending order and pop them off the end of
+        # the list, so each str is freed as soon as the WordList has
+        # encoded it, instead of all of them being kept until it is built.
+        word_list = sorted(word_set, reverse=True)
+        del word_set
+        return WordList(word_list.pop() for _ in range(len(word_list)))
 
     # Now build the list of distinct words.
     word_list = list(word_set)
 
-    # or,
-    # word_list = []
-    # for word in word_set:
-    #    word_list.append(word)
-
     # Sort the list into ascending order.
     word_list.sort()
 
     return word_list
 
 
+def count_distinct_words(filename: str, error: float = 0.01,
+                         tokenizer: Tokenizer = DEFAULT_TOKENIZER) -> int:
+    """Return an estimate of len(build_word_list(filename, tokenizer=...)),
+    the number of distinct words in the text file with the specified
+    filename, with a relative standard error of about error.
+
+    The words are recorded in a HyperLogLog sketch instead of a set, so
+    memory use doesn't depend on the size of the vocabulary.
+
+    Raises ValueError if error is not between 0 and 1.
+
+    >>> count_distinct_words('sons_of_martha.txt')
+    """
+    return distinct_words_sketch(filename, error, tokenizer).estimate()
+
+
+def distinct_words_sketch(filename: str, error: float = 0.01,
+                          tokenizer: Tokenizer = DEFAULT_TOKENIZER,
+                          block_size: int = 8 * BLOCK_SIZE) -> HyperLogLog:
+    """Return a HyperLogLog sketch of the distinct words in the text file
+    with the specified filename.
+
+    Sketches of several files built with the same error (possibly by
+    different processes) can be merged, to estimate the number of distinct
+    words in all of them.
+
+    The file is read in blocks of block_size bytes. The distinct raw
+    tokens in each block are tokenized, so larger blocks mean fewer words
+    are tokenized and hashed more than once, at the cost of more memory.
+
+    Raises ValueError if error is not between 0 and 1.
+
+    >>> sketch = distinct_words_sketch('sons_of_martha.txt')
+    >>> sketch.merge(distinct_words_sketch('two_cities.txt'))
+    >>> sketch.estimate()
+    """
+    sketch = HyperLogLog(error)
+    with open_mapped(filename) as buf:
+        for block in iter_blocks(buf, block_size=block_size):
+            # Only the distinct raw tokens of each block are tokenized and
+            # hashed.
+            if tokenizer.folds_raw_case:
+                block = block.lower()
+            for raw in set(block.split()):
+                sketch.update(tokenizer.words(raw))
+    return sketch
+
+
+class WordList(Sequence):
+    """An immutable, sorted list of distinct words, stored compactly.
+
+    All the words are encoded in UTF-8 and concatenated into a single bytes
+    object. Word i is stored in bytes offsets[i] .. offsets[i + 1] - 1,
+    where offsets is an array of unsigned integers. Each word takes its
+    encoded length plus 4 or 8 bytes, instead of the 50 or more bytes used
+    by a str object and the list's reference to it.
+
+    A WordList is two flat buffers, so it is cheap to pickle and send to
+    worker processes.
+    """
+
+    def __init__(self, words=[]) -> None:
+        """Initialize this WordList with the words provided by the iterable,
+        which must be sorted in ascending order and contain no duplicates.
+
+        Raises ValueError if the words are not sorted or are not distinct.
+
+        >>> words = WordList(['best', 'it', 'of', 'the', 'times', 'was'])
+        >>> 'times' in words
+        True
+        >>> words[1]
+        'it'
+        """
+        data = bytearray()
+        ends = array('Q', [0])
+        previous = None
+        for word in words:
+            encoded = word.encode('utf-8')
+            if previous is not None and encoded <= previous:
+                raise ValueError('WordList: words must be sorted and '
+                                 'distinct')
+            data += encoded
+            ends.append(len(data))
+            previous = encoded
+
+        self._data = bytes(data)
+        if len(data) < 2 ** 32:
+            # 4-byte offsets are enough.
+            ends = array('I', ends)
+        self._offsets = ends
+
+    def __repr__(self) -> str:
+        """Return the canonical string representation of this WordList."""
+        return "{0}({1})".format(self.__class__.__name__, list(self))
+
+    def __len__(self) -> int:
+        """Return the number of words in this WordList."""
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i: int) -> str:
+        """Return the word at index i. Negative indices and slices are
+        supported, as for a list.
+
+        Raises IndexError if the index is out of range.
+        """
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('WordList: index out of range')
+        return self._encoded(i).decode('utf-8')
+
+    def __contains__(self, word: any) -> bool:
+        """Return True if word is in this WordList; otherwise False.
+
+        Uses binary search, so takes O(log n) time.
+        """
+        if not isinstance(word, str):
+            return False
+        encoded = word.encode('utf-8')
+        i = self._bisect_left(encoded)
+        return i < len(self) and self._encoded(i) == encoded
+
+    def __eq__(self, other: any) -> bool:
+        """Return True if other is a WordList or list containing the same
+        words in the same order.
+        """
+        if isinstance(other, WordList):
+            return (self._data == other._data
+                    and self._offsets.tolist() == other._offsets.tolist())
+        if isinstance(other, list):
+            return len(self) == len(other) and list(self) == other
+        return False
+
+    def index(self, word: str, start: int = 0, stop: int = None) -> int:
+        """Return the index of word in this WordList.
+
+        Raises ValueError if word is not in the list.
+        """
+        if word in self:
+            i = self._bisect_left(word.encode('utf-8'))
+            if start <= i and (stop is None or i < stop):
+                return i
+        raise ValueError('WordList.index(x): x not in list')
+
+    def count(self, word: str) -> int:
+        """Return the number of occurrences of word (0 or 1)."""
+        return 1 if word in self else 0
+
+    def words_with_prefix(self, prefix: str):
+        """Yield the words that begin with prefix, in ascending order."""
+        encoded = prefix.encode('utf-8')
+        i = self._bisect_left(encoded)
+        while i < len(self):
+            word = self._encoded(i)
+            if not word.startswith(encoded):
+                return
+            yield word.decode('utf-8')
+            i += 1
+
+    def _encoded(self, i: int) -> bytes:
+        """Return the UTF-8 encoding of the word at index i."""
+        return self._data[self._offsets[i]:self._offsets[i + 1]]
+
+    def _bisect_left(self, encoded: bytes) -> int:
+        """Return the index of the first word whose encoding is >= encoded.
+
+        UTF-8 preserves code point order, so comparing the encodings gives
+        the same order as comparing the strs.
+        """
+        low = 0
+        high = len(self)
+        while low < high:
+            mid = (low + high) // 2
+            if self._encoded(mid) < encoded:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+
 if __name__ == '__main__':
     filename = 'sons_of_martha.txt'
     word_list = build_word_list(filename)
@@ -6,15 +6,18 @@ Lab 1, Part 3, Exercise 4, Extra-Practice Exercise 5
 __author__ = 'James Gohl'
 __student_number__ = '101299043'
 
-import string
+import os
+from collections.abc import Mapping
 
-# For information about the string module, type help(string) at the shell
-# prompt, or browse "The Python Standard Library", Section "Built-in Types",
-# Subsection "Text Sequence Type - str" in the documentation
-# (available @ python.org).
+from text_reader import iter_lines, open_mapped
+from tokenizer import DEFAULT_TOKENIZER, Tokenizer
 
+# For information about the text_reader and tokenizer modules, type
+# help(text_reader) or help(tokenizer) at the shell prompt.
 
-def build_concordance(filename: str) -> dict[str, list[int]]:
+
+def build_concordance(filename: str, tokenizer: Tokenizer = DEFAULT_TOKENIZER
+                      ) -> dict[str, list[int]]:
     """Return a concordance of words in the text file
     with the specified filename.
 
@@ -22,30 +25,197 @@ def build_concordance(filename: str) -> dict[str, list[int]]:
     text file. The value associated with each key is a list containing the line
     numbers of all the lines in the file in which the word occurs.)
 
+    The words are found by the specified tokenizer.
+
     >>> concordance = build_concordance('sons_of_martha.txt')
     """
-    infile = open(filename, "r")
     hist = {}
+    for line_num, word in _iter_line_words(filename, tokenizer):
+        postings = hist.get(word)
+        if postings is None:
+            hist[word] = [line_num]
+        elif postings[-1] != line_num:
+            # Line numbers only increase, so if word has already been seen
+            # on this line, it is the last line number in the list.
+            postings.append(line_num)
+    return hist
 
-    line_num = 0
-    for line in infile:
+
+def build_compact_concordance(filename: str,
+                              tokenizer: Tokenizer = DEFAULT_TOKENIZER
+                              ) -> 'CompactConcordance':
+    """Return the same concordance as build_concordance(filename,
+    tokenizer), stored as a CompactConcordance.
+
+    >>> concordance = build_compact_concordance('sons_of_martha.txt')
+    >>> concordance['martha']
+    [1, 4, 34]
+    """
+    concordance = CompactConcordance()
+    for line_num, word in _iter_line_words(filename, tokenizer):
+        concordance.add(word, line_num)
+    return concordance
+
+
+def _iter_line_words(filename: str, tokenizer: Tokenizer):
+    """Yield a (line number, word) pair for each word in the text file with
+    the specified filename. Line numbers start at 1.
+    """
+    with open_mapped(filename) as buf:
+        yield from iter_line_words(buf, tokenizer=tokenizer)
+
+
+def iter_line_words(buf, start: int = 0, end: int = None, line_num: int = 0,
+                    tokenizer: Tokenizer = DEFAULT_TOKENIZER):
+    """Yield a (line number, word) pair for each word in bytes
+    start .. end - 1 of buf. The first line is numbered line_num + 1.
+    A word that occurs more than once on a line can be yielded more than
+    once.
+    """
+    # Each distinct raw token is tokenized only once; the resulting words
+    # are cached in raw_words.
+    raw_words = {}
+
+    for line in iter_lines(buf, start=start, end=end):
         line_num += 1
-        word_list = line.split()
-        for word in word_list:
-            word = word.strip(string.punctuation).lower()
-            if word != '' and word not in hist:
-                hist[word] = [line_num]
-            elif word != '' and line_num not in hist[word]:
-                hist[word].append(line_num)
-    return hist
+        if tokenizer.folds_raw_case:
+            line = line.lower()
+        # dict.fromkeys removes duplicates but, unlike set, keeps the order
+        # in which the tokens first appear.
+        for raw in dict.fromkeys(line.split()):
+            words = raw_words.get(raw)
+            if words is None:
+                words = tokenizer.words(raw)
+                raw_words[raw] = words
+            for word in words:
+                yield line_num, word
+
+
+class CompactConcordance(Mapping):
+    """A concordance that stores each word's list of line numbers as a
+    bytearray of variable-length, delta-encoded integers.
+
+    The difference between consecutive line numbers is stored 7 bits per
+    byte, least significant group first, with the high bit of each byte
+    set if more bytes follow. A word that occurs on nearby lines uses one
+    byte per line number, instead of the 8-byte reference (and possibly
+    28-byte int object) used by a list.
+
+    A CompactConcordance is a read-only mapping, so it can be used like the
+    dictionary returned by build_concordance: concordance[word] decodes
+    and returns the list of line numbers for word.
+    """
+
+    def __init__(self) -> None:
+        """Initialize this CompactConcordance to be empty."""
+        self._postings = {}  # word -> bytearray of encoded line numbers
+        self._last = {}      # word -> last line number added
+
+    def __repr__(self) -> str:
+        """Return a string representation of this CompactConcordance."""
+        return "{0}({1})".format(self.__class__.__name__, dict(self.items()))
+
+    def __len__(self) -> int:
+        """Return the number of words in this CompactConcordance."""
+        return len(self._postings)
+
+    def __iter__(self):
+        """Return an iterator over the words in this CompactConcordance."""
+        return iter(self._postings)
+
+    def __contains__(self, word: any) -> bool:
+        """Return True if word is in this CompactConcordance."""
+        return word in self._postings
+
+    def __getitem__(self, word: str) -> list[int]:
+        """Return the list of line numbers on which word occurs.
+
+        Raises KeyError if word is not in the concordance.
+        """
+        return decode_postings(self._postings[word])
+
+    def add(self, word: str, line_num: int) -> None:
+        """Record that word occurs on line line_num.
+
+        Adding the same word and line number more than once has no effect.
+
+        Raises ValueError if line_num is less than the last line number
+        added for word.
+        """
+        last = self._last.get(word, 0)
+        if line_num == last:
+            return
+        if line_num < last:
+            raise ValueError('CompactConcordance.add: line numbers must be '
+                             'added in ascending order')
+
+        postings = self._postings.get(word)
+        if postings is None:
+            postings = bytearray()
+            self._postings[word] = postings
+        _encode_varint(postings, line_num - last)
+        self._last[word] = line_num
+
+    def num_bytes(self, word: str) -> int:
+        """Return the number of bytes used to store word's line numbers."""
+        return len(self._postings[word])
+
+    def encoded_postings(self, word: str) -> bytes:
+        """Return word's line numbers, delta-encoded as varints, without
+        decoding them (see decode_postings).
+
+        Raises KeyError if word is not in the concordance.
+        """
+        return bytes(self._postings[word])
+
+
+def decode_postings(data: bytes) -> list[int]:
+    """Return the list of line numbers stored in data, a sequence of
+    delta-encoded varints.
+
+    >>> decode_postings(bytes([1, 2, 0x81, 0x01]))
+    [1, 3, 132]
+    """
+    line_nums = []
+    line_num = 0
+    delta = 0
+    shift = 0
+    for byte in data:
+        delta |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            line_num += delta
+            line_nums.append(line_num)
+            delta = 0
+            shift = 0
+    return line_nums
+
+
+def _encode_varint(out: bytearray, n: int) -> None:
+    """Append non-negative integer n to out as a varint."""
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
 
 
 # Extra-Practice: Exercise 5 Solution
 
 
 if __name__ == '__main__':
+    from concordance_index import ConcordanceIndex, save_concordance
+
     file_name = input("enter file name: ")
-    concordance = build_concordance(file_name)
-    concordance = dict(sorted(concordance.items()))
-    for key, value in concordance.items():
-        print(key, ":", value)
+
+    # The concordance is saved in an index file next to the text file, and
+    # is only rebuilt when the text file is newer than the index.
+    index_name = file_name + '.idx'
+    if (not os.path.exists(index_name)
+            or os.path.getmtime(index_name) < os.path.getmtime(file_name)):
+        save_concordance(build_compact_concordance(file_name), index_name)
+
+    # The words in the index are already sorted.
+    with ConcordanceIndex(index_name) as concordance:
+        for key, value in concordance.items():
+            print(key, ":", value)
@@ -0,0 +1,241 @@
+"""
+SYSC 2100 Winter 2024
+Lab 1: A concordance stored in a binary file.
+
+save_concordance writes a concordance to a single file, and ConcordanceIndex
+maps that file into memory and looks words up in it without reading the
+whole file, so a program that uses a large concordance can start without
+rebuilding it from the text.
+
+File layout (all integers are little-endian):
+
+    header            magic b'SYSCCONC', then the version, the number of
+                      terms (n), and the starting positions of the four
+                      sections that follow, as unsigned 64-bit integers
+    term offsets      n + 1 unsigned 64-bit integers; term i is stored in
+                      bytes term_offsets[i] .. term_offsets[i + 1] - 1 of
+                      the term section
+    posting offsets   n + 1 unsigned 64-bit integers, arranged the same way
+                      for the postings section
+    terms             the UTF-8 encoded terms, sorted in ascending order
+    postings          each term's line numbers, delta-encoded as varints
+                      (see concordance.CompactConcordance)
+"""
+
+__author__ = 'James Gohl'
+__student_number__ = '101299043'
+
+import mmap
+import struct
+from collections.abc import Mapping
+
+from concordance import CompactConcordance, decode_postings
+
+MAGIC = b'SYSCCONC'
+VERSION = 1
+
+_HEADER = struct.Struct('<8s6Q')
+_OFFSET = struct.Struct('<Q')
+
+
+def save_concordance(concordance: Mapping, filename: str) -> None:
+    """Write concordance (a dictionary returned by build_concordance, or a
+    CompactConcordance) to the binary file with the specified filename.
+
+    >>> concordance = build_concordance('sons_of_martha.txt')
+    >>> save_concordance(concordance, 'sons_of_martha.idx')
+    """
+    terms = sorted(concordance)
+    term_offsets = [0]
+    posting_offsets = [0]
+    term_data = bytearray()
+    posting_data = bytearray()
+
+    for term in terms:
+        term_data += term.encode('utf-8')
+        term_offsets.append(len(term_data))
+        posting_data += _encoded_postings(concordance, term)
+        posting_offsets.append(len(posting_data))
+
+    n = len(terms)
+    offsets_size = (n + 1) * _OFFSET.size
+    term_offsets_pos = _HEADER.size
+    posting_offsets_pos = term_offsets_pos + offsets_size
+    terms_pos = posting_offsets_pos + offsets_size
+    postings_pos = terms_pos + len(term_data)
+
+    with open(filename, 'wb') as outfile:
+        outfile.write(_HEADER.pack(MAGIC, VERSION, n, term_offsets_pos,
+                                   posting_offsets_pos, terms_pos,
+                                   postings_pos))
+        outfile.write(struct.pack('<{0}Q'.format(n + 1), *term_offsets))
+        outfile.write(struct.pack('<{0}Q'.format(n + 1), *posting_offsets))
+        outfile.write(term_data)
+        outfile.write(posting_data)
+
+
+def _encoded_postings(concordance: Mapping, term: str) -> bytes:
+    """Return term's line numbers in concordance as delta-encoded varints."""
+    if hasattr(concordance, 'encoded_postings'):
+        # Already encoded (e.g., a CompactConcordance).
+        return concordance.encoded_postings(term)
+
+    encoded = CompactConcordance()
+    for line_num in concordance[term]:
+        encoded.add(term, line_num)
+    if term not in encoded:
+        return b''  # term has no line numbers
+    return encoded.encoded_postings(term)
+
+
+class ConcordanceIndex(Mapping):
+    """A read-only concordance backed by a memory-mapped file written by
+    save_concordance.
+
+    Opening an index only reads its header. A lookup reads O(log n) terms,
+    where n is the number of terms in the index, plus the postings of the
+    term that was found.
+
+    A ConcordanceIndex should be closed when it's no longer needed, either
+    by calling close or by using it in a with statement.
+    """
+
+    def __init__(self, filename: str) -> None:
+        """Open the concordance index stored in the file with the specified
+        filename.
+
+        Raises ValueError if the file isn't a concordance index.
+
+        >>> with ConcordanceIndex('sons_of_martha.idx') as index:
+        ...     index.lookup('martha')
+        ...
+        [1, 4, 34]
+        """
+        with open(filename, 'rb') as infile:
+            try:
+                self._buf = mmap.mmap(infile.fileno(), 0,
+                                      access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ValueError('ConcordanceIndex: empty file') from None
+
+        if len(self._buf) < _HEADER.size:
+            self._buf.close()
+            raise ValueError('ConcordanceIndex: not a concordance index')
+        (magic, version, self._num_terms, self._term_offsets_pos,
+         self._posting_offsets_pos, self._terms_pos, self._postings_pos) = \
+            _HEADER.unpack_from(self._buf, 0)
+        if magic != MAGIC or version != VERSION:
+            self._buf.close()
+            raise ValueError('ConcordanceIndex: not a concordance index')
+
+    def __repr__(self) -> str:
+        """Return a string representation of this ConcordanceIndex."""
+        return "<{0} with {1} terms>".format(self.__class__.__name__,
+                                             self._num_terms)
+
+    def __enter__(self) -> 'ConcordanceIndex':
+        """Return this ConcordanceIndex (for use in a with statement)."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close this ConcordanceIndex at the end of a with statement."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the memory-mapped file."""
+        self._buf.close()
+
+    def __len__(self) -> int:
+        """Return the number of terms in this ConcordanceIndex."""
+        return self._num_terms
+
+    def __iter__(self):
+        """Return an iterator over the terms, in ascending order."""
+        for i in range(self._num_terms):
+            yield self._term(i)
+
+    def __contains__(self, word: any) -> bool:
+        """Return True if word is in this ConcordanceIndex."""
+        return isinstance(word, str) and self._find(word) is not None
+
+    def __getitem__(self, word: str) -> list[int]:
+        """Return the list of line numbers on which word occurs.
+
+        Raises KeyError if word is not in the index.
+        """
+        i = self._find(word) if isinstance(word, str) else None
+        if i is None:
+            raise KeyError(word)
+        return self._postings(i)
+
+    def lookup(self, word: str) -> list[int]:
+        """Return the list of line numbers on which word occurs, or an
+        empty list if word is not in the index.
+        """
+        i = self._find(word)
+        if i is None:
+            return []
+        return self._postings(i)
+
+    def words_with_prefix(self, prefix: str) -> list[str]:
+        """Return the list of terms that begin with prefix, in ascending
+        order.
+        """
+        encoded = prefix.encode('utf-8')
+        words = []
+        i = self._bisect_left(encoded)
+        while i < self._num_terms:
+            term = self._term_bytes(i)
+            if not term.startswith(encoded):
+                break
+            words.append(term.decode('utf-8'))
+            i += 1
+        return words
+
+    def _find(self, word: str) -> int:
+        """Return the position of word in the sorted term list, or None if
+        word is not in the index.
+        """
+        encoded = word.encode('utf-8')
+        i = self._bisect_left(encoded)
+        if i < self._num_terms and self._term_bytes(i) == encoded:
+            return i
+        return None
+
+    def _bisect_left(self, encoded: bytes) -> int:
+        """Return the position of the first term that is >= encoded.
+
+        UTF-8 preserves code point order, so comparing the encoded terms
+        gives the same order as comparing the strs.
+        """
+        low = 0
+        high = self._num_terms
+        while low < high:
+            mid = (low + high) // 2
+            if self._term_bytes(mid) < encoded:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def _offsets(self, section_pos: int, i: int) -> tuple[int, int]:
+        """Return the offsets of entries i and i + 1 in the offset array
+        that starts at section_pos.
+        """
+        return struct.unpack_from('<2Q', self._buf,
+                                  section_pos + i * _OFFSET.size)
+
+    def _term_bytes(self, i: int) -> bytes:
+        """Return the encoded term at position i."""
+        start, end = self._offsets(self._term_offsets_pos, i)
+        return self._buf[self._terms_pos + start:self._terms_pos + end]
+
+    def _term(self, i: int) -> str:
+        """Return the term at position i."""
+        return self._term_bytes(i).decode('utf-8')
+
+    def _postings(self, i: int) -> list[int]:
+        """Return the decoded line numbers of the term at position i."""
+        start, end = self._offsets(self._posting_offsets_pos, i)
+        return decode_postings(
+            self._buf[self._postings_pos + start:self._postings_pos + end])
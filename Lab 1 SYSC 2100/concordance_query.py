@@ -0,0 +1,410 @@
+"""
+SYSC 2100 Winter 2024
+Lab 1: Boolean and phrase queries over a concordance.
+
+A query is made of words combined with AND, OR and NOT, grouped with
+parentheses. A phrase in double quotes matches the lines on which its words
+appear next to each other, in order. NOT binds more tightly than AND, which
+binds more tightly than OR. For example:
+
+    sons AND martha
+    (care OR careful) AND NOT "sons of mary"
+
+The result of a query is the sorted list of the line numbers that match it.
+
+Each word's line numbers are already sorted, so AND and OR are evaluated
+by merging sorted lists in O(m + n) time, for lists of lengths m <= n,
+without building sets or sorting. When one list is much shorter than the
+other, each of its line numbers is located in the longer list by galloping
+(exponential) search instead, so an AND costs O(m log(n / m)), and an OR
+copies the runs of the longer list between them with slices.
+
+Phrase queries read only the candidate lines, located through the offsets
+of the starts of the lines (8 bytes per line of the file), which are found
+by one scan of the file when the first phrase query is made.
+"""
+
+__author__ = 'James Gohl'
+__student_number__ = '101299043'
+
+import array
+import bisect
+import re
+from collections.abc import Mapping
+
+from text_reader import open_mapped
+from tokenizer import DEFAULT_TOKENIZER, Tokenizer
+
+# Galloping search is used when one list is at least this many times as
+# long as the other. For lists of similar lengths, stepping through both
+# lists is cheaper than a search per value.
+GALLOP_RATIO = 32
+
+_TOKEN = re.compile(r'\s*(?:(\()|(\))|"([^"]*)"|([^\s()"]+))')
+
+# Like iter_lines, '\n', '\r' and '\r\n' are all line endings.
+_LINE_END = re.compile(rb'\r\n?|\n')
+
+
+def intersect(a: list[int], b: list[int]) -> list[int]:
+    """Return the sorted list of the values that are in both of the sorted
+    lists a and b.
+
+    >>> intersect([1, 3, 5, 7], [2, 3, 4, 5, 6])
+    [3, 5]
+    """
+    if len(a) > len(b):
+        a, b = b, a
+    if len(a) == 0:
+        return []
+
+    result = []
+    if len(b) >= GALLOP_RATIO * len(a):
+        lo = 0
+        for x in a:
+            lo = _gallop(b, x, lo)
+            if lo == len(b):
+                break
+            if b[lo] == x:
+                result.append(x)
+                lo += 1
+        return result
+
+    # Step through both lists once, advancing b past each value of a.
+    rest = iter(b)
+    y = next(rest)
+    for x in a:
+        while y < x:
+            y = next(rest, None)
+            if y is None:
+                return result
+        if y == x:
+            result.append(x)
+    return result
+
+
+def union(a: list[int], b: list[int]) -> list[int]:
+    """Return the sorted list of the values that are in either of the sorted
+    lists a and b.
+
+    >>> union([1, 3, 5], [2, 3, 4])
+    [1, 2, 3, 4, 5]
+    """
+    if len(a) > len(b):
+        a, b = b, a
+    if len(a) == 0:
+        return list(b)
+
+    result = []
+    if len(b) >= GALLOP_RATIO * len(a):
+        # Copy the run of b before each value of a with one slice.
+        lo = 0
+        for x in a:
+            pos = _gallop(b, x, lo)
+            result.extend(b[lo:pos])
+            result.append(x)
+            lo = pos + 1 if pos < len(b) and b[pos] == x else pos
+        result.extend(b[lo:])
+        return result
+
+    # Merge the lists, keeping one copy of the values that are in both.
+    # (heapq.merge does the same, but its heap makes it slower for two
+    # lists.)
+    rest = iter(b)
+    y = next(rest)
+    for i, x in enumerate(a):
+        while y < x:
+            result.append(y)
+            y = next(rest, None)
+            if y is None:
+                result.extend(a[i:])
+                return result
+        result.append(x)
+        if y == x:
+            y = next(rest, None)
+            if y is None:
+                result.extend(a[i + 1:])
+                return result
+    result.append(y)
+    result.extend(rest)
+    return result
+
+
+def difference(a: list[int], b: list[int]) -> list[int]:
+    """Return the sorted list of the values in sorted list a that are not in
+    sorted list b.
+
+    >>> difference([1, 2, 3, 4, 5], [2, 4, 6])
+    [1, 3, 5]
+    """
+    if len(a) == 0 or len(b) == 0:
+        return list(a)
+    if len(b) < GALLOP_RATIO * len(a):
+        exclude = set(b)
+        return [x for x in a if x not in exclude]
+
+    result = []
+    lo = 0
+    for x in a:
+        lo = _gallop(b, x, lo)
+        if lo == len(b) or b[lo] != x:
+            result.append(x)
+    return result
+
+
+def _gallop(b: list[int], x: int, lo: int) -> int:
+    """Return the position of the first value in sorted list b[lo:] that is
+    >= x (len(b) if there isn't one).
+
+    The search looks at b[lo + 1], b[lo + 3], b[lo + 7], ..., until it finds
+    a value >= x, then does a binary search of the last interval, so the
+    cost is O(log d), where d is the distance from lo to the result.
+    """
+    n = len(b)
+    if lo >= n or b[lo] >= x:
+        return lo
+    bound = 1
+    while lo + bound < n and b[lo + bound] < x:
+        lo += bound
+        bound *= 2
+    return bisect.bisect_left(b, x, lo + 1, min(lo + bound + 1, n))
+
+
+class QueryEngine:
+    """Evaluates queries against a concordance (a mapping from words to
+    sorted lists of line numbers, such as the dictionary returned by
+    build_concordance, a CompactConcordance or a ConcordanceIndex).
+
+    Phrase queries need the text of the candidate lines, so they are only
+    supported if the name of the file the concordance was built from is
+    provided. The first phrase query (or NOT) scans the file once to find
+    where each line starts; after that, a phrase query reads only its
+    candidate lines. The words in queries are tokenized by the tokenizer
+    that was used to build the concordance.
+    """
+
+    def __init__(self, concordance: Mapping, filename: str = None,
+                 tokenizer: Tokenizer = DEFAULT_TOKENIZER) -> None:
+        """Initialize this QueryEngine.
+
+        >>> concordance = build_concordance('sons_of_martha.txt')
+        >>> engine = QueryEngine(concordance, 'sons_of_martha.txt')
+        >>> engine.search('sons AND martha')
+        [1, 4]
+        """
+        self._concordance = concordance
+        self._filename = filename
+        self._tokenizer = tokenizer
+        self._num_lines = None  # computed when first needed by NOT
+        self._line_starts = None  # computed when first needed
+
+    def __repr__(self) -> str:
+        """Return a string representation of this QueryEngine."""
+        return "{0}({1} words, {2!r})".format(self.__class__.__name__,
+                                              len(self._concordance),
+                                              self._filename)
+
+    def search(self, query: str) -> list[int]:
+        """Return the sorted list of the line numbers that match query.
+
+        Raises ValueError if the query is not well formed, or if it contains
+        a phrase and no filename was provided.
+        """
+        tokens = self._tokenize(query)
+        if len(tokens) == 0:
+            raise ValueError('QueryEngine.search: empty query')
+        self._tokens = tokens
+        self._pos = 0
+        result = self._parse_or()
+        if self._pos < len(tokens):
+            raise ValueError('QueryEngine.search: unexpected {0!r}'.format(
+                tokens[self._pos][1]))
+        return result
+
+    def lookup(self, word: str) -> list[int]:
+        """Return the sorted list of the line numbers on which word occurs.
+        The word is tokenized (by default, punctuation removed, converted to
+        lower case) in the same way as the words in the text.
+        """
+        words = self._tokenizer.words(word.encode('utf-8'))
+        if len(words) != 1:
+            return []
+        return list(self._concordance.get(words[0], []))
+
+    def phrase(self, phrase: str) -> list[int]:
+        """Return the sorted list of the line numbers on which the words in
+        phrase occur next to each other, in order.
+
+        Raises ValueError if no filename was provided.
+        """
+        words = self._line_words(phrase.encode('utf-8'))
+        if len(words) == 0:
+            return []
+
+        # Only the lines that contain every word in the phrase can match.
+        postings = sorted([self._concordance.get(word, []) for word in words],
+                          key=len)
+        candidates = postings[0]
+        for line_nums in postings[1:]:
+            candidates = intersect(candidates, line_nums)
+        if len(words) == 1 or len(candidates) == 0:
+            return list(candidates)
+        if self._filename is None:
+            raise ValueError('QueryEngine.phrase: phrase queries need the '
+                             'text file')
+
+        # Read only the candidate lines, and check the order of the words
+        # on each of them.
+        starts = self._get_line_starts()
+        result = []
+        with open_mapped(self._filename) as buf:
+            for line_num in candidates:
+                end = (starts[line_num] if line_num < len(starts)
+                       else len(buf))
+                line = buf[starts[line_num - 1]:end].rstrip(b'\r\n')
+                if _contains_run(self._line_words(line), words):
+                    result.append(line_num)
+        return result
+
+    def _get_line_starts(self) -> 'array.array':
+        """Return an array of the offsets in the file at which its lines
+        start; line n starts at offset starts[n - 1]. The file is scanned
+        the first time this is called.
+        """
+        if self._line_starts is None:
+            starts = array.array('q', [0])
+            with open_mapped(self._filename) as buf:
+                starts.extend(match.end()
+                              for match in _LINE_END.finditer(buf))
+                if starts[-1] == len(buf):
+                    starts.pop()  # nothing follows the last line ending
+            self._line_starts = starts
+        return self._line_starts
+
+    def _line_words(self, line: bytes) -> list[str]:
+        """Return the list of the words on a line, in order."""
+        if self._tokenizer.folds_raw_case:
+            line = line.lower()
+        words = []
+        for raw in line.split():
+            words.extend(self._tokenizer.words(raw))
+        return words
+
+    def _all_lines(self) -> range:
+        """Return the range of all the line numbers, 1 .. n, used to
+        evaluate a NOT that isn't part of an AND. A range is used instead of
+        a list, so the line numbers aren't stored.
+        """
+        if self._num_lines is None:
+            if self._filename is not None:
+                self._num_lines = len(self._get_line_starts())
+            else:
+                # The last line that contains a word.
+                self._num_lines = max(
+                    [line_nums[-1] for line_nums in
+                     self._concordance.values() if line_nums], default=0)
+        return range(1, self._num_lines + 1)
+
+    # The query is parsed by recursive descent and evaluated as it is
+    # parsed. The grammar is:
+    #
+    #    or_expr  : and_expr ('OR' and_expr)*
+    #    and_expr : not_expr ('AND' not_expr)*
+    #    not_expr : 'NOT' not_expr | '(' or_expr ')' | word | "phrase"
+
+    @staticmethod
+    def _tokenize(query: str) -> list[tuple[str, str]]:
+        """Return a list of (kind, text) tuples for the tokens in query."""
+        tokens = []
+        pos = 0
+        query = query.rstrip()
+        while pos < len(query):
+            match = _TOKEN.match(query, pos)
+            if match is None:
+                raise ValueError('QueryEngine.search: unbalanced quotes')
+            lparen, rparen, phrase, word = match.groups()
+            if lparen:
+                tokens.append(('(', lparen))
+            elif rparen:
+                tokens.append((')', rparen))
+            elif phrase is not None:
+                tokens.append(('phrase', phrase))
+            elif word in ('AND', 'OR', 'NOT'):
+                tokens.append((word, word))
+            else:
+                tokens.append(('word', word))
+            pos = match.end()
+        return tokens
+
+    def _peek(self) -> str:
+        """Return the kind of the next token, or None at the end."""
+        if self._pos < len(self._tokens):
+            return self._tokens[self._pos][0]
+        return None
+
+    def _parse_or(self) -> list[int]:
+        """Parse and evaluate an or_expr."""
+        result = self._parse_and()
+        while self._peek() == 'OR':
+            self._pos += 1
+            result = union(result, self._parse_and())
+        return result
+
+    def _parse_and(self) -> list[int]:
+        """Parse and evaluate an and_expr."""
+        # Collect the operands first, so that the shortest lists are
+        # intersected first and the NOT operands are applied last, as
+        # differences.
+        include = []
+        exclude = []
+        while True:
+            if self._peek() == 'NOT':
+                self._pos += 1
+                exclude.append(self._parse_not())
+            else:
+                include.append(self._parse_not())
+            if self._peek() != 'AND':
+                break
+            self._pos += 1
+
+        if len(include) == 0:
+            include.append(self._all_lines())
+        include.sort(key=len)
+        result = include[0]
+        for line_nums in include[1:]:
+            if len(result) == 0:
+                break
+            result = intersect(result, line_nums)
+        for line_nums in exclude:
+            result = difference(result, line_nums)
+        return result
+
+    def _parse_not(self) -> list[int]:
+        """Parse and evaluate a not_expr."""
+        kind = self._peek()
+        if kind is None:
+            raise ValueError('QueryEngine.search: unexpected end of query')
+        text = self._tokens[self._pos][1]
+        self._pos += 1
+        if kind == 'NOT':
+            return difference(self._all_lines(), self._parse_not())
+        if kind == '(':
+            result = self._parse_or()
+            if self._peek() != ')':
+                raise ValueError('QueryEngine.search: missing )')
+            self._pos += 1
+            return result
+        if kind == 'word':
+            return self.lookup(text)
+        if kind == 'phrase':
+            return self.phrase(text)
+        raise ValueError('QueryEngine.search: unexpected {0!r}'.format(text))
+
+
+def _contains_run(words: list[str], phrase: list[str]) -> bool:
+    """Return True if phrase occurs as a contiguous run in words."""
+    n = len(phrase)
+    for i in range(len(words) - n + 1):
+        if words[i:i + n] == phrase:
+            return True
+    return False
@@ -0,0 +1,185 @@
+"""
+SYSC 2100 Winter 2024
+Lab 1: Incremental histograms and concordances for append-only text files.
+
+An IncrementalIndex remembers how much of its file it has processed (the
+byte offset just after the last complete line, and the number of that
+line). Each call of refresh processes only the lines that have been
+appended since the previous call, and adds their words to the histogram
+and concordance. The state can be saved to a checkpoint file, so a later
+run of the program can continue where this one stopped.
+"""
+
+__author__ = 'James Gohl'
+__student_number__ = '101299043'
+
+import os
+import pickle
+
+from concordance import CompactConcordance, iter_line_words
+from text_reader import count_raw_tokens, last_line_end, open_mapped
+from tokenizer import DEFAULT_TOKENIZER, Tokenizer
+
+# The number of bytes before the processed offset that are saved, so that
+# refresh can detect a file that has been replaced rather than appended to.
+_FINGERPRINT_SIZE = 64
+
+
+class IncrementalIndex:
+    """The histogram and concordance of an append-only text file, updated
+    incrementally.
+
+    histogram and concordance are equal to build_histogram(filename) and
+    build_concordance(filename) as they were when refresh was last called,
+    except that a last line that doesn't yet end with a line ending is not
+    included until it is complete.
+    """
+
+    def __init__(self, filename: str, checkpoint: str = None,
+                 tokenizer: Tokenizer = DEFAULT_TOKENIZER) -> None:
+        """Initialize this IncrementalIndex for the text file with the
+        specified filename. The words are produced by tokenizer.
+
+        If checkpoint is the name of an existing checkpoint file for the
+        same text file, the saved state is loaded from it; otherwise the
+        index starts empty. Call refresh to process the file.
+
+        >>> index = IncrementalIndex('log.txt', 'log.ckpt')
+        >>> index.refresh()  # How many lines were added since the last save?
+        >>> index.save()
+        >>> index.histogram['error']
+        """
+        self._filename = filename
+        self._checkpoint = checkpoint
+        self._tokenizer = tokenizer
+        self._reset()
+        if checkpoint is not None and os.path.exists(checkpoint):
+            self._load(checkpoint)
+
+    def __repr__(self) -> str:
+        """Return a string representation of this IncrementalIndex."""
+        return "{0}({1!r}, {2!r})".format(self.__class__.__name__,
+                                          self._filename, self._checkpoint)
+
+    @property
+    def histogram(self) -> dict[str, int]:
+        """The histogram of the lines processed so far."""
+        return self._hist
+
+    @property
+    def concordance(self) -> CompactConcordance:
+        """The concordance of the lines processed so far."""
+        return self._concordance
+
+    @property
+    def offset(self) -> int:
+        """The number of bytes of the file processed so far."""
+        return self._offset
+
+    @property
+    def line_num(self) -> int:
+        """The number of lines processed so far."""
+        return self._line_num
+
+    def refresh(self) -> int:
+        """Process the complete lines that have been appended to the file
+        since the last refresh, and return the number of new lines.
+
+        If the file is now shorter than the part already processed, or its
+        contents before that point have changed, it is processed again from
+        the beginning.
+        """
+        with open_mapped(self._filename) as buf:
+            if (len(buf) < self._offset
+                    or self._fingerprint(buf) != self._saved_fingerprint):
+                self._reset()
+
+            end = last_line_end(buf, self._offset)
+            if end == self._offset:
+                return 0
+
+            tokenizer = self._tokenizer
+            raw_counts = count_raw_tokens(buf, self._offset, end,
+                                          lower=tokenizer.folds_raw_case)
+            hist = tokenizer.normalize_counts(raw_counts)
+            for word, count in hist.items():
+                self._hist[word] = self._hist.get(word, 0) + count
+
+            first_line = self._line_num
+            for line_num, word in iter_line_words(buf, self._offset, end,
+                                                  first_line, tokenizer):
+                self._concordance.add(word, line_num)
+
+            # Lines without any words aren't yielded, so count the lines
+            # themselves.
+            self._line_num = first_line + _count_lines(buf, self._offset, end)
+            self._offset = end
+            self._saved_fingerprint = self._fingerprint(buf)
+        return self._line_num - first_line
+
+    def save(self, checkpoint: str = None) -> None:
+        """Save the state of this index to the checkpoint file (by default,
+        the one passed to __init__).
+
+        Raises ValueError if no checkpoint file was specified.
+        """
+        if checkpoint is None:
+            checkpoint = self._checkpoint
+        if checkpoint is None:
+            raise ValueError('IncrementalIndex.save: no checkpoint file')
+
+        state = {'filename': os.path.abspath(self._filename),
+                 'tokenizer': repr(self._tokenizer),
+                 'offset': self._offset,
+                 'line_num': self._line_num,
+                 'fingerprint': self._saved_fingerprint,
+                 'histogram': self._hist,
+                 'concordance': self._concordance}
+
+        # Write to a temporary file first, so a crash can't leave a
+        # partially written checkpoint behind.
+        tmp_name = checkpoint + '.tmp'
+        with open(tmp_name, 'wb') as outfile:
+            pickle.dump(state, outfile, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, checkpoint)
+
+    def _load(self, checkpoint: str) -> None:
+        """Load the state saved in the checkpoint file.
+
+        Raises ValueError if the checkpoint was saved for a different file,
+        or with a different tokenizer.
+        """
+        with open(checkpoint, 'rb') as infile:
+            state = pickle.load(infile)
+        if state['filename'] != os.path.abspath(self._filename):
+            raise ValueError('IncrementalIndex: checkpoint is for ' +
+                             state['filename'])
+        if state['tokenizer'] != repr(self._tokenizer):
+            raise ValueError('IncrementalIndex: checkpoint was saved with ' +
+                             state['tokenizer'])
+        self._offset = state['offset']
+        self._line_num = state['line_num']
+        self._saved_fingerprint = state['fingerprint']
+        self._hist = state['histogram']
+        self._concordance = state['concordance']
+
+    def _reset(self) -> None:
+        """Forget everything that has been processed."""
+        self._offset = 0
+        self._line_num = 0
+        self._saved_fingerprint = b''
+        self._hist = {}
+        self._concordance = CompactConcordance()
+
+    def _fingerprint(self, buf) -> bytes:
+        """Return the bytes of buf just before the processed offset."""
+        start = max(0, self._offset - _FINGERPRINT_SIZE)
+        return buf[start:self._offset]
+
+
+def _count_lines(buf, start: int, end: int) -> int:
+    """Return the number of lines in bytes start .. end - 1 of buf, which
+    ends with a line ending.
+    """
+    data = buf[start:end]
+    return data.count(b'\n') + data.count(b'\r') - data.count(b'\r\n')
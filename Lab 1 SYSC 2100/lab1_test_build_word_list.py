@@ -0,0 +1,87 @@
+# SYSC 2100 Winter 2024 Lab 1: Unit tests for build_word_list and WordList.
+
+import pickle
+import unittest
+
+from build_word_list import (WordList, build_word_list,
+                             count_distinct_words, distinct_words_sketch)
+
+
+class WordListTestCase(unittest.TestCase):
+    """Test WordList."""
+
+    def setUp(self):
+        self.words = build_word_list('sons_of_martha.txt')
+        self.compact = build_word_list('sons_of_martha.txt', compact=True)
+
+    def test_init1(self):
+        """The compact list contains the same words as the list."""
+        self.assertIsInstance(self.compact, WordList)
+        self.assertEqual(len(self.compact), len(self.words))
+        self.assertEqual(list(self.compact), self.words)
+        self.assertEqual(self.compact, self.words)
+
+    def test_init2(self):
+        """The words must be sorted and distinct."""
+        with self.assertRaises(ValueError):
+            WordList(['b', 'a'])
+        with self.assertRaises(ValueError):
+            WordList(['a', 'a'])
+        self.assertEqual(len(WordList()), 0)
+
+    def test_getitem1(self):
+        """Test indexing with negative indices and slices."""
+        self.assertEqual(self.compact[0], self.words[0])
+        self.assertEqual(self.compact[-1], self.words[-1])
+        self.assertEqual(self.compact[3:10:2], self.words[3:10:2])
+        with self.assertRaises(IndexError):
+            self.compact[len(self.words)]
+
+    def test_contains1(self):
+        """Test membership, including non-ASCII words."""
+        for word in self.words:
+            self.assertIn(word, self.compact)
+        self.assertNotIn('zzz', self.compact)
+        self.assertNotIn('', self.compact)
+        words = WordList(['caf\u00e9', 'na\u00efve', 'zo\u00eb'])
+        self.assertIn('na\u00efve', words)
+        self.assertEqual(words.index('caf\u00e9'), 0)
+        with self.assertRaises(ValueError):
+            words.index('cafe')
+
+    def test_words_with_prefix1(self):
+        """Test prefix iteration."""
+        expected = [word for word in self.words if word.startswith('th')]
+        self.assertEqual(list(self.compact.words_with_prefix('th')),
+                         expected)
+        self.assertEqual(list(self.compact.words_with_prefix('qq')), [])
+
+    def test_pickle1(self):
+        """A WordList survives pickling."""
+        self.assertEqual(pickle.loads(pickle.dumps(self.compact)),
+                         self.compact)
+
+
+class CountDistinctWordsTestCase(unittest.TestCase):
+    """Test count_distinct_words."""
+
+    def test_count_distinct_words1(self):
+        """Compare with the exact count for the bundled texts."""
+        for filename in ['sons_of_martha.txt', 'two_cities.txt']:
+            exact = len(build_word_list(filename))
+            for error in [0.01, 0.05]:
+                self.assertAlmostEqual(count_distinct_words(filename, error),
+                                       exact, delta=3 * error * exact)
+
+    def test_distinct_words_sketch1(self):
+        """Merge the sketches of both bundled texts."""
+        exact = len(set(build_word_list('sons_of_martha.txt')) |
+                    set(build_word_list('two_cities.txt')))
+        sketch = distinct_words_sketch('sons_of_martha.txt', block_size=10)
+        sketch.merge(distinct_words_sketch('two_cities.txt'))
+        self.assertAlmostEqual(sketch.estimate(), exact,
+                               delta=3 * sketch.error * exact)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,193 @@
+# SYSC 2100 Winter 2024 Lab 1: Unit tests for the concordance functions.
+
+import os
+import string
+import tempfile
+import unittest
+
+from concordance import (CompactConcordance, build_compact_concordance,
+                         build_concordance, decode_postings)
+from concordance_index import ConcordanceIndex, save_concordance
+from concordance_query import QueryEngine, difference, intersect, union
+
+
+class BuildConcordanceTestCase(unittest.TestCase):
+    """Test build_concordance."""
+
+    def test_build_concordance1(self):
+        """Each line number is listed once, in ascending order."""
+        concordance = build_concordance('two_cities.txt')
+        self.assertEqual(concordance['times'], [1, 2])
+        self.assertEqual(concordance['best'], [1])
+        self.assertEqual(concordance['worst'], [2])
+        for line_nums in build_concordance('sons_of_martha.txt').values():
+            self.assertEqual(line_nums, sorted(set(line_nums)))
+
+    def test_build_concordance2(self):
+        """The words are in the order in which they first appear."""
+        with open('two_cities.txt', encoding='utf-8') as infile:
+            words = [word.strip(string.punctuation).lower()
+                     for word in infile.read().split()]
+        expected = list(dict.fromkeys(word for word in words if word))
+        self.assertEqual(list(build_concordance('two_cities.txt')), expected)
+
+
+class CompactConcordanceTestCase(unittest.TestCase):
+    """Test CompactConcordance."""
+
+    def test_build1(self):
+        """Compare with build_concordance."""
+        for filename in ['sons_of_martha.txt', 'two_cities.txt']:
+            compact = build_compact_concordance(filename)
+            self.assertEqual(dict(compact), build_concordance(filename))
+            self.assertEqual(len(compact), len(build_concordance(filename)))
+
+    def test_add1(self):
+        """Duplicates are ignored and large gaps use more than one byte."""
+        concordance = CompactConcordance()
+        for line_num in [1, 1, 2, 130, 130, 20000]:
+            concordance.add('x', line_num)
+        self.assertEqual(concordance['x'], [1, 2, 130, 20000])
+        # Gaps of 1, 1, 128 and 19870 take 1, 1, 2 and 3 bytes.
+        self.assertEqual(concordance.num_bytes('x'), 7)
+        encoded = concordance.encoded_postings('x')
+        self.assertEqual(len(encoded), 7)
+        self.assertEqual(decode_postings(encoded), [1, 2, 130, 20000])
+        self.assertIn('x', concordance)
+        self.assertNotIn('y', concordance)
+        with self.assertRaises(KeyError):
+            concordance['y']
+
+    def test_add2(self):
+        """Line numbers must be added in ascending order."""
+        concordance = CompactConcordance()
+        concordance.add('x', 5)
+        with self.assertRaises(ValueError):
+            concordance.add('x', 4)
+
+    def test_decode_postings1(self):
+        """Test decoding an empty sequence."""
+        self.assertEqual(decode_postings(b''), [])
+
+
+class ConcordanceIndexTestCase(unittest.TestCase):
+    """Test save_concordance and ConcordanceIndex."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name, 'test.idx')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_index1(self):
+        """Save a dictionary and a CompactConcordance, and load them."""
+        expected = build_concordance('sons_of_martha.txt')
+        for concordance in [expected,
+                            build_compact_concordance('sons_of_martha.txt')]:
+            save_concordance(concordance, self.filename)
+            with ConcordanceIndex(self.filename) as index:
+                self.assertEqual(len(index), len(expected))
+                self.assertEqual(list(index), sorted(expected))
+                self.assertEqual(dict(index), expected)
+
+    def test_lookup1(self):
+        """Look up words that are and aren't in the index."""
+        save_concordance({'b': [2], 'caf\u00e9': [1, 300], 'd': [5]},
+                         self.filename)
+        with ConcordanceIndex(self.filename) as index:
+            self.assertEqual(index.lookup('caf\u00e9'), [1, 300])
+            self.assertEqual(index.lookup('a'), [])
+            self.assertEqual(index.lookup('z'), [])
+            self.assertIn('d', index)
+            self.assertNotIn('c', index)
+            with self.assertRaises(KeyError):
+                index['c']
+
+    def test_words_with_prefix1(self):
+        """Test prefix queries."""
+        save_concordance(build_concordance('sons_of_martha.txt'),
+                         self.filename)
+        with ConcordanceIndex(self.filename) as index:
+            words = index.words_with_prefix('th')
+            self.assertEqual(words,
+                             sorted(w for w in index if w.startswith('th')))
+            self.assertIn('the', words)
+            self.assertEqual(index.words_with_prefix('zzz'), [])
+
+    def test_empty1(self):
+        """Test an empty concordance and a file that isn't an index."""
+        save_concordance({}, self.filename)
+        with ConcordanceIndex(self.filename) as index:
+            self.assertEqual(len(index), 0)
+            self.assertEqual(index.lookup('a'), [])
+        with self.assertRaises(ValueError):
+            ConcordanceIndex('two_cities.txt')
+
+
+class QueryEngineTestCase(unittest.TestCase):
+    """Test QueryEngine and the sorted-list operations it uses."""
+
+    def setUp(self):
+        self.concordance = build_concordance('sons_of_martha.txt')
+        self.engine = QueryEngine(self.concordance, 'sons_of_martha.txt')
+
+    def test_set_operations1(self):
+        """Compare with set operations, for short and long lists."""
+        a = [3, 10, 57, 58, 400, 999]
+        b = list(range(0, 1000, 3))
+        c = list(range(1, 200, 2))
+        for x, y in [(a, b), (b, a), (a, a[2:4]), ([], b), (b, c), (c, b),
+                     ([5, 999], b), (range(1, 50), [1, 49, 60])]:
+            self.assertEqual(intersect(x, y), sorted(set(x) & set(y)))
+            self.assertEqual(union(x, y), sorted(set(x) | set(y)))
+            self.assertEqual(difference(x, y), sorted(set(x) - set(y)))
+
+    def test_search1(self):
+        """Test AND, OR and NOT."""
+        sons = set(self.concordance['sons'])
+        martha = set(self.concordance['martha'])
+        mary = set(self.concordance['mary'])
+        self.assertEqual(self.engine.search('sons AND martha'),
+                         sorted(sons & martha))
+        self.assertEqual(self.engine.search('Martha OR mary'),
+                         sorted(martha | mary))
+        self.assertEqual(self.engine.search('sons AND NOT (martha OR mary)'),
+                         sorted(sons - martha - mary))
+        self.assertEqual(self.engine.search('sons AND nonexistent'), [])
+        all_lines = set(range(1, 42))
+        self.assertEqual(self.engine.search('NOT sons'),
+                         sorted(all_lines - sons))
+
+    def test_search2(self):
+        """Test phrase queries."""
+        self.assertEqual(self.engine.search('"sons of martha"'), [1, 4])
+        self.assertEqual(self.engine.search('"martha of sons"'), [])
+        self.assertEqual(self.engine.search('"sons of mary" OR martha'),
+                         [1, 3, 4, 11, 16, 34, 38])
+
+    def test_search3(self):
+        """Test queries that are not well formed."""
+        for query in ['', 'sons AND', '(sons', 'sons martha', '"sons']:
+            with self.assertRaises(ValueError):
+                self.engine.search(query)
+        with self.assertRaises(ValueError):
+            QueryEngine(self.concordance).search('"sons of martha"')
+
+    def test_search4(self):
+        """Phrase queries and NOT find the lines of a file with mixed line
+        endings, blank lines and no final line ending.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'mixed.txt')
+            with open(filename, 'wb') as outfile:
+                outfile.write(b'red fish\r\nfish red\rred fish\n\n'
+                              b'blue\r\nred fish')
+            engine = QueryEngine(build_concordance(filename), filename)
+            self.assertEqual(engine.search('"red fish"'), [1, 3, 6])
+            self.assertEqual(engine.search('"fish red"'), [2])
+            self.assertEqual(engine.search('NOT red'), [4, 5])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
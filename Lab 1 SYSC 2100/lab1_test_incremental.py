@@ -0,0 +1,111 @@
+# SYSC 2100 Winter 2024 Lab 1: Unit tests for class IncrementalIndex.
+
+import os
+import tempfile
+import unittest
+
+from concordance import build_concordance
+from incremental import IncrementalIndex
+from tokenizer import DEFAULT_STAGES, StopWordFilter, Tokenizer
+from word_histogram import build_histogram
+
+STOP_WORDS = Tokenizer(DEFAULT_STAGES + (StopWordFilter(['of', 'the']),))
+
+
+class IncrementalIndexTestCase(unittest.TestCase):
+    """Test IncrementalIndex."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name, 'log.txt')
+        self.checkpoint = os.path.join(self.tmpdir.name, 'log.ckpt')
+        with open('sons_of_martha.txt', 'rb') as infile:
+            self.lines = infile.read().splitlines(keepends=True)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def append(self, data: bytes) -> None:
+        with open(self.filename, 'ab') as outfile:
+            outfile.write(data)
+
+    def assertMatchesFile(self, index: IncrementalIndex) -> None:
+        self.assertEqual(index.histogram, build_histogram(self.filename))
+        self.assertEqual(dict(index.concordance),
+                         build_concordance(self.filename))
+
+    def test_refresh1(self):
+        """Appending in several steps gives the same result as rebuilding."""
+        open(self.filename, 'wb').close()
+        index = IncrementalIndex(self.filename)
+        self.assertEqual(index.refresh(), 0)
+        for i in range(0, len(self.lines), 7):
+            self.append(b''.join(self.lines[i:i + 7]))
+            self.assertEqual(index.refresh(), len(self.lines[i:i + 7]))
+            self.assertMatchesFile(index)
+        self.assertEqual(index.line_num, len(self.lines))
+
+    def test_refresh2(self):
+        """An incomplete last line is only processed once it is complete."""
+        self.append(b'one two\r\nthree fo')
+        index = IncrementalIndex(self.filename)
+        self.assertEqual(index.refresh(), 1)
+        self.assertEqual(index.histogram, {'one': 1, 'two': 1})
+        self.append(b'ur\r')
+        self.assertEqual(index.refresh(), 0)
+        self.append(b'\nfive\n')
+        self.assertEqual(index.refresh(), 2)
+        self.assertMatchesFile(index)
+
+    def test_refresh3(self):
+        """A file that is replaced is processed again from the start."""
+        self.append(b'alpha beta\n')
+        index = IncrementalIndex(self.filename)
+        index.refresh()
+        with open(self.filename, 'wb') as outfile:
+            outfile.write(b'gamma delta\nepsilon\n')
+        self.assertEqual(index.refresh(), 2)
+        self.assertMatchesFile(index)
+
+    def test_refresh4(self):
+        """The words are produced by the specified tokenizer."""
+        self.append(b''.join(self.lines))
+        index = IncrementalIndex(self.filename, tokenizer=STOP_WORDS)
+        index.refresh()
+        self.assertEqual(index.histogram,
+                         build_histogram(self.filename, STOP_WORDS))
+        self.assertEqual(dict(index.concordance),
+                         build_concordance(self.filename, STOP_WORDS))
+        self.assertNotIn('the', index.histogram)
+
+    def test_checkpoint1(self):
+        """The state saved in a checkpoint is restored."""
+        self.append(b''.join(self.lines[:20]))
+        index = IncrementalIndex(self.filename, self.checkpoint)
+        index.refresh()
+        index.save()
+
+        self.append(b''.join(self.lines[20:]))
+        index = IncrementalIndex(self.filename, self.checkpoint)
+        self.assertEqual(index.line_num, 20)
+        self.assertEqual(index.refresh(), len(self.lines) - 20)
+        self.assertMatchesFile(index)
+
+    def test_checkpoint2(self):
+        """save needs a checkpoint file."""
+        self.append(b'a\n')
+        with self.assertRaises(ValueError):
+            IncrementalIndex(self.filename).save()
+
+    def test_checkpoint3(self):
+        """A checkpoint saved with a different tokenizer isn't loaded."""
+        self.append(b'a\n')
+        index = IncrementalIndex(self.filename, self.checkpoint)
+        index.refresh()
+        index.save()
+        with self.assertRaises(ValueError):
+            IncrementalIndex(self.filename, self.checkpoint, STOP_WORDS)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
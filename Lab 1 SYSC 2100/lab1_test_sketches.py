@@ -0,0 +1,108 @@
+# SYSC 2100 Winter 2024 Lab 1: Unit tests for the sketches module.
+
+import pickle
+import random
+import unittest
+
+from sketches import HyperLogLog, SpaceSaving, top_k_items
+
+
+class SpaceSavingTestCase(unittest.TestCase):
+    """Test SpaceSaving."""
+
+    def test_init1(self):
+        """Test an invalid capacity."""
+        with self.assertRaises(ValueError):
+            SpaceSaving(0)
+
+    def test_add1(self):
+        """Counts are exact while there is a counter for every item."""
+        sketch = SpaceSaving(3)
+        for item in 'abacab':
+            sketch.add(item)
+        self.assertEqual(sketch.top(3), [('a', 3), ('b', 2), ('c', 1)])
+        self.assertEqual(sketch.error('a'), 0)
+
+    def test_add2(self):
+        """Test the Space-Saving error bounds on a skewed stream."""
+        rng = random.Random(2100)
+        stream = [min(int(rng.paretovariate(1.2)), 1000)
+                  for i in range(20000)]
+        true_counts = {}
+        for item in stream:
+            true_counts[item] = true_counts.get(item, 0) + 1
+
+        sketch = SpaceSaving(50)
+        for item in stream:
+            sketch.add(item)
+        self.assertEqual(len(sketch), 50)
+        for item, count in sketch.top(50):
+            self.assertLessEqual(true_counts[item], count)
+            self.assertLessEqual(count - sketch.error(item), true_counts[item])
+
+        # Every item that occurs more than n / capacity times is monitored.
+        for item, count in true_counts.items():
+            if count > len(stream) / 50:
+                self.assertGreater(sketch.count(item), 0)
+
+    def test_update1(self):
+        """Test adding a dictionary of counts."""
+        sketch = SpaceSaving(10)
+        sketch.update({'x': 5, 'y': 2})
+        sketch.update({'x': 1})
+        self.assertEqual(sketch.top(2), [('x', 6), ('y', 2)])
+
+    def test_top_k_items1(self):
+        """Test top_k_items, which SpaceSaving.top and top_k_words share."""
+        counts = {'a': 1, 'b': 3, 'c': 3, 'd': 2}
+        self.assertEqual(top_k_items(counts, 3),
+                         [('b', 3), ('c', 3), ('d', 2)])
+        self.assertEqual(top_k_items(counts, 10), sorted(
+            counts.items(), key=lambda pair: (-pair[1], pair[0])))
+        self.assertEqual(top_k_items(counts, 0), [])
+
+
+class HyperLogLogTestCase(unittest.TestCase):
+    """Test HyperLogLog."""
+
+    def test_init1(self):
+        """Test invalid errors, and the number of registers."""
+        for error in [0, 1, -0.5]:
+            with self.assertRaises(ValueError):
+                HyperLogLog(error)
+        self.assertLessEqual(HyperLogLog(0.01).error, 0.01)
+        self.assertLessEqual(HyperLogLog(0.05).error, 0.05)
+
+    def test_estimate1(self):
+        """Small counts are almost exact; duplicates aren't counted."""
+        sketch = HyperLogLog()
+        self.assertEqual(sketch.estimate(), 0)
+        for i in range(3):
+            sketch.update(['a', 'b', 'c', b'd'])
+        self.assertEqual(sketch.estimate(), 4)
+
+    def test_estimate2(self):
+        """Large counts are within 3 standard errors."""
+        for error in [0.01, 0.05]:
+            sketch = HyperLogLog(error)
+            sketch.update(str(i) for i in range(100000))
+            self.assertAlmostEqual(sketch.estimate(), 100000,
+                                   delta=3 * sketch.error * 100000)
+
+    def test_merge1(self):
+        """Merging sketches estimates the size of the union, also after
+        pickling.
+        """
+        sketch1 = HyperLogLog()
+        sketch1.update(str(i) for i in range(0, 60000))
+        sketch2 = HyperLogLog()
+        sketch2.update(str(i) for i in range(40000, 100000))
+        sketch1.merge(pickle.loads(pickle.dumps(sketch2)))
+        self.assertAlmostEqual(sketch1.estimate(), 100000,
+                               delta=3 * sketch1.error * 100000)
+        with self.assertRaises(ValueError):
+            sketch1.merge(HyperLogLog(0.1))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,96 @@
+# SYSC 2100 Winter 2024 Lab 1: Unit tests for the text_reader module.
+
+import os
+import tempfile
+import unittest
+
+from text_reader import (count_raw_tokens, iter_blocks, iter_lines,
+                         normalize, normalize_counts, open_mapped)
+
+
+class OpenMappedTestCase(unittest.TestCase):
+    """Test open_mapped."""
+
+    def test_open_mapped1(self):
+        """Test mapping a non-empty file."""
+        with open('two_cities.txt', 'rb') as infile:
+            expected = infile.read()
+        with open_mapped('two_cities.txt') as buf:
+            self.assertEqual(buf[0:len(buf)], expected)
+
+    def test_open_mapped2(self):
+        """Test mapping an empty file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'empty.txt')
+            open(filename, 'w').close()
+            with open_mapped(filename) as buf:
+                self.assertEqual(len(buf), 0)
+
+
+class IterBlocksTestCase(unittest.TestCase):
+    """Test iter_blocks."""
+
+    def test_iter_blocks1(self):
+        """No word is split between two blocks."""
+        data = b'It was the best of times,\r\nit was the worst of times.'
+        for block_size in [1, 2, 5, 100]:
+            tokens = []
+            for block in iter_blocks(data, block_size=block_size):
+                tokens.extend(block.split())
+            self.assertEqual(tokens, data.split())
+
+    def test_iter_blocks2(self):
+        """Test an invalid block size."""
+        with self.assertRaises(ValueError):
+            list(iter_blocks(b'abc', block_size=0))
+
+
+class IterLinesTestCase(unittest.TestCase):
+    """Test iter_lines."""
+
+    def test_iter_lines1(self):
+        """'\\n', '\\r' and '\\r\\n' all end a line, as in text mode."""
+        data = b'one\r\ntwo\rthree\n\nfour'
+        for block_size in [1, 2, 4, 100]:
+            self.assertEqual(list(iter_lines(data, block_size)),
+                             [b'one', b'two', b'three', b'', b'four'])
+
+
+class NormalizeTestCase(unittest.TestCase):
+    """Test normalize, normalize_counts and count_raw_tokens."""
+
+    def test_normalize1(self):
+        """Punctuation is stripped and words are converted to lower case."""
+        self.assertEqual(normalize(b'"Hello,'), ['hello'])
+        self.assertEqual(normalize(b"don't"), ["don't"])
+        self.assertEqual(normalize(b'--'), [])
+
+    def test_normalize2(self):
+        """Non-ASCII whitespace separates words."""
+        self.assertEqual(normalize('Café\u00a0Élan.'.encode()),
+                         ['café', 'élan'])
+
+    def test_normalize_counts1(self):
+        """The counts of raw tokens that give the same word are added."""
+        raw_counts = {b'times,': 2, b'times': 1, b'--': 4, b'"Its': 1,
+                      'Café.'.encode(): 3, b'its': 2}
+        self.assertEqual(normalize_counts(raw_counts),
+                         {'times': 3, 'its': 3, 'café': 3})
+        self.assertEqual(normalize_counts({}), {})
+
+    def test_normalize_counts2(self):
+        """None is returned if a raw token contains more than one word, or
+        the encoding isn't ASCII-compatible."""
+        self.assertIsNone(normalize_counts({'a\u00a0b'.encode(): 1}))
+        self.assertIsNone(normalize_counts({b'a': 1}, 'utf-16'))
+        self.assertEqual(normalize_counts({b'A\xe9': 1}, 'latin-1'),
+                         {'a\xe9': 1})
+
+    def test_count_raw_tokens1(self):
+        """Raw tokens are converted to lower case but not stripped."""
+        self.assertEqual(count_raw_tokens(b'Times, times, TIMES.'),
+                         {b'times,': 2, b'times.': 1})
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,90 @@
+# SYSC 2100 Winter 2024 Lab 1: Unit tests for the tokenizer module.
+
+import unittest
+
+from build_word_list import build_word_list
+from concordance import build_concordance
+from tokenizer import (DEFAULT_STAGES, StopWordFilter, Tokenizer, casefold,
+                       drop_empty, strip_punctuation)
+from word_histogram import build_histogram
+
+LINES = ['The Sons of Martha,', '  "Sons" of  MARY -- sons!']
+
+
+class TokenizerTestCase(unittest.TestCase):
+    """Test Tokenizer."""
+
+    def test_tokenize1(self):
+        """Test the default stages."""
+        self.assertEqual(list(Tokenizer().tokenize(LINES)),
+                         ['the', 'sons', 'of', 'martha',
+                          'sons', 'of', 'mary', 'sons'])
+
+    def test_tokenize2(self):
+        """Test a stop word filter and case folding."""
+        tokenizer = Tokenizer([strip_punctuation, casefold, drop_empty,
+                               StopWordFilter(['the', 'of'])])
+        self.assertEqual(list(tokenizer.tokenize(LINES)),
+                         ['sons', 'martha', 'sons', 'mary', 'sons'])
+        self.assertEqual(list(tokenizer.tokenize(['Straße'])), ['strasse'])
+
+    def test_tokenize3(self):
+        """Without a lowercase stage, case is preserved."""
+        tokenizer = Tokenizer([strip_punctuation, drop_empty])
+        self.assertEqual(tokenizer.words(b'MARY,'), ['MARY'])
+        self.assertFalse(tokenizer.folds_raw_case)
+
+    def test_words1(self):
+        """The default fast path gives the same words as the pipeline."""
+        default = Tokenizer()
+        generic = Tokenizer(DEFAULT_STAGES + (StopWordFilter([]),))
+        self.assertTrue(default.folds_raw_case)
+        for raw in [b'"Hello,', b'--', b"Don't", 'Café.'.encode()]:
+            self.assertEqual(default.words(raw), generic.words(raw))
+
+    def test_normalize_counts1(self):
+        """The default fast path gives the same histogram as the pipeline,
+        including for a raw token that contains more than one word."""
+        default = Tokenizer()
+        generic = Tokenizer(DEFAULT_STAGES + (StopWordFilter([]),))
+        raw_counts = {b'"hello,': 2, b'hello': 1, b'--': 3,
+                      'caf\u00e9\u00a0hello.'.encode(): 4}
+        self.assertEqual(default.normalize_counts(raw_counts),
+                         generic.normalize_counts(raw_counts))
+        self.assertEqual(default.normalize_counts(raw_counts),
+                         {'hello': 7, 'café': 4})
+
+
+class LabFunctionsTestCase(unittest.TestCase):
+    """Test the Lab 1 functions with a non-default tokenizer."""
+
+    def setUp(self):
+        self.tokenizer = Tokenizer(DEFAULT_STAGES +
+                                   (StopWordFilter(['the', 'of']),))
+
+    def test_build_histogram1(self):
+        """Stop words are not counted."""
+        expected = build_histogram('sons_of_martha.txt')
+        del expected['the']
+        del expected['of']
+        self.assertEqual(build_histogram('sons_of_martha.txt', self.tokenizer),
+                         expected)
+
+    def test_build_word_list1(self):
+        """Stop words are not listed."""
+        expected = [word for word in build_word_list('sons_of_martha.txt')
+                    if word not in ('the', 'of')]
+        self.assertEqual(build_word_list('sons_of_martha.txt',
+                                         tokenizer=self.tokenizer), expected)
+
+    def test_build_concordance1(self):
+        """Stop words are not indexed."""
+        expected = build_concordance('sons_of_martha.txt')
+        del expected['the']
+        del expected['of']
+        self.assertEqual(build_concordance('sons_of_martha.txt',
+                                           self.tokenizer), expected)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
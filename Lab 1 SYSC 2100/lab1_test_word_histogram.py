@@ -0,0 +1,283 @@
+# SYSC 2100 Winter 2024 Lab 1: Unit tests for the word histogram functions.
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+import word_histogram
+from tokenizer import DEFAULT_STAGES, StopWordFilter, Tokenizer
+from word_histogram import (FrequencyIndex, build_histogram,
+                            build_histogram_arrays, build_histogram_many,
+                            build_histogram_parallel, most_frequent_word,
+                            top_k_words, top_k_words_streaming,
+                            words_with_frequency)
+
+
+class StreamingTestCase(unittest.TestCase):
+    """Test build_histogram reading the file in blocks of different
+    sizes."""
+
+    def test_streaming1(self):
+        """Compare a large block size with the default block size."""
+        for filename in ['sons_of_martha.txt', 'two_cities.txt']:
+            self.assertEqual(build_histogram(filename, block_size=1 << 24),
+                             build_histogram(filename))
+
+    def test_streaming2(self):
+        """Compare with build_histogram when words are split across blocks."""
+        expected = build_histogram('sons_of_martha.txt')
+        for block_size in [1, 2, 7, 64, 1000]:
+            self.assertEqual(
+                build_histogram('sons_of_martha.txt', block_size=block_size),
+                expected)
+
+    def test_streaming3(self):
+        """Test a file containing non-ASCII letters and whitespace."""
+        text = 'Élan élan, CAFÉ café\x1cdone -- "Done."\n'
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'unicode.txt')
+            with open(filename, 'w', encoding='utf-8') as outfile:
+                outfile.write(text)
+            for block_size in [1, 3, 1 << 20]:
+                self.assertEqual(
+                    build_histogram(filename, block_size=block_size),
+                    {'élan': 2, 'café': 2, 'done': 2})
+
+    def test_streaming4(self):
+        """Test an invalid block size."""
+        with self.assertRaises(ValueError):
+            build_histogram('sons_of_martha.txt', block_size=0)
+        with self.assertRaises(ValueError):
+            build_histogram('sons_of_martha.txt', backend='numpy',
+                            block_size=0)
+
+
+class ParallelTestCase(unittest.TestCase):
+    """Test build_histogram_parallel."""
+
+    def test_parallel1(self):
+        """Compare with build_histogram for several numbers of workers."""
+        expected = build_histogram('sons_of_martha.txt')
+        for workers in [1, 2, 3, 8, 100]:
+            self.assertEqual(
+                build_histogram_parallel('sons_of_martha.txt', workers),
+                expected)
+
+    def test_parallel2(self):
+        """Test an empty file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'empty.txt')
+            open(filename, 'w').close()
+            self.assertEqual(build_histogram_parallel(filename, 4), {})
+
+    def test_parallel3(self):
+        """Test an invalid number of workers."""
+        with self.assertRaises(ValueError):
+            build_histogram_parallel('sons_of_martha.txt', 0)
+
+
+class ManyFilesTestCase(unittest.TestCase):
+    """Test build_histogram_many."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.paths = []
+        for i in range(25):
+            path = os.path.join(self.tmpdir.name, 'file{0}.txt'.format(i))
+            with open(path, 'w') as outfile:
+                outfile.write('Word{0} word{0}, shared -- SHARED.\n'.format(
+                    i % 7))
+            self.paths.append(path)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_many1(self):
+        """Compare with merging the histograms of the files."""
+        paths = self.paths + ['sons_of_martha.txt', 'two_cities.txt']
+        expected = {}
+        for path in paths:
+            for word, count in build_histogram(path).items():
+                expected[word] = expected.get(word, 0) + count
+        for concurrency in [1, 4, 100]:
+            self.assertEqual(build_histogram_many(paths, concurrency),
+                             expected)
+
+    def test_many2(self):
+        """Test the progress callback and an empty list of files."""
+        calls = []
+        build_histogram_many(self.paths, 3,
+                             progress=lambda *args: calls.append(args))
+        self.assertEqual(sorted(path for path, done, total in calls),
+                         sorted(self.paths))
+        self.assertEqual([done for path, done, total in calls],
+                         list(range(1, 26)))
+        self.assertTrue(all(total == 25 for path, done, total in calls))
+        self.assertEqual(build_histogram_many([]), {})
+
+    def test_many3(self):
+        """Test a missing file and an invalid concurrency."""
+        missing = os.path.join(self.tmpdir.name, 'missing.txt')
+        with self.assertRaises(FileNotFoundError):
+            build_histogram_many(self.paths + [missing], 4)
+        with self.assertRaises(ValueError):
+            build_histogram_many(self.paths, 0)
+
+
+class ArrayBackendTestCase(unittest.TestCase):
+    """Test build_histogram_arrays and the (vocab, counts) form of a
+    histogram.
+    """
+
+    def test_pair1(self):
+        """most_frequent_word and words_with_frequency accept a pair of
+        lists.
+        """
+        hist = build_histogram('sons_of_martha.txt')
+        pair = (list(hist), list(hist.values()))
+        self.assertEqual(most_frequent_word(pair), most_frequent_word(hist))
+        for n in [1, 5]:
+            self.assertEqual(words_with_frequency(pair, n),
+                             words_with_frequency(hist, n))
+
+    def test_backend1(self):
+        """Test an unknown backend."""
+        with self.assertRaises(ValueError):
+            build_histogram('sons_of_martha.txt', backend='fortran')
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_arrays1(self):
+        """Compare with build_histogram, with the default and a generic
+        tokenizer and several block sizes.
+        """
+        tokenizer = Tokenizer(DEFAULT_STAGES + (StopWordFilter(['the']),))
+        for tok in [Tokenizer(), tokenizer]:
+            expected = build_histogram('sons_of_martha.txt', tok)
+            for block_size in [7, 1 << 14]:
+                vocab, counts = build_histogram_arrays('sons_of_martha.txt',
+                                                       tok, block_size)
+                self.assertEqual(counts.dtype, numpy.int64)
+                self.assertEqual(dict(zip(vocab, counts.tolist())), expected)
+        self.assertEqual(
+            build_histogram('sons_of_martha.txt', backend='numpy'),
+            build_histogram('sons_of_martha.txt'))
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_arrays2(self):
+        """most_frequent_word and words_with_frequency accept the arrays."""
+        hist = build_histogram('sons_of_martha.txt')
+        pair = build_histogram_arrays('sons_of_martha.txt')
+        self.assertEqual(most_frequent_word(pair)[1],
+                         most_frequent_word(hist)[1])
+        for n in [1, 5]:
+            self.assertEqual(words_with_frequency(pair, n),
+                             words_with_frequency(hist, n))
+
+    @unittest.skipIf(numpy is not None, 'NumPy is installed')
+    def test_arrays3(self):
+        """Without NumPy, the array backend raises ImportError."""
+        with self.assertRaises(ImportError):
+            build_histogram_arrays('sons_of_martha.txt')
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_arrays4(self):
+        """The buffered IDs are counted whenever ID_BUFFER_SIZE is reached,
+        and the totals grow with the vocabulary.
+        """
+        expected = build_histogram('sons_of_martha.txt')
+        for buffer_size in [1, 50]:
+            with mock.patch.object(word_histogram, 'ID_BUFFER_SIZE',
+                                   buffer_size):
+                vocab, counts = build_histogram_arrays('sons_of_martha.txt',
+                                                       block_size=64)
+            self.assertEqual(dict(zip(vocab, counts.tolist())), expected)
+
+
+class TopKTestCase(unittest.TestCase):
+    """Test top_k_words and top_k_words_streaming."""
+
+    def test_top_k1(self):
+        """Compare with sorting the whole histogram."""
+        hist = build_histogram('sons_of_martha.txt')
+        expected = sorted(hist.items(), key=lambda pair: (-pair[1], pair[0]))
+        for k in [1, 5, 100, len(hist) + 1]:
+            self.assertEqual(top_k_words(hist, k), expected[:k])
+
+    def test_top_k2(self):
+        """Test k <= 0 and an empty histogram."""
+        self.assertEqual(top_k_words({'a': 1}, 0), [])
+        self.assertEqual(top_k_words({}, 3), [])
+
+    def test_top_k_streaming1(self):
+        """The result is exact when every word can be monitored."""
+        hist = build_histogram('sons_of_martha.txt')
+        self.assertEqual(
+            top_k_words_streaming('sons_of_martha.txt', 10, len(hist)),
+            top_k_words(hist, 10))
+
+    def test_top_k_streaming2(self):
+        """Frequent words are found with a small sketch."""
+        result = top_k_words_streaming('sons_of_martha.txt', 1, 20, 64)
+        self.assertEqual(result[0][0], 'the')
+        self.assertGreaterEqual(result[0][1], 42)
+
+
+class FrequencyIndexTestCase(unittest.TestCase):
+    """Test FrequencyIndex."""
+
+    def test_words_with_frequency1(self):
+        """Compare with words_with_frequency on a dictionary."""
+        hist = build_histogram('sons_of_martha.txt')
+        index = FrequencyIndex(hist)
+        for n in range(0, 45):
+            self.assertEqual(index.words_with_frequency(n),
+                             words_with_frequency(hist, n))
+            self.assertEqual(words_with_frequency(index, n),
+                             words_with_frequency(hist, n))
+
+    def test_words_in_range1(self):
+        """Test a range query."""
+        hist = build_histogram('sons_of_martha.txt')
+        index = FrequencyIndex(hist)
+        expected = sorted(word for word in hist if 5 <= hist[word] <= 20)
+        self.assertEqual(index.words_in_range(5, 20), expected)
+        self.assertEqual(index.words_in_range(50, 100), [])
+
+    def test_update1(self):
+        """Incremental updates give the same index as rebuilding it."""
+        index = FrequencyIndex({'a': 1, 'b': 2, 'c': 2})
+        index.update({'a': 1, 'd': 3})
+        self.assertEqual(index['a'], 2)
+        self.assertEqual(index.words_with_frequency(1), [])
+        self.assertEqual(index.words_with_frequency(2), ['a', 'b', 'c'])
+        self.assertEqual(index.words_in_range(1, 3), ['a', 'b', 'c', 'd'])
+        self.assertEqual(len(index), 4)
+
+    def test_update2(self):
+        """Negative counts: a word whose frequency reaches 0 is removed, and
+        a frequency can't drop below 0.
+        """
+        index = FrequencyIndex({'a': 1, 'b': 2, 'c': 2})
+        index.update({'a': -1, 'b': -1})
+        self.assertEqual(index['a'], 0)
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index.words_with_frequency(0), [])
+        self.assertEqual(index.words_with_frequency(1), ['b'])
+        self.assertEqual(index.words_in_range(0, 2), ['b', 'c'])
+        self.assertNotIn('a', repr(index))
+        with self.assertRaises(ValueError):
+            index.update({'c': -1, 'b': -2})
+        with self.assertRaises(ValueError):
+            index.update({'z': -1})
+        # A failed update doesn't change the index.
+        self.assertEqual((index['b'], index['c'], len(index)), (1, 2, 2))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
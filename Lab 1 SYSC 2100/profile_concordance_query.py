@@ -0,0 +1,83 @@
+# SYSC 2100 Winter 2024 - Lab 1
+#
+# Compare QueryEngine's AND and OR queries (merging the sorted line-number
+# lists, or galloping search when one list is much shorter) with the naive
+# approach of converting the lists to sets, combining them and sorting the
+# result.
+#
+# Also time a phrase query, which reads only its candidate lines.
+
+__author__ = 'James Gohl'
+__student_number__ = '101299043'
+
+import tempfile
+from time import perf_counter
+
+from concordance import build_concordance
+from concordance_query import QueryEngine
+from profile_text_reader import make_corpus
+
+SCALE = 2000
+REPEATS = 20
+
+QUERIES = ['sons AND martha',     # two uncommon words
+           'martha AND the',      # uncommon and common word
+           'the AND and',         # two common words
+           'guest AND the AND they',
+           'sons OR martha',
+           'martha OR the',
+           'the OR and',
+           'guest OR the OR they']
+
+PHRASE = '"sons of martha"'
+
+
+def naive(concordance: dict[str, list[int]], query: str) -> list[int]:
+    """Evaluate a query of the form 'w1 AND w2 AND ...' or
+    'w1 OR w2 OR ...' with sets.
+    """
+    if ' OR ' in query:
+        words = query.split(' OR ')
+        result = set()
+        for word in words:
+            result |= set(concordance.get(word, []))
+        return sorted(result)
+    words = query.split(' AND ')
+    result = set(concordance.get(words[0], []))
+    for word in words[1:]:
+        result &= set(concordance.get(word, []))
+    return sorted(result)
+
+
+def profile(label: str, function, *args) -> float:
+    """Return the average time of REPEATS calls of function(*args)."""
+    start_time = perf_counter()
+    for i in range(REPEATS):
+        function(*args)
+    return (perf_counter() - start_time) / REPEATS
+
+
+# You are permitted to change this script.
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = make_corpus('sons_of_martha.txt', SCALE, tmpdir)
+        concordance = build_concordance(filename)
+
+        # Make 'guest' rare by keeping only a few of its lines.
+        concordance['guest'] = concordance['guest'][::100]
+
+        engine = QueryEngine(concordance, filename)
+        print(f"Profiling queries on sons_of_martha.txt x {SCALE}")
+        for query in QUERIES:
+            assert engine.search(query) == naive(concordance, query)
+            engine_time = profile('engine', engine.search, query)
+            naive_time = profile('naive', naive, concordance, query)
+            print(f"\t{query:25} QueryEngine: {engine_time * 1000:8.3f} ms  "
+                  f"sets: {naive_time * 1000:8.3f} ms")
+
+        start_time = perf_counter()
+        engine.search(PHRASE)
+        first_time = perf_counter() - start_time
+        print(f"\t{PHRASE:25} first: {first_time * 1000:8.3f} ms  "
+              f"later: {profile('phrase', engine.search, PHRASE) * 1000:8.3f}"
+              f" ms")
@@ -0,0 +1,60 @@
+# SYSC 2100 Winter 2024 - Lab 1
+#
+# Compare counting the words in a directory of many small files by calling
+# build_histogram once per file (and merging the histograms) with
+# build_histogram_many, which reads several files at the same time and
+# tokenizes each distinct raw token once for the whole directory.
+
+__author__ = 'James Gohl'
+__student_number__ = '101299043'
+
+import os
+import tempfile
+from time import perf_counter
+
+from word_histogram import build_histogram, build_histogram_many
+
+NUM_FILES = 10000
+
+
+def one_at_a_time(paths: list[str]) -> dict[str, int]:
+    """Build the histogram of each file, and merge them."""
+    hist = {}
+    for path in paths:
+        for word, count in build_histogram(path).items():
+            hist[word] = hist.get(word, 0) + count
+    return hist
+
+
+def make_files(source: str, n: int, directory: str) -> list[str]:
+    """Write n copies of the source file to directory, and return their
+    names.
+    """
+    with open(source, 'rb') as infile:
+        text = infile.read()
+    paths = []
+    for i in range(n):
+        path = os.path.join(directory, 'file{0}.txt'.format(i))
+        with open(path, 'wb') as outfile:
+            outfile.write(text)
+        paths.append(path)
+    return paths
+
+
+# You are permitted to change this script.
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as tmpdir:
+        paths = make_files('sons_of_martha.txt', NUM_FILES, tmpdir)
+        print(f"Profiling {NUM_FILES} copies of sons_of_martha.txt")
+
+        start_time = perf_counter()
+        expected = one_at_a_time(paths)
+        print(f"\tbuild_histogram per file: "
+              f"{perf_counter() - start_time:.3f} sec")
+
+        for concurrency in [1, 4, 16]:
+            start_time = perf_counter()
+            hist = build_histogram_many(paths, concurrency)
+            print(f"\tbuild_histogram_many, concurrency {concurrency:2}: "
+                  f"{perf_counter() - start_time:.3f} sec")
+            assert hist == expected
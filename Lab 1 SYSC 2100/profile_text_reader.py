@@ -0,0 +1,84 @@
+# SYSC 2100 Winter 2024 - Lab 1
+#
+# Compare the memory used by the original line-by-line version of
+# build_histogram (which opens the file in text mode and decodes every
+# line) with the memory-mapped version that uses the text_reader module.
+# Each version runs in its own process, so the peak resident set sizes
+# don't interfere with each other.
+
+__author__ = 'James Gohl'
+__student_number__ = '101299043'
+
+import os
+import resource
+import string
+import tempfile
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+
+from word_histogram import build_histogram
+
+SCALE = 1000
+
+
+def line_loop_histogram(filename: str) -> dict[str, int]:
+    """The original implementation of build_histogram."""
+    hist = {}
+    with open(filename, "r") as infile:
+        for line in infile:
+            for word in line.split():
+                word = word.strip(string.punctuation).lower()
+                if word != '':
+                    hist[word] = hist.get(word, 0) + 1
+    return hist
+
+
+def profile(version: str, filename: str) -> tuple[float, int, int, int]:
+    """Build a histogram of filename with the specified version of
+    build_histogram. Return the elapsed time, the peak memory allocated by
+    Python objects, the number of memory blocks still allocated at the end,
+    and the peak resident set size of this process. Sizes are in KiB.
+    """
+    function = {'line loop': line_loop_histogram,
+                'mmap': build_histogram}[version]
+    tracemalloc.start()
+    start_time = perf_counter()
+    hist = function(filename)
+    total_time = perf_counter() - start_time
+    peak_traced = tracemalloc.get_traced_memory()[1] // 1024
+    num_blocks = sum(stat.count for stat in
+                     tracemalloc.take_snapshot().statistics('filename'))
+    tracemalloc.stop()
+    del hist
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return total_time, peak_traced, num_blocks, peak_rss
+
+
+def make_corpus(source: str, scale: int, directory: str) -> str:
+    """Write scale copies of the source file to a new file in directory,
+    and return the new file's name.
+    """
+    with open(source, 'rb') as infile:
+        text = infile.read()
+    filename = os.path.join(directory, 'scaled_' + os.path.basename(source))
+    with open(filename, 'wb') as outfile:
+        for i in range(scale):
+            outfile.write(text)
+    return filename
+
+
+# You are permitted to change this script.
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = make_corpus('two_cities.txt', SCALE, tmpdir)
+        print(f"Profiling build_histogram on two_cities.txt x {SCALE}")
+        for version in ['line loop', 'mmap']:
+            # Use a new process for each version, so that the peak RSS
+            # of one doesn't hide the other.
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                total_time, peak_traced, num_blocks, peak_rss = \
+                    executor.submit(profile, version, filename).result()
+            print(f"\t{version:10} Time: {total_time:.3f} sec  "
+                  f"Peak traced: {peak_traced} KiB  "
+                  f"Live blocks: {num_blocks}  Peak RSS: {peak_rss} KiB")
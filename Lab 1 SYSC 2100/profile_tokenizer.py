@@ -0,0 +1,109 @@
+# SYSC 2100 Winter 2024 - Lab 1
+#
+# Measure the throughput (tokens per second) of each stage of the
+# tokenizer pipeline, of the whole pipeline, and of the two ways the Lab 1
+# functions use it: tokenizing every raw token, or tokenizing each distinct
+# raw token once (text_reader.count_raw_tokens + normalize_counts).
+#
+# Finally, normalize_counts is measured on a large vocabulary, with the
+# default fast path (text_reader.normalize_counts) and with a loop that
+# normalizes one distinct raw token at a time.
+
+__author__ = 'James Gohl'
+__student_number__ = '101299043'
+
+from collections import deque
+from time import perf_counter
+
+from text_reader import count_raw_tokens, normalize
+from tokenizer import (DEFAULT_STAGES, StopWordFilter, Tokenizer, casefold,
+                       drop_empty, lowercase, split_whitespace,
+                       strip_punctuation)
+
+SCALE = 1000
+
+# The number of distinct raw tokens in the large vocabulary is about
+# VOCABULARY_SCALE times the number in sons_of_martha.txt.
+VOCABULARY_SCALE = 1000
+
+STOP_WORDS = ['a', 'an', 'and', 'in', 'it', 'of', 'the', 'to', 'was']
+
+
+def profile(function, *args) -> float:
+    """Return the time taken by function(*args)."""
+    start_time = perf_counter()
+    function(*args)
+    return perf_counter() - start_time
+
+
+def consume(iterable) -> None:
+    """Run an iterator (e.g., a pipeline of generators) to completion."""
+    deque(iterable, maxlen=0)
+
+
+def per_token(tokenizer: Tokenizer, raw_tokens: list[bytes]) -> None:
+    """Tokenize every raw token separately."""
+    for raw in raw_tokens:
+        tokenizer.words(raw)
+
+
+def normalize_each(raw_counts: dict[bytes, int]) -> dict[str, int]:
+    """Return the histogram of the words in raw_counts, normalizing each
+    distinct raw token separately.
+    """
+    hist = {}
+    for raw, count in raw_counts.items():
+        for word in normalize(raw):
+            hist[word] = hist.get(word, 0) + count
+    return hist
+
+
+# You are permitted to change this script.
+if __name__ == '__main__':
+    with open('sons_of_martha.txt', 'rb') as infile:
+        data = infile.read() * SCALE
+    lines = data.decode('utf-8').splitlines()
+    words = list(split_whitespace(lines))
+    n = len(words)
+    print(f"Profiling the tokenizer on sons_of_martha.txt x {SCALE} "
+          f"({n} tokens)")
+
+    print("Stages:")
+    for name, function, args in [
+            ('split_whitespace', split_whitespace, (lines,)),
+            ('strip_punctuation', strip_punctuation, (words,)),
+            ('lowercase', lowercase, (words,)),
+            ('casefold', casefold, (words,)),
+            ('drop_empty', drop_empty, (words,)),
+            ('StopWordFilter', StopWordFilter(STOP_WORDS), (words,))]:
+        elapsed = profile(lambda: consume(function(*args)))
+        print(f"\t{name:20} {n / elapsed / 1e6:6.2f} M tokens/sec")
+
+    default = Tokenizer()
+    generic = Tokenizer(DEFAULT_STAGES + (StopWordFilter([]),))
+    raw_tokens = data.split()
+    print("Pipelines:")
+    for name, function, args in [
+            ('default, tokenize', consume, (default.tokenize(lines),)),
+            ('generic, per token', per_token, (generic, raw_tokens)),
+            ('default, per token', per_token, (default, raw_tokens)),
+            ('generic, distinct', lambda: generic.normalize_counts(
+                count_raw_tokens(data, lower=False)), ()),
+            ('default, distinct', lambda: default.normalize_counts(
+                count_raw_tokens(data)), ())]:
+        elapsed = profile(function, *args)
+        print(f"\t{name:20} {n / elapsed / 1e6:6.2f} M tokens/sec")
+
+    # Prefixing a number to each raw token keeps its punctuation and case,
+    # but makes it distinct.
+    raw_counts = count_raw_tokens(data)
+    vocabulary = {b'%d%s' % (i, raw): count
+                  for i in range(VOCABULARY_SCALE)
+                  for raw, count in raw_counts.items()}
+    v = len(vocabulary)
+    print(f"normalize_counts ({v} distinct raw tokens):")
+    for name, function, args in [
+            ('one at a time', normalize_each, (vocabulary,)),
+            ('default, fast path', default.normalize_counts, (vocabulary,))]:
+        elapsed = min(profile(function, *args) for _ in range(5))
+        print(f"\t{name:20} {v / elapsed / 1e6:6.2f} M tokens/sec")
@@ -0,0 +1,231 @@
+"""
+SYSC 2100 Winter 2024
+Lab 1: Fixed-size summaries (sketches) of a stream of words.
+
+A sketch answers a question about the words in a text (e.g., "which words
+occur most often?") approximately, using an amount of memory that doesn't
+depend on the number of distinct words in the text.
+"""
+
+__author__ = 'James Gohl'
+__student_number__ = '101299043'
+
+import hashlib
+import heapq
+import math
+
+
+class SpaceSaving:
+    """Approximate counts of the most frequent items in a stream, using the
+    Space-Saving algorithm (Metwally, Agrawal and El Abbadi, 2005).
+
+    At most capacity items are monitored. When a new item arrives and every
+    counter is in use, the item with the smallest count is replaced by the
+    new item, which inherits that count as its error. For every monitored
+    item x, count(x) - error(x) <= true count of x <= count(x), and every
+    item that occurs more than n / capacity times in a stream of n items is
+    guaranteed to be monitored.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize this SpaceSaving sketch to monitor at most capacity
+        items.
+
+        Raises ValueError if capacity <= 0.
+
+        >>> sketch = SpaceSaving(2)
+        >>> for word in ['a', 'b', 'a', 'c', 'a']:
+        ...     sketch.add(word)
+        ...
+        >>> sketch.top(1)
+        [('a', 3)]
+        """
+        if capacity <= 0:
+            raise ValueError('SpaceSaving: capacity must be > 0')
+
+        self._capacity = capacity
+        self._counts = {}   # item -> estimated count
+        self._errors = {}   # item -> maximum overestimate of the count
+
+        # A min-heap of (count, item) pairs, with one entry per monitored
+        # item. Counts are only ever increased, so an entry is not updated
+        # when its item's count changes; a stale entry is refreshed when it
+        # reaches the top of the heap (see _pop_min).
+        self._heap = []
+
+    def __repr__(self) -> str:
+        """Return a string representation of this SpaceSaving sketch."""
+        return "{0}({1})".format(self.__class__.__name__, self._capacity)
+
+    def __len__(self) -> int:
+        """Return the number of items monitored by this sketch."""
+        return len(self._counts)
+
+    def add(self, item: any, count: int = 1) -> None:
+        """Record count more occurrences of item."""
+        if item in self._counts:
+            self._counts[item] += count
+        elif len(self._counts) < self._capacity:
+            self._counts[item] = count
+            self._errors[item] = 0
+            heapq.heappush(self._heap, (count, item))
+        else:
+            # Replace the item with the smallest count.
+            min_count, min_item = self._pop_min()
+            del self._counts[min_item]
+            del self._errors[min_item]
+            self._counts[item] = min_count + count
+            self._errors[item] = min_count
+            heapq.heappush(self._heap, (min_count + count, item))
+
+    def update(self, counts: dict) -> None:
+        """Record the occurrences in counts, a dictionary of item/count
+        pairs.
+        """
+        for item, count in counts.items():
+            self.add(item, count)
+
+    def count(self, item: any) -> int:
+        """Return the estimated count of item (0 if it isn't monitored)."""
+        return self._counts.get(item, 0)
+
+    def error(self, item: any) -> int:
+        """Return the maximum amount by which count(item) overestimates
+        the true count of item.
+        """
+        return self._errors.get(item, 0)
+
+    def top(self, k: int) -> list[tuple[any, int]]:
+        """Return a list of the k monitored items with the largest estimated
+        counts, as (item, count) tuples, arranged in descending order of
+        count. Items with equal counts are arranged in ascending order.
+        """
+        return top_k_items(self._counts, k)
+
+    def _pop_min(self) -> tuple[int, any]:
+        """Remove and return the (count, item) heap entry of the monitored
+        item with the smallest count.
+        """
+        while True:
+            count, item = self._heap[0]
+            current = self._counts[item]
+            if current == count:
+                return heapq.heappop(self._heap)
+            # The entry is stale; move it to its correct position.
+            heapq.heapreplace(self._heap, (current, item))
+
+
+class HyperLogLog:
+    """An estimate of the number of distinct items in a stream, using the
+    HyperLogLog algorithm (Flajolet, Fusy, Gandouet and Meunier, 2007).
+
+    Each item is hashed to 64 bits. The first p bits choose one of
+    m = 2 ** p registers, which records the largest number of leading zero
+    bits (plus one) seen in the rest of the hash. The relative standard
+    error of the estimate is about 1.04 / sqrt(m), and the sketch uses m
+    bytes, whatever the number of distinct items.
+
+    Items are hashed with BLAKE2b rather than the built-in hash function
+    (whose values for strs change each time Python starts), so sketches
+    built by different processes, or pickled and loaded later, can be
+    merged.
+    """
+
+    MIN_PRECISION = 4
+    MAX_PRECISION = 18
+
+    def __init__(self, error: float = 0.01) -> None:
+        """Initialize this HyperLogLog sketch with enough registers for a
+        relative standard error of at most error (e.g., 0.01 for 1%), as
+        far as MAX_PRECISION allows.
+
+        Raises ValueError if error is not between 0 and 1.
+
+        >>> sketch = HyperLogLog(0.05)
+        >>> sketch.update(['a', 'b', 'a', 'c'])
+        >>> sketch.estimate()
+        3
+        """
+        if not 0 < error < 1:
+            raise ValueError('HyperLogLog: error must be between 0 and 1')
+
+        precision = math.ceil(2 * math.log2(1.04 / error))
+        self._precision = min(max(precision, self.MIN_PRECISION),
+                              self.MAX_PRECISION)
+        self._registers = bytearray(1 << self._precision)
+
+    def __repr__(self) -> str:
+        """Return a string representation of this HyperLogLog sketch."""
+        return "<{0} with {1} registers>".format(self.__class__.__name__,
+                                                 len(self._registers))
+
+    @property
+    def error(self) -> float:
+        """The relative standard error of the estimate."""
+        return 1.04 / math.sqrt(len(self._registers))
+
+    def add(self, item: str) -> None:
+        """Record an occurrence of item (a str or bytes)."""
+        if isinstance(item, str):
+            item = item.encode('utf-8')
+        h = int.from_bytes(hashlib.blake2b(item, digest_size=8).digest(),
+                           'little')
+        p = self._precision
+        i = h >> (64 - p)
+        # The position of the leftmost 1 bit in the remaining 64 - p bits.
+        rank = 64 - p - (h & ((1 << (64 - p)) - 1)).bit_length() + 1
+        if rank > self._registers[i]:
+            self._registers[i] = rank
+
+    def update(self, items) -> None:
+        """Record an occurrence of each of the items in an iterable."""
+        for item in items:
+            self.add(item)
+
+    def merge(self, other: 'HyperLogLog') -> None:
+        """Add the items recorded by other to this sketch, so that it
+        estimates the number of distinct items in either stream.
+
+        Raises ValueError if the sketches have different numbers of
+        registers.
+        """
+        if other._precision != self._precision:
+            raise ValueError('HyperLogLog.merge: sketches must have the same '
+                             'precision')
+        self._registers = bytearray(map(max, self._registers,
+                                        other._registers))
+
+    def estimate(self) -> int:
+        """Return the estimated number of distinct items recorded."""
+        m = len(self._registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        if m == 16:
+            alpha = 0.673
+        elif m == 32:
+            alpha = 0.697
+        elif m == 64:
+            alpha = 0.709
+        raw = alpha * m * m / sum([2.0 ** -r for r in self._registers])
+
+        # For small counts, many registers are still zero and linear
+        # counting is more accurate.
+        zeros = self._registers.count(0)
+        if raw <= 2.5 * m and zeros > 0:
+            return round(m * math.log(m / zeros))
+        return round(raw)
+
+
+def top_k_items(counts: dict, k: int) -> list[tuple[any, int]]:
+    """Return a list of the k (item, count) pairs in counts with the largest
+    counts, in descending order of count; ties are broken by item.
+
+    >>> top_k_items({'a': 1, 'b': 3, 'c': 3}, 2)
+    [('b', 3), ('c', 3)]
+
+    Uses a heap of size k, so the running time is O(n log k), where n is
+    len(counts).
+    """
+    if k <= 0:
+        return []
+    return heapq.nsmallest(k, counts.items(),
+                           key=lambda pair: (-pair[1], pair[0]))
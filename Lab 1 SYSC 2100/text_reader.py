@@ -0,0 +1,210 @@
+"""
+SYSC 2100 Winter 2024
+Lab 1: A memory-mapped reader shared by build_word_list, build_histogram
+and build_concordance.
+
+The file is mapped into memory with mmap and processed in blocks of raw
+bytes. Words are found with bytes.split() and converted to lower case with
+bytes.lower(), both of which are implemented in C. Only the distinct raw
+tokens are decoded to str and passed to the tokenizer (see the tokenizer
+module), so a word that occurs a million times is decoded once.
+"""
+
+__author__ = 'James Gohl'
+__student_number__ = '101299043'
+
+import codecs
+import mmap
+import re
+import string
+from collections import Counter
+from contextlib import contextmanager
+from itertools import compress, repeat
+from operator import ne, not_
+
+BLOCK_SIZE = 1 << 14  # 16 KiB
+
+# The characters that bytes.split() treats as whitespace.
+WHITESPACE = b' \t\n\r\x0b\x0c'
+
+# Whitespace that str.split() splits on, other than '\n'.
+_INNER_SPACE = re.compile(r'[^\S\n]')
+
+# Encodings in which every ASCII character is encoded as a single byte with
+# the same value, so raw tokens can be joined with b'\n' (codecs names).
+_ASCII_COMPATIBLE = frozenset(['utf-8', 'ascii', 'iso8859-1', 'iso8859-15',
+                               'cp1252'])
+
+
+@contextmanager
+def open_mapped(filename: str):
+    """Map the file with the specified filename into memory and return a
+    read-only buffer that supports slicing, find and rfind. The mapping and
+    the file are closed when the with statement ends.
+
+    >>> with open_mapped('two_cities.txt') as buf:
+    ...     buf[0:6]
+    ...
+    b'It was'
+    """
+    with open(filename, 'rb') as infile:
+        try:
+            buf = mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # An empty file can't be mapped.
+            yield b''
+            return
+
+        with buf:
+            if hasattr(buf, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                # Ask the OS to read ahead and discard pages we've passed.
+                buf.madvise(mmap.MADV_SEQUENTIAL)
+            yield buf
+
+
+def iter_blocks(buf, start: int = 0, end: int = None,
+                block_size: int = BLOCK_SIZE, separators: bytes = WHITESPACE):
+    """Yield consecutive blocks of bytes start .. end - 1 of buf. Each block
+    is about block_size bytes long and, except for the last one, ends with
+    one of the separator characters, so no word (or line) is split between
+    two blocks.
+
+    Raises ValueError if block_size <= 0.
+    """
+    if block_size <= 0:
+        raise ValueError('iter_blocks: block_size must be > 0')
+    if end is None or end > len(buf):
+        end = len(buf)
+
+    # The bytes that follow the last separator in a block are carried over
+    # and prepended to the next block.
+    carry = b''
+    for pos in range(start, end, block_size):
+        block = carry + buf[pos:min(pos + block_size, end)]
+        cut = max([block.rfind(sep) for sep in separators]) + 1
+        carry = block[cut:]
+        if cut > 0:
+            yield block[:cut]
+    if carry:
+        yield carry
+
+
+def iter_lines(buf, block_size: int = BLOCK_SIZE, start: int = 0,
+               end: int = None):
+    """Yield the lines in bytes start .. end - 1 of buf, without their line
+    endings.
+
+    Like a file opened in text mode, '\\n', '\\r' and '\\r\\n' are all
+    recognized as line endings.
+    """
+    if end is None or end > len(buf):
+        end = len(buf)
+
+    carry = b''
+    for pos in range(start, end, block_size):
+        block = carry + buf[pos:min(pos + block_size, end)]
+
+        # Cut the block after its last '\n'. A '\r' can also end a line,
+        # unless it is the last byte of the block, because it might be
+        # followed by a '\n' at the start of the next block.
+        cut = max(block.rfind(b'\n'), block.rfind(b'\r', 0, -1)) + 1
+        carry = block[cut:]
+        yield from block[:cut].splitlines()
+    if carry:
+        yield from carry.splitlines()
+
+
+def last_line_end(buf, start: int = 0, end: int = None) -> int:
+    """Return the position just after the last complete line in bytes
+    start .. end - 1 of buf, or start if there is no complete line.
+
+    A '\\r' in the last byte doesn't end a line, because it might become
+    part of a '\\r\\n' when more data is appended.
+    """
+    if end is None or end > len(buf):
+        end = len(buf)
+    if end <= start:
+        return start
+    return max(buf.rfind(b'\n', start, end),
+               buf.rfind(b'\r', start, end - 1), start - 1) + 1
+
+
+def count_raw_tokens(buf, start: int = 0, end: int = None,
+                     block_size: int = BLOCK_SIZE,
+                     lower: bool = True) -> Counter:
+    """Return a Counter of the whitespace-separated raw tokens in bytes
+    start .. end - 1 of buf. If lower is True, the raw tokens are converted
+    to lower case (ASCII letters only). The raw tokens are not decoded and
+    still contain punctuation.
+    """
+    raw_counts = Counter()
+    for block in iter_blocks(buf, start, end, block_size):
+        if lower:
+            block = block.lower()
+        raw_counts.update(block.split())
+    return raw_counts
+
+
+def normalize(raw: bytes, encoding: str = 'utf-8') -> list[str]:
+    """Return the list of words in raw token raw, with any leading or
+    trailing punctuation removed and converted to lower case. Words that
+    consist only of punctuation are discarded.
+
+    bytes.split() only splits on ASCII whitespace, but str.split() also
+    splits on the other Unicode whitespace characters, so a raw token can
+    contain more than one word.
+
+    >>> normalize(b'"Hello,')
+    ['hello']
+    >>> normalize(b'--')
+    []
+    """
+    words = []
+    for word in raw.decode(encoding).split():
+        word = word.strip(string.punctuation).lower()
+        if word != '':
+            words.append(word)
+    return words
+
+
+def normalize_counts(raw_counts: dict[bytes, int],
+                     encoding: str = 'utf-8') -> dict[str, int] | None:
+    """Return the histogram of the words that normalize produces from the
+    raw tokens in raw_counts, a dictionary of raw token/count pairs.
+
+    Instead of calling normalize once per raw token, the raw tokens are
+    joined into one string, which is decoded, stripped of punctuation and
+    converted to lower case by str methods (called through map) that run
+    in C. A token that is unchanged by this is a distinct word, so those
+    words and their counts are copied into the histogram by dict(), and
+    only the changed tokens, whose words can coincide (e.g., b'times.' and
+    b'times'), are added up by a Python loop.
+
+    None is returned if a raw token decodes to more than one word (it
+    contains non-ASCII whitespace), or if the encoding doesn't encode
+    '\\n' as the single byte b'\\n'; normalize must be used instead.
+
+    >>> normalize_counts({b'times': 2, b'times.': 1, b'--': 3})
+    {'times': 3}
+    """
+    if codecs.lookup(encoding).name not in _ASCII_COMPATIBLE:
+        return None
+    text = b'\n'.join(raw_counts).decode(encoding)
+    if _INNER_SPACE.search(text) is not None:
+        return None
+    if not raw_counts:
+        return {}
+
+    tokens = text.split('\n')
+    stripped = map(str.strip, tokens, repeat(string.punctuation))
+    # Converting the joined string to lower case gives the same result as
+    # converting each token, because '\n' isn't a cased character.
+    words = '\n'.join(stripped).lower().split('\n')
+
+    changed = list(map(ne, words, tokens))
+    counts = raw_counts.values()
+    hist = dict(compress(zip(words, counts), map(not_, changed)))
+    for word, count in compress(zip(words, counts), changed):
+        if word != '':
+            hist[word] = hist.get(word, 0) + count
+    return hist
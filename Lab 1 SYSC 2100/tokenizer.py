@@ -0,0 +1,168 @@
+"""
+SYSC 2100 Winter 2024
+Lab 1: The tokenizer used by build_word_list, build_histogram and
+build_concordance.
+
+A Tokenizer splits text into words and passes them through a pipeline of
+stages. Each stage is a generator function (or other callable) that takes
+an iterable of words and returns an iterable of words; e.g., a stage can
+change each word, or discard some words. The default pipeline removes any
+leading or trailing punctuation, converts each word to lower case and
+discards empty words:
+
+    >>> tokenizer = Tokenizer()
+    >>> list(tokenizer.tokenize(['It was the best of times,']))
+    ['it', 'was', 'the', 'best', 'of', 'times']
+
+Other stages can be added; e.g., to discard stop words:
+
+    >>> tokenizer = Tokenizer(DEFAULT_STAGES + (StopWordFilter(['the']),))
+
+Every stage works on one word at a time, so the words produced from a
+whitespace-separated token depend only on that token. The Lab 1 functions
+use this to run the pipeline once per distinct token in the file (see
+text_reader) instead of once per token. When the default stages are used,
+the pipeline is replaced by text_reader.normalize, which does the same
+work in a single loop, and normalize_counts is replaced by
+text_reader.normalize_counts, which normalizes all the distinct tokens at
+once with str methods that run in C.
+"""
+
+__author__ = 'James Gohl'
+__student_number__ = '101299043'
+
+import string
+
+import text_reader
+from text_reader import normalize
+
+
+def split_whitespace(lines):
+    """Yield the whitespace-separated words in each of the lines."""
+    for line in lines:
+        yield from line.split()
+
+
+def strip_punctuation(words):
+    """Yield each word with any leading or trailing punctuation removed."""
+    punctuation = string.punctuation
+    for word in words:
+        yield word.strip(punctuation)
+
+
+def lowercase(words):
+    """Yield each word converted to lower case."""
+    for word in words:
+        yield word.lower()
+
+
+def casefold(words):
+    """Yield each word case-folded (a more aggressive version of lower case
+    for caseless matching of Unicode text; e.g., 'Straße' becomes
+    'strasse').
+    """
+    for word in words:
+        yield word.casefold()
+
+
+def drop_empty(words):
+    """Yield the words that are not empty strings."""
+    for word in words:
+        if word != '':
+            yield word
+
+
+class StopWordFilter:
+    """A stage that discards the words in a set of stop words."""
+
+    def __init__(self, stop_words) -> None:
+        """Initialize this StopWordFilter to discard the words provided by
+        the iterable stop_words.
+        """
+        self._stop_words = frozenset(stop_words)
+
+    def __repr__(self) -> str:
+        """Return the canonical string representation of this
+        StopWordFilter.
+        """
+        return "{0}({1})".format(self.__class__.__name__,
+                                 sorted(self._stop_words))
+
+    def __call__(self, words):
+        """Yield the words that are not stop words."""
+        stop_words = self._stop_words
+        for word in words:
+            if word not in stop_words:
+                yield word
+
+
+DEFAULT_STAGES = (strip_punctuation, lowercase, drop_empty)
+
+
+class Tokenizer:
+    """Splits text into words and passes them through a pipeline of
+    stages.
+    """
+
+    def __init__(self, stages=DEFAULT_STAGES, encoding: str = 'utf-8') -> None:
+        """Initialize this Tokenizer to apply the stages, in order, to the
+        whitespace-separated words in the text. Raw bytes are decoded with
+        the specified encoding.
+        """
+        self._stages = tuple(stages)
+        self._encoding = encoding
+        self._is_default = self._stages == DEFAULT_STAGES
+
+    def __repr__(self) -> str:
+        """Return the canonical string representation of this Tokenizer."""
+        return "{0}({1}, {2!r})".format(
+            self.__class__.__name__,
+            '(' + ', '.join([getattr(stage, '__name__', repr(stage))
+                             for stage in self._stages]) + ')',
+            self._encoding)
+
+    @property
+    def folds_raw_case(self) -> bool:
+        """True if raw tokens can be converted to lower case (ASCII letters
+        only) before they are tokenized, without changing the words that
+        are produced. This lets raw tokens that differ only in case be
+        counted together.
+        """
+        return self._is_default
+
+    def tokenize(self, lines):
+        """Return a generator that yields the words in lines, an iterable
+        of strs, after they have passed through every stage.
+        """
+        words = split_whitespace(lines)
+        for stage in self._stages:
+            words = stage(words)
+        return words
+
+    def words(self, raw: bytes) -> list[str]:
+        """Return the list of words produced from raw, a sequence of bytes
+        that doesn't contain any ASCII whitespace.
+        """
+        if self._is_default:
+            return normalize(raw, self._encoding)
+        return list(self.tokenize([raw.decode(self._encoding)]))
+
+    def normalize_counts(self, raw_counts: dict[bytes, int]) -> dict[str, int]:
+        """Return the histogram of the words produced from the raw tokens in
+        raw_counts, a dictionary of raw token/count pairs.
+
+        Several raw tokens can produce the same word (e.g., b'times.' and
+        b'times'), so their counts are added together.
+        """
+        if self._is_default:
+            hist = text_reader.normalize_counts(raw_counts, self._encoding)
+            if hist is not None:
+                return hist
+        hist = {}
+        for raw, count in raw_counts.items():
+            for word in self.words(raw):
+                hist[word] = hist.get(word, 0) + count
+        return hist
+
+
+DEFAULT_TOKENIZER = Tokenizer()
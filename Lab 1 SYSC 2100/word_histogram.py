@@ -8,15 +8,29 @@ abstract data types.
 __author__ = 'James Gohl'
 __student_number__ = '101299043'
 
-import string
+import asyncio
+import bisect
+import heapq
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
-# For information about the string module, type help(string) at the shell
-# prompt, or browse "The Python Standard Library", Section "Built-in Types",
-# Subsection "Text Sequence Type - str" in the Python documentation
-# (available @ python.org).
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed by build_histogram_arrays
+    np = None
 
+from sketches import SpaceSaving, top_k_items
+from text_reader import BLOCK_SIZE, count_raw_tokens, iter_blocks, open_mapped
+from tokenizer import DEFAULT_TOKENIZER, Tokenizer
 
-def build_histogram(filename: str) -> dict[str, int]:
+# For information about the text_reader and tokenizer modules, type
+# help(text_reader) or help(tokenizer) at the shell prompt.
+
+
+def build_histogram(filename: str, tokenizer: Tokenizer = DEFAULT_TOKENIZER,
+                    backend: str = 'python',
+                    block_size: int = BLOCK_SIZE) -> dict[str, int]:
     """Return a histogram of the words in the text file with the specified name.
 
     The histogram is a collection of counters. Each counter keeps track of the
@@ -26,61 +40,327 @@ def build_histogram(filename: str) -> dict[str, int]:
     file. The value associated with each key is the number of occurrences of
     that word.
 
+    The words are found by the specified tokenizer.
+
+    The file is read in blocks of block_size bytes, so memory use is bounded
+    by the block size plus the vocabulary, and the file can be much larger
+    than the available memory.
+
+    If backend is 'numpy', the words are counted by build_histogram_arrays.
+
+    Raises ValueError if backend is not 'python' or 'numpy', or if
+    block_size <= 0.
+
     >>> hist = build_histogram('sons_of_martha.txt')
     >>> hist
     >>> len(hist)  # How many different words are in the file?
     """
-    infile = open(filename, "r")
-    hist = {}
-
-    for line in infile:
-
-        # Split each line into a list of words.
-        # By default, the split method removes all whitespace; e.g.,
-        # '  Hello,    world!   '.split() returns this list:
-        #
-        #    ['Hello,', 'world!']
-        #
-        # and not:
-        #
-        #    ['  Hello,', '    world!   ']
-        #
-        # Notice that the punctuation marks have not been removed.
-
-        word_list = line.split()
-
-        # For each word, first remove any leading or trailing punctuation,
-        # then convert the the word to lower case.
-        #
-        # Examples:
-        #  'Hello,'.strip(string.punctuation) returns 'Hello'.
-        #  'Hello'.lower() returns 'hello'.
-
-        for word in word_list:
-            word = word.strip(string.punctuation).lower()
-
-            # or,
-            # word = word.strip(string.punctuation)
-            # word = word.lower()
-
-            # Increment the counter that counts the number of times
-            # word is in the file.
-            # Don't count any empty strings that are created when punctuation
-            # marks are removed.
-            # For example, if variable word is a hyphen, '-',
-            # word.strip(string.punctuation) returns the empty string, ''.
-
-            if word != '':
-                count = hist.get(word, 0)  # get returns the current count of
-                # the number of occurrences of word,
-                # or 0 if word is not yet in the
-                # dictionary.
-                hist[word] = count + 1
-
-            # or simply,
-            # hist[word] = hist.get(word, 0) + 1
-
-    return hist
+    if block_size <= 0:
+        raise ValueError('build_histogram: block_size must be > 0')
+    if backend == 'numpy':
+        vocab, counts = build_histogram_arrays(filename, tokenizer,
+                                               block_size)
+        return dict(zip(vocab, counts.tolist()))
+    if backend != 'python':
+        raise ValueError('build_histogram: unknown backend ' + repr(backend))
+
+    # The file is mapped into memory and split into blocks of raw tokens
+    # (the bytes between whitespace characters); e.g., the bytes
+    # b'  Hello,    world!   ' contain the raw tokens b'Hello,' and b'world!'.
+    # count_raw_tokens counts how many times each raw token occurs, after
+    # converting it to lower case (if the tokenizer allows it). The
+    # built-in bytes.split and Counter (both implemented in C) do the
+    # per-word work.
+
+    with open_mapped(filename) as buf:
+        raw_counts = count_raw_tokens(buf, block_size=block_size,
+                                      lower=tokenizer.folds_raw_case)
+
+    # Now tokenize each distinct raw token; by default, this removes any
+    # leading or trailing punctuation and converts the token to a str.
+    # Several raw tokens can produce the same word (e.g., b'times.' and
+    # b'times'), so their counts are added.
+    # Don't count any empty strings that are created when punctuation
+    # marks are removed.
+    # For example, if the raw token is a hyphen, b'-', tokenizer.words
+    # returns an empty list.
+
+    return tokenizer.normalize_counts(raw_counts)
+
+
+# Parallel Mode
+#
+# build_histogram_parallel splits the file into byte ranges that begin
+# and end on line boundaries, so no word is split between two ranges.
+# Each range is counted by _count_range in a separate process, and the
+# partial histograms are then merged pairwise (a tree reduction).
+
+def build_histogram_parallel(filename: str, workers: int = None,
+                             block_size: int = BLOCK_SIZE,
+                             tokenizer: Tokenizer = DEFAULT_TOKENIZER
+                             ) -> dict[str, int]:
+    """Return the same histogram as build_histogram(filename, tokenizer),
+    counting the words in the file with the specified number of worker
+    processes. The tokenizer's stages must be picklable.
+
+    If workers is None, one worker per CPU is used.
+
+    Raises ValueError if workers <= 0 or block_size <= 0.
+
+    >>> hist = build_histogram_parallel('sons_of_martha.txt', workers=4)
+    >>> hist == build_histogram('sons_of_martha.txt')
+    True
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 0:
+        raise ValueError('build_histogram_parallel: workers must be > 0')
+    if block_size <= 0:
+        raise ValueError('build_histogram_parallel: block_size must be > 0')
+
+    ranges = _line_aligned_ranges(filename, workers)
+    if len(ranges) <= 1:
+        # Not worth starting any processes.
+        return _count_range(filename, 0, None, block_size, tokenizer)
+
+    with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+        futures = [executor.submit(_count_range, filename, start, end,
+                                   block_size, tokenizer)
+                   for start, end in ranges]
+        hists = [future.result() for future in futures]
+
+    # Merge the partial histograms in pairs until only one is left.
+    while len(hists) > 1:
+        merged = []
+        for i in range(0, len(hists) - 1, 2):
+            merged.append(_merge_histograms(hists[i], hists[i + 1]))
+        if len(hists) % 2 == 1:
+            merged.append(hists[-1])
+        hists = merged
+
+    return hists[0]
+
+
+def _line_aligned_ranges(filename: str, n: int) -> list[tuple[int, int]]:
+    """Return a list of at most n (start, end) byte ranges that together
+    cover the file. Every range except the first begins immediately after
+    a newline.
+    """
+    size = os.path.getsize(filename)
+    boundaries = [0]
+    with open(filename, 'rb') as infile:
+        for i in range(1, n):
+            pos = size * i // n
+            if pos <= boundaries[-1]:
+                continue
+            infile.seek(pos)
+            infile.readline()  # skip to the start of the next line
+            pos = infile.tell()
+            if pos >= size:
+                break
+            if pos > boundaries[-1]:
+                boundaries.append(pos)
+    boundaries.append(size)
+
+    ranges = []
+    for i in range(len(boundaries) - 1):
+        if boundaries[i] < boundaries[i + 1]:
+            ranges.append((boundaries[i], boundaries[i + 1]))
+    return ranges
+
+
+def _merge_histograms(hist1: dict[str, int],
+                      hist2: dict[str, int]) -> dict[str, int]:
+    """Add the counts in the smaller histogram to the larger one, and
+    return the larger one.
+    """
+    if len(hist1) < len(hist2):
+        hist1, hist2 = hist2, hist1
+    for word, count in hist2.items():
+        hist1[word] = hist1.get(word, 0) + count
+    return hist1
+
+
+def _count_range(filename: str, start: int, end: int, block_size: int,
+                 tokenizer: Tokenizer) -> dict[str, int]:
+    """Return the histogram of the words stored in bytes start .. end - 1
+    of the file. If end is None, count the words up to the end of the file.
+    """
+    with open_mapped(filename) as buf:
+        raw_counts = count_raw_tokens(buf, start, end, block_size,
+                                      tokenizer.folds_raw_case)
+    return tokenizer.normalize_counts(raw_counts)
+
+
+# Array Mode
+#
+# build_histogram_arrays gives each distinct raw token an integer ID the
+# first time it is seen. Each block's raw tokens are converted to a NumPy
+# array of IDs, and the arrays are buffered until they hold ID_BUFFER_SIZE
+# IDs. Then they are counted by a single call of np.bincount, in C, and the
+# counts are added to a running array of totals that grows with the
+# vocabulary. (Counting each block separately would cost time proportional
+# to the vocabulary size per block, and counting all the IDs at the end
+# would keep one ID per token in memory.) The raw token counts are then
+# passed to the tokenizer's normalize_counts, like those of build_histogram.
+
+# The number of buffered raw token IDs (4 bytes each) that are counted at
+# once by build_histogram_arrays.
+ID_BUFFER_SIZE = 1 << 20
+
+
+def build_histogram_arrays(filename: str,
+                           tokenizer: Tokenizer = DEFAULT_TOKENIZER,
+                           block_size: int = BLOCK_SIZE) -> tuple:
+    """Return the histogram of the words in the text file with the
+    specified filename as a (vocab, counts) pair, where vocab is a list of
+    the distinct words and counts is a NumPy array of int64; counts[i] is
+    the number of occurrences of vocab[i].
+
+    most_frequent_word and words_with_frequency accept the pair in place
+    of a dictionary.
+
+    Raises ImportError if NumPy isn't installed, and ValueError if
+    block_size <= 0.
+
+    >>> vocab, counts = build_histogram_arrays('sons_of_martha.txt')
+    >>> most_frequent_word((vocab, counts))
+    """
+    if np is None:
+        raise ImportError('build_histogram_arrays: NumPy is not installed')
+    if block_size <= 0:
+        raise ValueError('build_histogram_arrays: block_size must be > 0')
+
+    raw_ids = _Vocabulary()
+    raw_counts = np.zeros(0, dtype=np.int64)
+    block_ids = []
+    buffered = 0
+    with open_mapped(filename) as buf:
+        for block in iter_blocks(buf, block_size=block_size):
+            if tokenizer.folds_raw_case:
+                block = block.lower()
+            tokens = block.split()
+            block_ids.append(np.fromiter(map(raw_ids.__getitem__, tokens),
+                                         dtype=np.int32, count=len(tokens)))
+            buffered += len(tokens)
+            if buffered >= ID_BUFFER_SIZE:
+                raw_counts = _add_id_counts(raw_counts, block_ids,
+                                            len(raw_ids))
+                block_ids = []
+                buffered = 0
+    raw_counts = _add_id_counts(raw_counts, block_ids, len(raw_ids))
+
+    # A raw token can produce several words, and several raw tokens can
+    # produce the same word.
+    hist = tokenizer.normalize_counts(dict(zip(raw_ids, raw_counts.tolist())))
+    counts = np.fromiter(hist.values(), dtype=np.int64, count=len(hist))
+    return list(hist), counts
+
+
+def _add_id_counts(totals: 'np.ndarray', block_ids: list,
+                   vocab_size: int) -> 'np.ndarray':
+    """Return totals, extended to vocab_size elements, with the number of
+    occurrences of each ID in the arrays in block_ids added to it.
+    """
+    totals = np.pad(totals, (0, vocab_size - len(totals)))
+    if block_ids:
+        totals += np.bincount(np.concatenate(block_ids), minlength=vocab_size)
+    return totals
+
+
+class _Vocabulary(dict):
+    """A dictionary that gives each new key the next integer ID (0, 1, 2,
+    ...) when it is looked up.
+    """
+
+    def __missing__(self, key) -> int:
+        self[key] = n = len(self)
+        return n
+
+
+# Multi-file Mode
+#
+# build_histogram_many counts the words in many (typically small) files.
+# Opening, reading and closing a file mostly waits for the operating
+# system, so up to concurrency files are read at the same time by a pool
+# of threads. Each file's bytes are handed back to the event loop, which
+# splits them into raw tokens while the threads are reading the next
+# files. The raw tokens of all the files are counted together, so each
+# distinct raw token is tokenized once for the whole corpus.
+
+def build_histogram_many(paths, concurrency: int = 8,
+                         tokenizer: Tokenizer = DEFAULT_TOKENIZER,
+                         progress=None) -> dict[str, int]:
+    """Return the histogram of the words in all the text files named by
+    paths, an iterable of filenames. The result is the same as merging
+    build_histogram(path, tokenizer) for every path.
+
+    At most concurrency files are read at the same time. If progress is
+    not None, progress(path, done, total) is called after each file has
+    been counted, where done is the number of files counted so far and
+    total is the number of files.
+
+    This function runs an event loop, so it can't be called from a
+    coroutine; use build_histogram_many_async instead.
+
+    Raises ValueError if concurrency <= 0.
+
+    >>> paths = ['sons_of_martha.txt', 'two_cities.txt']
+    >>> hist = build_histogram_many(paths, progress=print)
+    """
+    return asyncio.run(build_histogram_many_async(paths, concurrency,
+                                                  tokenizer, progress))
+
+
+async def build_histogram_many_async(paths, concurrency: int = 8,
+                                     tokenizer: Tokenizer = DEFAULT_TOKENIZER,
+                                     progress=None) -> dict[str, int]:
+    """The coroutine version of build_histogram_many.
+
+    Raises ValueError if concurrency <= 0.
+    """
+    if concurrency <= 0:
+        raise ValueError('build_histogram_many: concurrency must be > 0')
+
+    paths = list(paths)
+    total = len(paths)
+    remaining = iter(paths)
+    raw_counts = Counter()
+    done = 0
+    loop = asyncio.get_running_loop()
+
+    async def count_files() -> None:
+        # The workers share one iterator, so each file is taken by exactly
+        # one of them. Each worker holds the contents of at most one file.
+        nonlocal done
+        for path in remaining:
+            data = await loop.run_in_executor(executor, _read_file, path)
+            if tokenizer.folds_raw_case:
+                data = data.lower()
+            raw_counts.update(data.split())
+            done += 1
+            if progress is not None:
+                progress(path, done, total)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        workers = [asyncio.create_task(count_files())
+                   for i in range(min(concurrency, total))]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            # A file couldn't be read; stop the other workers and raise
+            # the exception (e.g., FileNotFoundError).
+            for worker in workers:
+                worker.cancel()
+            raise
+
+    return tokenizer.normalize_counts(raw_counts)
+
+
+def _read_file(filename: str) -> bytes:
+    """Return the contents of the file."""
+    with open(filename, 'rb') as infile:
+        return infile.read()
 
 
 def most_frequent_word(hist: dict[str, int]) -> tuple[str, int]:
@@ -88,11 +368,22 @@ def most_frequent_word(hist: dict[str, int]) -> tuple[str, int]:
     specified histogram (a dictionary of word/occurrence count pairs),
     along with its frequency.
 
+    hist can also be a (vocab, counts) pair returned by
+    build_histogram_arrays.
+
     >>> hist = build_histogram('sons_of_martha.txt')
     >>> hist
     >>> len(hist)  # How many different words are in the file?
     >>> most_frequent_word(hist)  # Which word occurs most often?
     """
+    if isinstance(hist, tuple):
+        vocab, counts = hist
+        if np is not None and isinstance(counts, np.ndarray):
+            i = int(counts.argmax())
+        else:
+            i = max(range(len(counts)), key=counts.__getitem__)
+        return (vocab[i], int(counts[i]))
+
     frequency = -1
     for word in hist:
         if hist[word] > frequency:
@@ -106,10 +397,23 @@ def words_with_frequency(hist: dict[str, int], n: int) -> list[str]:
     """Returns a list of all words in histogram hist that occur with
     frequency n. The list is sorted in ascending order.
 
+    hist can also be a FrequencyIndex, in which case the list is found
+    without scanning the whole histogram, or a (vocab, counts) pair
+    returned by build_histogram_arrays.
+
     >>> hist = build_histogram('sons_of_martha.txt')
     >>> words_with_frequency(hist, 1)  # Which words occur once in the file?
     >>> words_with_frequency(hist, 5)  # Which words occur five times?
     """
+    if isinstance(hist, FrequencyIndex):
+        return hist.words_with_frequency(n)
+    if isinstance(hist, tuple):
+        vocab, counts = hist
+        if np is not None and isinstance(counts, np.ndarray):
+            return sorted([vocab[i] for i in np.flatnonzero(counts == n)])
+        return sorted([word for word, count in zip(vocab, counts)
+                       if count == n])
+
     # Write your code for Exercise 3 here.
     word_lst = []
     for word in hist:
@@ -119,6 +423,161 @@ def words_with_frequency(hist: dict[str, int], n: int) -> list[str]:
     return word_lst
 
 
+class FrequencyIndex:
+    """An inverted histogram: for each frequency, the sorted list of words
+    that occur with that frequency.
+
+    Once the index has been built, words_with_frequency and
+    words_in_range take time proportional to the number of words they
+    return, not to the number of words in the histogram.
+    """
+
+    def __init__(self, hist: dict[str, int] = {}) -> None:
+        """Initialize this FrequencyIndex from histogram hist.
+
+        >>> index = FrequencyIndex(build_histogram('sons_of_martha.txt'))
+        >>> index.words_with_frequency(5)  # Which words occur five times?
+        """
+        self._hist = dict(hist)  # word -> frequency
+        self._words = {}         # frequency -> sorted list of words
+        for word, count in self._hist.items():
+            if count not in self._words:
+                self._words[count] = []
+            self._words[count].append(word)
+        for words in self._words.values():
+            words.sort()
+
+        # The frequencies that have at least one word, in ascending order.
+        self._counts = sorted(self._words)
+
+    def __repr__(self) -> str:
+        """Return the canonical string representation of this
+        FrequencyIndex.
+        """
+        return "{0}({1})".format(self.__class__.__name__, self._hist)
+
+    def __len__(self) -> int:
+        """Return the number of distinct words in this FrequencyIndex."""
+        return len(self._hist)
+
+    def __getitem__(self, word: str) -> int:
+        """Return the frequency of word (0 if word isn't in the index)."""
+        return self._hist.get(word, 0)
+
+    def words_with_frequency(self, n: int) -> list[str]:
+        """Return a list of all words that occur with frequency n, sorted in
+        ascending order.
+        """
+        return list(self._words.get(n, []))
+
+    def words_in_range(self, low: int, high: int) -> list[str]:
+        """Return a list of all words that occur with a frequency between
+        low and high, inclusive, sorted in ascending order.
+        """
+        first = bisect.bisect_left(self._counts, low)
+        last = bisect.bisect_right(self._counts, high)
+        buckets = [self._words[count] for count in self._counts[first:last]]
+        if len(buckets) == 1:
+            return list(buckets[0])
+        return list(heapq.merge(*buckets))
+
+    def update(self, hist: dict[str, int]) -> None:
+        """Add the counts in histogram hist (e.g., the histogram of some
+        newly counted text) to this index.
+
+        A count can be negative (e.g., for text that has been removed). A
+        word whose frequency drops to 0 is removed from the index.
+
+        Only the words in hist are moved between frequencies, so the cost
+        depends on the size of hist, not the size of the index.
+
+        Raises ValueError, without changing the index, if a word's
+        frequency would drop below 0.
+        """
+        for word, count in hist.items():
+            if self._hist.get(word, 0) + count < 0:
+                raise ValueError('FrequencyIndex.update: frequency of {0!r} '
+                                 'would be negative'.format(word))
+
+        for word, count in hist.items():
+            if count == 0:
+                continue
+            old_count = self._hist.get(word, 0)
+            if old_count > 0:
+                self._discard(word, old_count)
+            new_count = old_count + count
+            if new_count == 0:
+                del self._hist[word]
+            else:
+                self._hist[word] = new_count
+                self._insert(word, new_count)
+
+    def _insert(self, word: str, count: int) -> None:
+        """Add word to the list of words with frequency count."""
+        words = self._words.get(count)
+        if words is None:
+            self._words[count] = [word]
+            bisect.insort(self._counts, count)
+        else:
+            bisect.insort(words, word)
+
+    def _discard(self, word: str, count: int) -> None:
+        """Remove word from the list of words with frequency count."""
+        words = self._words[count]
+        del words[bisect.bisect_left(words, word)]
+        if len(words) == 0:
+            del self._words[count]
+            del self._counts[bisect.bisect_left(self._counts, count)]
+
+
+def top_k_words(hist: dict[str, int], k: int) -> list[tuple[str, int]]:
+    """Return a list of (word, frequency) tuples for the k most frequently
+    occurring words in histogram hist, arranged in descending order of
+    frequency. Words with the same frequency are arranged in ascending order.
+
+    Only a heap of k words is kept, so for a histogram with n words the
+    running time is O(n log k) instead of the O(n log n) needed to sort
+    the whole histogram.
+
+    >>> hist = build_histogram('sons_of_martha.txt')
+    >>> top_k_words(hist, 3)  # Which three words occur most often?
+    """
+    return top_k_items(hist, k)
+
+
+def top_k_words_streaming(filename: str, k: int, capacity: int = None,
+                          block_size: int = BLOCK_SIZE,
+                          tokenizer: Tokenizer = DEFAULT_TOKENIZER
+                          ) -> list[tuple[str, int]]:
+    """Return an approximation of
+    top_k_words(build_histogram(filename, tokenizer), k), without building
+    the histogram of the whole file.
+
+    The words are counted with a SpaceSaving sketch that monitors at most
+    capacity words (by default, 10 * k), so memory use doesn't depend on
+    the size of the vocabulary. The returned frequencies can overestimate
+    the true frequencies, but every word that accounts for more than
+    1 / capacity of all the words in the file is found. If the file has
+    at most capacity distinct words, the result is exact.
+
+    Raises ValueError if capacity <= 0.
+
+    >>> top_k_words_streaming('sons_of_martha.txt', 3)
+    """
+    if capacity is None:
+        capacity = max(1, 10 * k)
+    sketch = SpaceSaving(capacity)
+    with open_mapped(filename) as buf:
+        for block in iter_blocks(buf, block_size=block_size):
+            # Count the words in each block exactly, then add the block's
+            # (much smaller) histogram to the sketch.
+            if tokenizer.folds_raw_case:
+                block = block.lower()
+            raw_counts = Counter(block.split())
+            sketch.update(tokenizer.normalize_counts(raw_counts))
+    return sketch.top(k)
+
+
 if __name__ == '__main__':
     # Build and display a histogram of the distinct words in a file
     filename = 'sons_of_martha.txt'
@@ -2,8 +2,23 @@
 
 # An implementation of ADT Bag that uses an instance of Python's built-in
 # list type as the underlying data structure.
+#
+# Alongside the list, the bag keeps a Counter (a dictionary) that maps each
+# distinct item to its multiplicity, so count and the in operator take O(1)
+# time instead of scanning the list, and remove only scans the list once,
+# after it knows the item is there. If an item that can't be hashed (e.g.,
+# a list) is added, the Counter is discarded and these methods go back to
+# scanning the list.
+#
+# An indexed bag (ListBag(..., indexed=True)) also keeps a dictionary that
+# maps each distinct item to the set of indices of the list elements that
+# hold it. The order of the items doesn't matter, so remove then takes O(1)
+# time: it replaces one of the item's elements with the last element. The
+# index takes several times the memory of the list, so it isn't kept
+# unless it's asked for.
 
 import random
+from collections import Counter
 
 __author__ = 'James Gohl'
 __student_number__ = '101299043'
@@ -11,13 +26,16 @@ __student_number__ = '101299043'
 
 class ListBag:
 
-    def __init__(self, iterable=[]) -> None:
+    def __init__(self, iterable=[], indexed: bool = False) -> None:
         """Initialize this ListBag.
 
         If no iterable is provided, the new ListBag is empty.
         Otherwise, initialize the ListBag by adding the values
         provided by the iterable.
 
+        If indexed is True, the bag keeps an index of the positions of each
+        item in the list, so remove takes O(1) time instead of O(n).
+
         >>> bag = ListBag()
         >>> bag
         ListBag([])
@@ -25,10 +43,16 @@ class ListBag:
         >>> bag
         ListBag([1, 4, 3, 6, 3])
         """
-        self._elems = []
-        for item in iterable:
-            self._elems.append(item)
-            # or, self.add(item)
+        self._elems = list(iterable)
+        self._slots = {} if indexed else None  # item -> set of indices
+        try:
+            self._counts = Counter(self._elems)
+            if self._slots is not None:
+                for index, item in enumerate(self._elems):
+                    self._slots.setdefault(item, set()).add(index)
+        except TypeError:
+            self._counts = None  # some items aren't hashable
+            self._slots = None
 
     def __str__(self) -> str:
         """Return a string representation of this ListBag.
@@ -80,6 +104,13 @@ class ListBag:
         """
         return len(self._elems)
 
+    @property
+    def indexed(self) -> bool:
+        """True if this ListBag keeps an index of the positions of each
+        item.
+        """
+        return self._slots is not None
+
     def __iter__(self) -> 'list_iterator':
         """Return an iterator for this ListBag.
 
@@ -105,7 +136,12 @@ class ListBag:
         >>> 7 in bag
         False
         """
-        return item in self._elems
+        if self._counts is None:
+            return item in self._elems
+        try:
+            return item in self._counts
+        except TypeError:
+            return False  # an unhashable item can't be in the Counter
 
     def add(self, item: any) -> None:
         """Add item to this ListBag.
@@ -118,6 +154,15 @@ class ListBag:
         '{1, 4, 3, 6, 3}'
         """
         self._elems.append(item)
+        if self._counts is not None:
+            try:
+                self._counts[item] += 1
+            except TypeError:
+                self._counts = None
+                self._slots = None
+                return
+            if self._slots is not None:
+                self._slots.setdefault(item, set()).add(len(self._elems) - 1)
 
     def count(self, item: any) -> int:
         """Return the total number of occurrences of item in this bag.
@@ -128,7 +173,12 @@ class ListBag:
         >>> bag.count(7)
         0
         """
-        return self._elems.count(item)
+        if self._counts is None:
+            return self._elems.count(item)
+        try:
+            return self._counts[item]
+        except TypeError:
+            return 0
 
     def remove(self, item: any) -> any:
         """Remove and return one instance of item from this ListBag.
@@ -155,7 +205,12 @@ class ListBag:
         if len(self) == 0:
             raise ValueError("bag.remove(x): remove from empty bag.")
         elif item in self:
-            self._elems.remove(item)
+            if self._slots is not None:
+                # Any element that holds item will do.
+                self._swap_remove(next(iter(self._slots[item])))
+            else:
+                self._elems.remove(item)
+                self._discard_counts([item])
         else:
             raise ValueError("bag.remove(x): x not in bag")
         return item
@@ -180,7 +235,78 @@ class ListBag:
         if len(self) == 0:
             raise ValueError("bag.grab(): grab from empty bag")
         index = random.randint(0, len(self) - 1)
-        return self.remove(self._elems[index])
+
+        # The order of the items doesn't matter, so instead of removing the
+        # item and shifting the items that follow it, replace it with the
+        # last item, which is removed in O(1) time.
+        return self._swap_remove(index)
+
+    def grab_many(self, k: int) -> list:
+        """Remove and return a list of k randomly selected items from this
+        bag (without replacement), in random order.
+
+        Raises ValueError if k < 0 or k > len(self).
+
+        >>> bag = ListBag([3, 1, 2, 3, 4])
+        >>> bag.grab_many(2)
+        # The two items are selected at random; e.g., [2, 3]
+        >>> len(bag)
+        3
+        """
+        n = len(self._elems)
+        if not 0 <= k <= n:
+            raise ValueError("bag.grab_many(k): k must be between 0 and "
+                             "len(bag)")
+
+        if self._slots is not None:
+            # Each item is removed in O(1) time, keeping the index up to
+            # date, so the remaining items are in positions 0 .. i - 1.
+            return [self._swap_remove(random.randint(0, i - 1))
+                    for i in range(n, n - k, -1)]
+
+        # Shuffle k random items into the last k positions (a partial
+        # Fisher-Yates shuffle), then remove them all at once.
+        elems = self._elems
+        for i in range(n - 1, n - k - 1, -1):
+            j = random.randint(0, i)
+            elems[i], elems[j] = elems[j], elems[i]
+        items = elems[n - k:]
+        del elems[n - k:]
+        self._discard_counts(items)
+        return items
+
+    def _swap_remove(self, index: int) -> any:
+        """Remove and return the item at index, in O(1) time, by moving the
+        last item into its position.
+        """
+        elems = self._elems
+        last = len(elems) - 1
+        item = elems[index]
+        if self._slots is not None:
+            slots = self._slots[item]
+            slots.discard(index)
+            if len(slots) == 0:
+                del self._slots[item]
+            if index != last:
+                moved = self._slots[elems[last]]
+                moved.discard(last)
+                moved.add(index)
+        elems[index] = elems[last]
+        elems.pop()
+        self._discard_counts([item])
+        return item
+
+    def _discard_counts(self, items: list) -> None:
+        """Update the multiplicities after items have been removed from
+        the list.
+        """
+        if self._counts is None:
+            return
+        counts = self._counts
+        for item in items:
+            counts[item] -= 1
+            if counts[item] == 0:
+                del counts[item]
 
     def __add__(self, other: 'ListBag') -> 'ListBag':
         """Return a new ListBag containing the concatenation of self and other.
@@ -198,7 +324,7 @@ class ListBag:
         """
         if not isinstance(other, ListBag):
             raise TypeError("can only cancatenate ListBag to ListBag")
-        return ListBag(self._elems + other._elems)
+        return ListBag(self._elems + other._elems, self.indexed)
 
     def __eq__(self, other: 'ListBag') -> bool:
         """Return True if self is equal to the ListBag referred to by other;
@@ -217,5 +343,85 @@ class ListBag:
         if not isinstance(other, ListBag):
             return False
 
-        if self._elems == other._elems:
-            return True
+        # Two bags are equal if every item occurs the same number of times
+        # in both, in any order.
+        if len(self) != len(other):
+            return False
+        if self._counts is not None and other._counts is not None:
+            return self._counts == other._counts
+        matched, unmatched = self._match(other)
+        return len(unmatched) == 0
+
+    def __or__(self, other: 'ListBag') -> 'ListBag':
+        """Return a new ListBag containing the union of self and other: each
+        item occurs as many times as it occurs in whichever bag has more
+        of it.
+
+        Raises TypeError if other is not a ListBag.
+
+        >>> ListBag([1, 1, 2, 3]) | ListBag([1, 2, 2, 4])
+        ListBag([1, 1, 2, 3, 2, 4])
+        """
+        if not isinstance(other, ListBag):
+            raise TypeError("can only take the union of ListBag and ListBag")
+        matched, unmatched = other._match(self)
+        return ListBag(self._elems + unmatched, self.indexed)
+
+    def __and__(self, other: 'ListBag') -> 'ListBag':
+        """Return a new ListBag containing the intersection of self and
+        other: each item occurs as many times as it occurs in whichever bag
+        has less of it.
+
+        Raises TypeError if other is not a ListBag.
+
+        >>> ListBag([1, 1, 2, 3]) & ListBag([1, 2, 2, 4])
+        ListBag([1, 2])
+        """
+        if not isinstance(other, ListBag):
+            raise TypeError("can only intersect ListBag and ListBag")
+        matched, unmatched = self._match(other)
+        return ListBag(matched, self.indexed)
+
+    def __sub__(self, other: 'ListBag') -> 'ListBag':
+        """Return a new ListBag containing the items in self that are left
+        after removing one occurrence for each occurrence in other.
+
+        Raises TypeError if other is not a ListBag.
+
+        >>> ListBag([1, 1, 2, 3]) - ListBag([1, 2, 2, 4])
+        ListBag([1, 3])
+        """
+        if not isinstance(other, ListBag):
+            raise TypeError("can only subtract ListBag from ListBag")
+        matched, unmatched = self._match(other)
+        return ListBag(unmatched, self.indexed)
+
+    def _match(self, other: 'ListBag') -> tuple[list, list]:
+        """Pair each item in this bag with an equal item in other, if one
+        is left. Return a list of the items that were paired and a list of
+        those that weren't.
+
+        The multiplicities in other are used as a budget for each item, so
+        this takes O(n + m) time for bags of sizes n and m. If either bag
+        contains unhashable items, the items are found by scanning a copy of
+        other's list instead, which takes O(nm) time.
+        """
+        matched = []
+        unmatched = []
+        if self._counts is not None and other._counts is not None:
+            budget = other._counts.copy()
+            for item in self._elems:
+                if budget[item] > 0:
+                    budget[item] -= 1
+                    matched.append(item)
+                else:
+                    unmatched.append(item)
+        else:
+            remaining = list(other._elems)
+            for item in self._elems:
+                if item in remaining:
+                    remaining.remove(item)
+                    matched.append(item)
+                else:
+                    unmatched.append(item)
+        return matched, unmatched
@@ -1,5 +1,6 @@
 # SYSC 2100 Winter 2024 Lab 2: Unit tests for class ListBag.
 
+import random
 import unittest
 
 from lab2_listbag import ListBag
@@ -291,6 +292,38 @@ class GrabTestCase(unittest.TestCase):
         self.assertIn(bag.grab(), possible_values)
         self.assertIn(bag.grab(), possible_values)
 
+    def test_grab3(self):
+        """Grabbing every item returns each item once."""
+        items = [1, 3, 4, 4, 7, 2, 3]
+        bag = ListBag(items)
+        grabbed = [bag.grab() for i in range(len(items))]
+        self.assertEqual(sorted(grabbed), sorted(items))
+        self.assertEqual(len(bag), 0)
+        with self.assertRaises(ValueError):
+            bag.grab()
+
+    def test_grab_many1(self):
+        """Test grab_many."""
+        items = list(range(50)) + [7, 7]
+        bag = ListBag(items)
+        first = bag.grab_many(10)
+        self.assertEqual(len(first), 10)
+        self.assertEqual(len(bag), 42)
+        self.assertEqual(bag.grab_many(0), [])
+        rest = bag.grab_many(42)
+        self.assertEqual(sorted(first + rest), sorted(items))
+        self.assertEqual(len(bag), 0)
+        self.assertFalse(7 in bag)
+
+    def test_grab_many2(self):
+        """Test an invalid number of items."""
+        bag = ListBag([1, 2, 3])
+        with self.assertRaises(ValueError):
+            bag.grab_many(4)
+        with self.assertRaises(ValueError):
+            bag.grab_many(-1)
+        self.assertEqual(len(bag), 3)
+
 
 class DunderAddTestCase(unittest.TestCase):
     """Test __add__ (Exercise 4)."""
@@ -345,6 +378,147 @@ class EqTestCase(unittest.TestCase):
         bag2 = [1, 2, 4]
         self.assertFalse(bag == bag2)
 
+    def test_eq4(self):
+        """Test bags with the same items in a different order."""
+        self.assertTrue(ListBag([1, 2, 3, 2]) == ListBag([2, 3, 2, 1]))
+        self.assertFalse(ListBag([1, 1, 2]) == ListBag([1, 2, 2]))
+        self.assertFalse(ListBag([1, 2]) == ListBag([1, 2, 2]))
+        self.assertIs(ListBag([1]) == ListBag([2]), False)
+
+    def test_eq5(self):
+        """Test bags containing unhashable items."""
+        self.assertTrue(ListBag([[1], 2, [1]]) == ListBag([[1], [1], 2]))
+        self.assertFalse(ListBag([[1], 2]) == ListBag([[1], [1]]))
+
+
+class AlgebraTestCase(unittest.TestCase):
+    """Test |, & and -."""
+
+    def setUp(self):
+        self.bag1 = ListBag([1, 1, 2, 3, 5])
+        self.bag2 = ListBag([1, 2, 2, 4, 5, 5])
+
+    def test_or1(self):
+        """Test union."""
+        self.assertEqual(sorted((self.bag1 | self.bag2)._elems),
+                         [1, 1, 2, 2, 3, 4, 5, 5])
+        self.assertEqual(self.bag1 | ListBag(), self.bag1)
+
+    def test_and1(self):
+        """Test intersection."""
+        self.assertEqual(sorted((self.bag1 & self.bag2)._elems), [1, 2, 5])
+        self.assertEqual(len(self.bag1 & ListBag()), 0)
+
+    def test_sub1(self):
+        """Test difference."""
+        self.assertEqual(sorted((self.bag1 - self.bag2)._elems), [1, 3])
+        self.assertEqual(sorted((self.bag2 - self.bag1)._elems), [2, 4, 5])
+        self.assertEqual((self.bag1 - self.bag2).count(1), 1)
+
+    def test_algebra1(self):
+        """The operands are not changed, and other types are rejected."""
+        result = self.bag1 | self.bag2
+        result.add(9)
+        self.assertEqual(sorted(self.bag1._elems), [1, 1, 2, 3, 5])
+        for op in ['__or__', '__and__', '__sub__']:
+            with self.assertRaises(TypeError):
+                getattr(self.bag1, op)([1, 2])
+
+    def test_algebra2(self):
+        """Test bags containing unhashable items."""
+        bag1 = ListBag([[1], [1], 2])
+        bag2 = ListBag([[1], 3])
+        self.assertEqual(bag1 | bag2, ListBag([[1], [1], 2, 3]))
+        self.assertEqual(bag1 & bag2, ListBag([[1]]))
+        self.assertEqual(bag1 - bag2, ListBag([[1], 2]))
+
+
+class CountsTestCase(unittest.TestCase):
+    """Test the multiplicities (a Counter) kept alongside the list."""
+
+    def test_counts1(self):
+        """The multiplicities follow add and remove."""
+        bag = ListBag([1, 4, 4, 1, 9])
+        bag.add(4)
+        bag.remove(1)
+        bag.remove(9)
+        self.assertEqual(dict(bag._counts), {1: 1, 4: 3})
+        self.assertEqual(bag.count(4), 3)
+        self.assertFalse(9 in bag)
+        self.assertEqual(sorted(bag._elems), [1, 4, 4, 4])
+        self.assertFalse(bag.indexed)
+        self.assertIsNone(bag._slots)
+
+    def test_counts2(self):
+        """Unhashable items are supported by scanning the list."""
+        for indexed in [False, True]:
+            bag = ListBag([1, 2], indexed)
+            self.assertFalse([1] in bag)
+            self.assertEqual(bag.count([1]), 0)
+            bag.add([1])
+            self.assertIsNone(bag._counts)
+            self.assertFalse(bag.indexed)
+            self.assertTrue([1] in bag)
+            self.assertEqual(bag.count([1]), 1)
+            self.assertEqual(bag.remove([1]), [1])
+            self.assertFalse([1] in bag)
+        self.assertEqual(ListBag([[1], [1]], True).count([1]), 2)
+
+
+class IndexedTestCase(unittest.TestCase):
+    """Test bags that keep an index of the positions of each item."""
+
+    # The tests in this class access the "private" attributes in the ListBag
+    # objects. This is done to verify that the index matches the list.
+
+    def assertIndexValid(self, bag: ListBag) -> None:
+        """Check that the index maps each item to exactly the positions
+        that hold it, and that the multiplicities match.
+        """
+        slots = {}
+        for index, item in enumerate(bag._elems):
+            slots.setdefault(item, set()).add(index)
+        self.assertEqual(bag._slots, slots)
+        self.assertEqual(dict(bag._counts),
+                         {item: len(s) for item, s in slots.items()})
+
+    def test_indexed1(self):
+        """Test count, in and remove with an indexed bag."""
+        bag = ListBag([1, 4, 4, 1, 9], indexed=True)
+        self.assertTrue(bag.indexed)
+        bag.add(4)
+        bag.remove(1)
+        bag.remove(9)
+        self.assertIndexValid(bag)
+        self.assertEqual(bag.count(4), 3)
+        self.assertFalse(9 in bag)
+        self.assertEqual(sorted(bag._elems), [1, 4, 4, 4])
+        self.assertEqual(repr(ListBag([3, 1], indexed=True)),
+                         'ListBag([3, 1])')
+
+    def test_indexed2(self):
+        """remove, grab and grab_many keep the index up to date."""
+        random.seed(2100)
+        bag = ListBag((random.randrange(10) for i in range(200)), True)
+        for i in range(50):
+            bag.remove(bag._elems[random.randrange(len(bag))])
+            bag.add(random.randrange(10))
+            bag.grab()
+            self.assertIndexValid(bag)
+        bag.grab_many(20)
+        self.assertIndexValid(bag)
+        self.assertEqual(len(bag), 130)
+
+    def test_indexed3(self):
+        """Bags made by +, |, & and - are indexed if self is."""
+        bag1 = ListBag([1, 1, 2, 3], indexed=True)
+        bag2 = ListBag([1, 2, 2, 4])
+        for bag in [bag1 + bag2, bag1 | bag2, bag1 & bag2, bag1 - bag2]:
+            self.assertTrue(bag.indexed)
+            self.assertIndexValid(bag)
+        self.assertFalse((bag2 + bag1).indexed)
+        self.assertEqual(bag1 & bag2, ListBag([1, 2]))
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
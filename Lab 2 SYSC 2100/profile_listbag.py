@@ -0,0 +1,99 @@
+# SYSC 2100 Winter 2024 - Lab 2
+#
+# Profile random sampling from a large ListBag: the original grab (which
+# removes the chosen value with list.remove, scanning and shifting the
+# list), removing the chosen value with ListBag.remove on an indexed bag
+# (which is O(1), like grab), the O(1) swap-with-last grab, and grab_many.
+#
+# Also profile the multiset operations |, & and - and ==, which count the
+# items, against intersecting two bags with nested scans.
+
+__author__ = 'James Gohl'
+__student_number__ = '101299043'
+
+import random
+from time import perf_counter
+
+from lab2_listbag import ListBag
+
+SIZES = [10 ** 5, 10 ** 6, 4 * 10 ** 6]
+GRABS = 1000
+
+ALGEBRA_SIZES = [10 ** 4, 10 ** 5, 10 ** 6]
+NESTED_SIZES = [10 ** 4, 3 * 10 ** 4]  # nested scans take O(nm) time
+REMOVE_GRABS = 100  # the original grab takes O(n) time
+
+
+def list_remove_grab(elems: list) -> any:
+    """The original implementation of grab, on the bag's list."""
+    item = elems[random.randint(0, len(elems) - 1)]
+    elems.remove(item)
+    return item
+
+
+def remove_grab(bag: ListBag) -> any:
+    """Remove a randomly selected value with ListBag.remove."""
+    index = random.randint(0, len(bag) - 1)
+    return bag.remove(bag._elems[index])
+
+
+def nested_intersection(bag1: ListBag, bag2: ListBag) -> ListBag:
+    """Intersect two bags by searching a copy of the second bag's list for
+    each item in the first bag.
+    """
+    remaining = list(bag2)
+    result = ListBag()
+    for item in bag1:
+        if item in remaining:
+            remaining.remove(item)
+            result.add(item)
+    return result
+
+
+def timed(function, *args) -> float:
+    """Return the time taken by function(*args), in seconds."""
+    start_time = perf_counter()
+    function(*args)
+    return perf_counter() - start_time
+
+
+def per_grab(function, bag: ListBag, n: int) -> float:
+    """Return the average time of n calls of function(bag), in
+    microseconds.
+    """
+    start_time = perf_counter()
+    for i in range(n):
+        function(bag)
+    return (perf_counter() - start_time) / n * 1e6
+
+
+# You are permitted to change this script.
+if __name__ == '__main__':
+    random.seed(2100)
+    print("Profiling grabs from a ListBag (microseconds per item)")
+    for n in SIZES:
+        bag = ListBag((random.randrange(n) for i in range(n)), indexed=True)
+        list_time = per_grab(list_remove_grab, list(bag), REMOVE_GRABS)
+        remove_time = per_grab(remove_grab, bag, GRABS)
+        grab_time = per_grab(ListBag.grab, bag, GRABS)
+        start_time = perf_counter()
+        bag.grab_many(GRABS)
+        many_time = (perf_counter() - start_time) / GRABS * 1e6
+        print(f"\t{n:8} items  list.remove: {list_time:9.3f}  "
+              f"remove: {remove_time:6.3f}  grab: {grab_time:6.3f}  "
+              f"grab_many: {many_time:6.3f}")
+
+    print("Profiling multiset operations on two bags of n items (seconds)")
+    for n in ALGEBRA_SIZES:
+        bag1 = ListBag(random.randrange(n) for i in range(n))
+        bag2 = ListBag(random.randrange(n) for i in range(n))
+        times = [timed(op, bag1, bag2) for op in
+                 [ListBag.__or__, ListBag.__and__, ListBag.__sub__,
+                  ListBag.__eq__]]
+        print(f"\t{n:8} items  |: {times[0]:6.3f}  &: {times[1]:6.3f}  "
+              f"-: {times[2]:6.3f}  ==: {times[3]:6.3f}")
+    for n in NESTED_SIZES:
+        bag1 = ListBag(random.randrange(n) for i in range(n))
+        bag2 = ListBag(random.randrange(n) for i in range(n))
+        print(f"\t{n:8} items  & by nested scans: "
+              f"{timed(nested_intersection, bag1, bag2):6.3f}")
@@ -0,0 +1,53 @@
+# SYSC 2100 Winter 2024
+#
+# Allocation of the ctypes arrays used as backing arrays by ArrayBag (Lab 3),
+# ArrayList (Lab 4) and BoundedPriorityQueue (Lab 5). The same module is
+# kept in each of those lab folders, so each lab can still be run on its
+# own; each lab has its own copy of the unit tests.
+#
+# A new ctypes array of py_object is zero-filled, and a slot that holds a
+# NULL pointer can't be read, so every slot is set to None before the
+# array is used. This is done with one slice assignment, which runs in C,
+# instead of a Python statement per slot.
+
+import ctypes
+
+__author__ = 'James Gohl'
+__student_number__ = '101299043'
+
+
+def new_array(capacity: int) -> 'py_object_Array_<capacity>':
+    """Return a new array with the specified capacity that stores
+    references to Python objects. All elements are initialized to None.
+
+    Raises ValueError if capacity <= 0.
+
+    >>> arr = new_array(10)
+    >>> len(arr)
+    10
+    >>> arr[9] is None
+    True
+    """
+    if capacity <= 0:
+        raise ValueError('new_array: capacity must be > 0')
+
+    PyCArrayType = ctypes.py_object * capacity
+    a = PyCArrayType()
+    a[0:capacity] = [None] * capacity
+    return a
+
+
+def new_array_from(items) -> 'py_object_Array_<capacity>':
+    """Return a new array that stores references to the objects in items, a
+    non-empty sequence. The capacity of the array is len(items).
+
+    >>> arr = new_array_from([2, 4, 6])
+    >>> len(arr)
+    3
+    >>> arr[2]
+    6
+    """
+    PyCArrayType = ctypes.py_object * len(items)
+    a = PyCArrayType()
+    a[0:len(items)] = items  # a single slice assignment, done in C
+    return a
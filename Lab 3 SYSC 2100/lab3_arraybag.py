@@ -2,9 +2,28 @@
 
 # An implementation of ADT Bag that uses a fixed-capacity array as the
 # underlying data structure.
-
-import ctypes
+#
+# By default, the backing array stores references to Python objects. If a
+# typecode is specified (e.g., ArrayBag(typecode='q') for 64-bit signed
+# ints), the backing array is an array.array that stores the values
+# themselves, unboxed, and count, in and == are done by array.array's
+# methods, which are implemented in C. The unused slots of a typed backing
+# array always hold 0, so the methods that search the whole array can
+# allow for them.
+#
+# An ArrayBag can also keep an index (ArrayBag(indexed=True)): a dictionary
+# that maps each distinct item to the set of slots in the backing array
+# that hold it. The items must then be hashable. With the index, count and
+# in take O(1) time, and remove finds a slot holding the item in O(1) time
+# and fills it with the last item, instead of shifting the items that
+# follow it.
+
+import array
 import random
+from collections import Counter
+
+from allocator import new_array as _new_array
+from allocator import new_array_from as _new_array_from
 
 __author__ = 'James Gohl'
 __student_number__ = '101299043'
@@ -45,32 +64,79 @@ class ArrayBag:
             """Return the iterator object itself."""
             return self
 
-    def __init__(self, iterable=[]) -> None:
+    def __init__(self, iterable=[], typecode: str = None,
+                 indexed: bool = False) -> None:
         """Initialize this ArrayBag.
 
         If no iterable is provided, the new ArrayBag is empty.
         Otherwise, initialize the ArrayBag by adding the values
         provided by the iterable.
 
+        If typecode is provided, the items are stored in an array.array with
+        that typecode (see the array module), so they must all be numbers
+        of that type.
+
+        If indexed is True, the bag keeps an index of the slots that hold
+        each item, so the items must be hashable.
+
+        Raises ValueError if typecode is not a valid array.array typecode.
+
         >>> bag = ArrayBag()
         >>> bag
         ArrayBag([])
         >>> bag = ArrayBag([1, 4, 3, 6, 3])
         >>> bag
         ArrayBag([1, 4, 3, 6, 3])
+        >>> bag = ArrayBag([1, 4, 3], typecode='q')
+        >>> bag
+        ArrayBag([1, 4, 3], typecode='q')
         """
+        self._typecode = typecode
         self._num_items = 0  # of elements stored in the ArrayBag
-        self._elems = _new_array(1)  # backing array
+        self._elems = self._allocate(1)  # backing array
+
+        # The value stored in the unused slots of the backing array.
+        self._empty = self._elems[0]
+
+        # item -> set of the slots that hold it, or None if not indexed.
+        self._slots = {} if indexed else None
 
         # Note: len(self._elems) is the capacity of the backing array,
         # and not the number of items in the ArrayBag.
         # The capacity of the backing array is always >= the number of items
         # in the ArrayBag.
 
-        for elem in iterable:
-            self.add(elem)
-            # add() updates self._num_items and increases the capacity of
-            # the backing array, as required.
+        if isinstance(iterable, ArrayBag):
+            # Copy the other bag's items with one slice.
+            items = iterable._elems[0:iterable._num_items]
+        elif self._typecode is not None:
+            # array.array reads the items from the iterable itself, so they
+            # aren't collected in a list first.
+            items = array.array(self._typecode, iterable)
+        elif hasattr(iterable, '__len__'):
+            items = list(iterable)
+        else:
+            # The number of items isn't known in advance.
+            for elem in iterable:
+                self.add(elem)
+                # add() updates self._num_items and increases the capacity of
+                # the backing array, as required.
+            return
+
+        # Allocate a backing array with exactly the required capacity, and
+        # copy all the items into it at once, instead of calling add (and
+        # resizing the array about log2(n) times).
+        if len(items) > 0:
+            if (isinstance(items, array.array)
+                    and items.typecode == self._typecode):
+                # items is already a new array of the right type.
+                self._elems = items
+            else:
+                self._elems = self._allocate_from(items)
+            self._num_items = len(items)
+            if self._slots is not None:
+                for i, item in enumerate(items):
+                    self._slots.setdefault(item, set()).add(i)
 
     def __str__(self) -> str:
         """Return a string representation of this ArrayBag.
@@ -106,9 +172,27 @@ class ArrayBag:
         # For a ArrayBag object, obj, the expression eval(repr(obj))
         # returns a new ArrayBag that is equal to obj.
 
+        if self._typecode is not None:
+            return "{0}([{1}], typecode={2!r})".format(
+                self.__class__.__name__, ", ".join([repr(x) for x in self]),
+                self._typecode)
         return "{0}([{1}])".format(self.__class__.__name__,
                                    ", ".join([repr(x) for x in self]))
 
+    @property
+    def indexed(self) -> bool:
+        """True if this ArrayBag keeps an index of the slots that hold each
+        item.
+        """
+        return self._slots is not None
+
+    @property
+    def typecode(self) -> str:
+        """The typecode of the array.array that stores the items, or None
+        if the items are stored as references to Python objects.
+        """
+        return self._typecode
+
     def __len__(self) -> int:
         """Return the number of items in this ArrayBag.
 
@@ -146,6 +230,19 @@ class ArrayBag:
         >>> 7 in bag
         False
         """
+        if self._slots is not None:
+            try:
+                return item in self._slots
+            except TypeError:
+                return False  # an unhashable item can't be in the index
+
+        if self._typecode is not None:
+            try:
+                self._elems.index(item, 0, self._num_items)
+            except (ValueError, TypeError):
+                return False
+            return True
+
         for i in range(len(self)):
             if self._elems[i] == item:
                 return True
@@ -167,6 +264,14 @@ class ArrayBag:
             self._resize()
 
         self._elems[self._num_items] = item
+        if self._slots is not None:
+            try:
+                self._slots.setdefault(item, set()).add(self._num_items)
+            except TypeError:
+                # An unhashable item can't be indexed; leave the bag as it
+                # was.
+                self._elems[self._num_items] = self._empty
+                raise
         self._num_items += 1
 
     def count(self, item: any) -> int:
@@ -178,6 +283,19 @@ class ArrayBag:
         >>> bag.count(7)
         0
         """
+        if self._slots is not None:
+            try:
+                return len(self._slots.get(item, ()))
+            except TypeError:
+                return 0
+
+        if self._typecode is not None:
+            count = self._elems.count(item)
+            if item == self._empty:
+                # Don't count the unused slots.
+                count -= len(self._elems) - self._num_items
+            return count
+
         it = iter(self)
         count = 0
         for i in range(self._num_items):
@@ -211,12 +329,22 @@ class ArrayBag:
             raise ValueError("bag.remove(x): remove from empty bag")
         if item not in self:
             raise ValueError("bag.remove(x): x not in bag")
+
+        if self._slots is not None:
+            # Any slot that holds item will do.
+            index = next(iter(self._slots[item]))
+            thing = self._swap_remove(index)
+            if len(self._elems) >= 3 * len(self):
+                self._resize()
+            return thing
+
         index = 0
         for thing in self:
             if thing == item:
                 self._elems[index:len(self) - 1]  \
                     = self._elems[index + 1:len(self)]
                 self._num_items -= 1
+                self._elems[self._num_items] = self._empty
                 if len(self._elems) >= 3 * len(self):
                     self._resize()
                 return thing
@@ -242,7 +370,37 @@ class ArrayBag:
         if len(self) == 0:
             raise ValueError("bag.grab(): grab from empty bag")
         index = random.randint(0, len(self) - 1)
-        return self.remove(self._elems[index])
+
+        item = self._swap_remove(index)
+        if len(self._elems) >= 3 * len(self):
+            self._resize()
+        return item
+
+    def grab_many(self, k: int) -> list:
+        """Remove and return a list of k randomly selected items from this
+        bag (without replacement), in random order.
+
+        Raises ValueError if k < 0 or k > len(self).
+
+        >>> bag = ArrayBag([3, 1, 2, 3, 4])
+        >>> bag.grab_many(2)
+        # The two items are selected at random; e.g., [2, 3]
+        >>> len(bag)
+        3
+        """
+        n = self._num_items
+        if not 0 <= k <= n:
+            raise ValueError("bag.grab_many(k): k must be between 0 and "
+                             "len(bag)")
+
+        # Each item is removed in O(1) time, and the backing array is only
+        # resized (at most once) at the end.
+        items = []
+        for i in range(n, n - k, -1):
+            items.append(self._swap_remove(random.randint(0, i - 1)))
+        if len(self._elems) >= 3 * len(self):
+            self._resize()
+        return items
 
     def __add__(self, other: 'ArrayBag') -> 'ArrayBag':
         """Return a new ArrayBag containing the concatenation of self and other.
@@ -260,7 +418,8 @@ class ArrayBag:
         """
         if not isinstance(other, ArrayBag):
             raise TypeError("can only cancatenate ArrayBag to ArrayBag")
-        new_bag = ArrayBag()
+        new_bag = ArrayBag(typecode=self._typecode,
+                           indexed=self._slots is not None)
         for item in self:
             new_bag.add(item)
         for item in other:
@@ -286,17 +445,61 @@ class ArrayBag:
 
         if self._num_items != other._num_items:
             return False
+
+        # The bags are equal if every item occurs the same number of times
+        # in both. Counting the items takes O(n) time.
+        if self._slots is not None and other._slots is not None:
+            return (len(self._slots) == len(other._slots) and
+                    all(len(slots) == len(other._slots.get(item, ()))
+                        for item, slots in self._slots.items()))
+        if self._typecode is not None and other._typecode is not None:
+            # The items are numbers, which sort in C without calling any
+            # Python code, so comparing the sorted items is faster than
+            # counting them in a dictionary of number objects.
+            return (sorted(self._elems[:self._num_items]) ==
+                    sorted(other._elems[:other._num_items]))
+        try:
+            return (Counter(self._elems[:self._num_items]) ==
+                    Counter(other._elems[:other._num_items]))
+        except TypeError:
+            pass
+
+        # Some items are unhashable, so pair each item in self with an
+        # equal item in other, in O(n ** 2) time.
+        remaining = list(other)
         for item in self:
-            if item not in other:
+            if item not in remaining:
                 return False
+            remaining.remove(item)
         return True
 
+    def _swap_remove(self, index: int) -> any:
+        """Remove and return the item at index, in O(1) time, by moving the
+        last item into its slot. The capacity is not changed.
+        """
+        elems = self._elems
+        last = self._num_items - 1
+        item = elems[index]
+        if self._slots is not None:
+            slots = self._slots[item]
+            slots.discard(index)
+            if len(slots) == 0:
+                del self._slots[item]
+            if index != last:
+                moved = self._slots[elems[last]]
+                moved.discard(last)
+                moved.add(index)
+        elems[index] = elems[last]
+        elems[last] = self._empty
+        self._num_items = last
+        return item
+
     def _resize(self) -> None:
         """Change this ArrayBag's capacity to 2 * n, where n is the number of
         elements in the bag. If the bag is empty, change its capacity to 1.
         """
         # Allocate a new array with the required capacity.
-        arr = _new_array(max(1, 2 * self._num_items))
+        arr = self._allocate(max(1, 2 * self._num_items))
 
         # Copy the _num_items elements in the current backing array to the
         # new array.
@@ -305,35 +508,25 @@ class ArrayBag:
         # Replace the current backing array.
         self._elems = arr
 
+    def _allocate(self, capacity: int
+                  ) -> 'py_object_Array_<capacity> | array.array':
+        """Return a new backing array with the specified capacity, in which
+        every element is empty (None, or 0 for a typed bag).
 
-def _new_array(capacity: int) -> 'py_object_Array_<capacity>':
-    """Return a new array with the specified capacity that stores
-    references to Python objects. All elements are initialized to None.
-
-    >>> arr = _new_array(10)
-    >>> len(arr)
-    10
-
-    >>> for i in range(10):
-    ...      a[i] = 2 * i
-    ...
-
-    >>> arr[0]
-    0
-    >>> arr[9]
-    18
-
-    >>> 4 in arr
-    True
-    >>> 3 in arr
-    False
-    """
-    if capacity <= 0:
-        raise ValueError('new_array: capacity must be > 0')
-
-    PyCArrayType = ctypes.py_object * capacity
-    a = PyCArrayType()
-    for i in range(len(a)):
-        a[i] = None
-
-    return a
+        Raises ValueError if capacity <= 0.
+        """
+        if self._typecode is None:
+            return _new_array(capacity)
+        if capacity <= 0:
+            raise ValueError('bag._allocate(capacity): capacity must be > 0')
+        itemsize = array.array(self._typecode).itemsize
+        return array.array(self._typecode, bytes(itemsize * capacity))
+
+    def _allocate_from(self, items
+                       ) -> 'py_object_Array_<capacity> | array.array':
+        """Return a new backing array that holds exactly the items in
+        items, a non-empty sequence.
+        """
+        if self._typecode is None:
+            return _new_array_from(items)
+        return array.array(self._typecode, items)
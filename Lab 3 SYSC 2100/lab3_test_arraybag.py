@@ -1,5 +1,7 @@
 # SYSC 2100 Winter 2024 Lab 3: Unit tests for class ArrayBag.
 
+import array
+import random
 import unittest
 
 from lab3_arraybag import ArrayBag
@@ -339,6 +341,38 @@ class GrabTestCase(unittest.TestCase):
         self.assertIn(bag.grab(), possible_values)
         self.assertIn(bag.grab(), possible_values)
 
+    def test_grab3(self):
+        """Grabbing every item returns each item once."""
+        items = [1, 3, 4, 4, 7, 2, 3]
+        bag = ArrayBag(items)
+        grabbed = [bag.grab() for i in range(len(items))]
+        self.assertEqual(sorted(grabbed), sorted(items))
+        self.assertEqual(len(bag), 0)
+        with self.assertRaises(ValueError):
+            bag.grab()
+
+    def test_grab_many1(self):
+        """Test grab_many."""
+        items = list(range(50)) + [7, 7]
+        bag = ArrayBag(items)
+        first = bag.grab_many(10)
+        self.assertEqual(len(first), 10)
+        self.assertEqual(len(bag), 42)
+        self.assertEqual(bag.grab_many(0), [])
+        rest = bag.grab_many(42)
+        self.assertEqual(sorted(first + rest), sorted(items))
+        self.assertEqual(len(bag), 0)
+        self.assertFalse(7 in bag)
+
+    def test_grab_many2(self):
+        """Test an invalid number of items."""
+        bag = ArrayBag([1, 2, 3])
+        with self.assertRaises(ValueError):
+            bag.grab_many(4)
+        with self.assertRaises(ValueError):
+            bag.grab_many(-1)
+        self.assertEqual(len(bag), 3)
+
 
 class DunderAddTestCase(unittest.TestCase):
     """Test __add__ (Exercise 4)."""
@@ -405,6 +439,203 @@ class EqTestCase(unittest.TestCase):
         bag2 = ArrayBag([1, 2, 3, 4])
         self.assertFalse(bag == bag2)
 
+    def test_eq6(self):
+        """Test checking 2 bags with the same items, repeated differently."""
+        self.assertFalse(ArrayBag([1, 1, 2]) == ArrayBag([1, 2, 2]))
+        self.assertTrue(ArrayBag([1, 2, 1]) == ArrayBag([1, 1, 2]))
+
+    def test_eq7(self):
+        """Test checking 2 bags of unhashable items."""
+        self.assertTrue(ArrayBag([[1], [2], [1]])
+                        == ArrayBag([[1], [1], [2]]))
+        self.assertFalse(ArrayBag([[1], [1], [2]])
+                         == ArrayBag([[1], [2], [2]]))
+
+
+class BulkInitTestCase(unittest.TestCase):
+    """Test __init__ with sized iterables."""
+
+    def test_bulk1(self):
+        """A sized iterable is copied into an array of exactly its size."""
+        for iterable in [[1, 4, 4, 1], (1, 4, 4, 1), range(1, 5),
+                         {1: 0, 4: 0}]:
+            bag = ArrayBag(iterable)
+            self.assertEqual(len(bag._elems), len(iterable))
+            self.assertEqual(sorted(bag), sorted(iterable))
+
+    def test_bulk2(self):
+        """Copy another ArrayBag, and a generator (size not known)."""
+        bag = ArrayBag([3, 1, 2])
+        bag.add(5)
+        copy = ArrayBag(bag)
+        self.assertEqual(len(copy._elems), 4)
+        self.assertEqual(copy, bag)
+        copy.add(6)
+        self.assertEqual(len(bag), 4)
+        self.assertEqual(sorted(ArrayBag(x for x in [3, 1, 2])), [1, 2, 3])
+
+    def test_bulk3(self):
+        """Copy into and from typed bags."""
+        bag = ArrayBag(range(5), typecode='q')
+        self.assertEqual(len(bag._elems), 5)
+        self.assertEqual(ArrayBag(bag, typecode='q').typecode, 'q')
+        self.assertEqual(sorted(ArrayBag(bag)), [0, 1, 2, 3, 4])
+        self.assertEqual(len(ArrayBag([], typecode='q')._elems), 1)
+
+
+class TypedTestCase(unittest.TestCase):
+    """Test ArrayBag with a typecode (items stored in an array.array)."""
+
+    def test_typed1(self):
+        """The items are stored unboxed, and repr shows the typecode."""
+        bag = ArrayBag([1, 4, 3], typecode='q')
+        self.assertIsInstance(bag._elems, array.array)
+        self.assertEqual(bag.typecode, 'q')
+        self.assertEqual(repr(bag), "ArrayBag([1, 4, 3], typecode='q')")
+        self.assertIsNone(ArrayBag().typecode)
+        with self.assertRaises(TypeError):
+            bag.add('a')
+        with self.assertRaises(ValueError):
+            ArrayBag(typecode='z')
+
+    def test_typed2(self):
+        """count and in ignore the unused slots of the backing array."""
+        bag = ArrayBag(typecode='q')
+        for x in [5, 0, 7, 0, 5]:
+            bag.add(x)
+        self.assertGreater(len(bag._elems), len(bag))
+        self.assertEqual(bag.count(0), 2)
+        self.assertEqual(bag.count(5), 2)
+        self.assertEqual(bag.count('a'), 0)
+        bag.remove(0)
+        bag.remove(0)
+        self.assertEqual(bag.count(0), 0)
+        self.assertFalse(0 in bag)
+        self.assertTrue(7 in bag)
+        self.assertFalse(8 in bag)
+        self.assertFalse('a' in bag)
+
+    def test_typed3(self):
+        """Test grab, grab_many, + and == with typed bags."""
+        bag = ArrayBag(range(20), typecode='d')
+        items = bag.grab_many(5) + [bag.grab()]
+        self.assertEqual(len(bag), 14)
+        self.assertEqual(bag.count(0.0) + items.count(0.0), 1)
+        self.assertEqual(sorted(list(bag) + items), list(range(20)))
+        self.assertEqual(ArrayBag([1, 2, 2], 'q'), ArrayBag([2, 1, 2], 'q'))
+        self.assertNotEqual(ArrayBag([1, 1, 2], 'q'),
+                            ArrayBag([1, 2, 2], 'q'))
+        self.assertEqual(ArrayBag([1, 2], 'q'), ArrayBag([2, 1]))
+        self.assertEqual((ArrayBag([1], 'q') + ArrayBag([2], 'q')).typecode,
+                         'q')
+
+    def test_typed4(self):
+        """== compares only the items, not the unused slots, and works
+        across typecodes."""
+        bag1 = ArrayBag(typecode='q')
+        for x in [3, 0, 3]:
+            bag1.add(x)
+        self.assertGreater(len(bag1._elems), len(bag1))
+        self.assertEqual(bag1, ArrayBag([0, 3, 3], 'q'))
+        self.assertNotEqual(bag1, ArrayBag([0, 0, 3], 'q'))
+        self.assertEqual(bag1, ArrayBag([3.0, 3.0, 0.0], 'd'))
+        self.assertNotEqual(ArrayBag([1, 2], 'q'), ArrayBag([1, 2.5], 'd'))
+
+    def test_typed5(self):
+        """A typed bag is built from any iterable, and copying a bag
+        doesn't share its backing array."""
+        bag1 = ArrayBag((x * x for x in range(5)), typecode='q')
+        self.assertEqual(len(bag1._elems), 5)
+        self.assertEqual(list(bag1), [0, 1, 4, 9, 16])
+        bag2 = ArrayBag(bag1, typecode='q')
+        bag2.remove(4)
+        self.assertEqual(list(bag1), [0, 1, 4, 9, 16])
+        self.assertEqual(len(ArrayBag(bag1, typecode='d')._elems), 5)
+        self.assertEqual(ArrayBag(bag1, typecode='d').typecode, 'd')
+        bag3 = ArrayBag(iter([]), typecode='q')
+        self.assertEqual(len(bag3), 0)
+        self.assertEqual(len(bag3._elems), 1)
+        with self.assertRaises(ValueError):
+            bag3._allocate(0)
+
+
+class IndexedTestCase(unittest.TestCase):
+    """Test bags that keep an index of the slots that hold each item."""
+
+    # The tests in this class access the "private" attributes in the ArrayBag
+    # objects. This is done to verify that the index matches the array.
+
+    def assertIndexValid(self, bag):
+        """Check that the index maps each item to exactly the slots that
+        hold it.
+        """
+        slots = {}
+        for i in range(len(bag)):
+            slots.setdefault(bag._elems[i], set()).add(i)
+        self.assertEqual(bag._slots, slots)
+
+    def test_indexed1(self):
+        """Test count, in and remove with an indexed bag."""
+        bag = ArrayBag([3, 1, 3, 2, 3], indexed=True)
+        self.assertTrue(bag.indexed)
+        self.assertFalse(ArrayBag().indexed)
+        self.assertIndexValid(bag)
+        self.assertEqual(bag.count(3), 3)
+        self.assertEqual(bag.count(4), 0)
+        self.assertEqual(bag.count([3]), 0)
+        self.assertTrue(2 in bag)
+        self.assertFalse(4 in bag)
+        self.assertFalse([3] in bag)
+        self.assertEqual(bag.remove(3), 3)
+        self.assertEqual(bag.count(3), 2)
+        self.assertIndexValid(bag)
+        with self.assertRaises(ValueError):
+            bag.remove(4)
+
+    def test_indexed2(self):
+        """The index stays valid after random adds, removes and grabs."""
+        rng = random.Random(2100)
+        bag = ArrayBag(indexed=True)
+        expected = []
+        for i in range(500):
+            op = rng.randrange(4)
+            if op < 2 or len(bag) == 0:
+                x = rng.randrange(10)
+                bag.add(x)
+                expected.append(x)
+            elif op == 2:
+                x = rng.choice(expected)
+                bag.remove(x)
+                expected.remove(x)
+            else:
+                for x in bag.grab_many(rng.randint(0, len(bag) // 2)):
+                    expected.remove(x)
+            self.assertIndexValid(bag)
+            self.assertEqual(sorted(bag), sorted(expected))
+        for i in range(len(bag)):
+            expected.remove(bag.grab())
+            self.assertIndexValid(bag)
+        self.assertEqual(expected, [])
+        self.assertEqual(bag._slots, {})
+
+    def test_indexed3(self):
+        """Test + and == with indexed bags."""
+        bag = ArrayBag([1, 2, 2], indexed=True)
+        bag2 = ArrayBag([2, 1, 2], typecode='q', indexed=True)
+        self.assertTrue(bag == bag2)
+        self.assertTrue(bag == ArrayBag([2, 2, 1]))
+        self.assertFalse(bag == ArrayBag([1, 1, 2], indexed=True))
+        new = bag + ArrayBag([4])
+        self.assertTrue(new.indexed)
+        self.assertIndexValid(new)
+        self.assertEqual(new.count(2), 2)
+        with self.assertRaises(TypeError):
+            ArrayBag([[1]], indexed=True)
+        with self.assertRaises(TypeError):
+            new.add([4])
+        self.assertEqual(len(new), 4)
+        self.assertIsNone(new._elems[4])
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -0,0 +1,112 @@
+# SYSC 2100 Winter 2024 - Lab 3
+#
+# Profile random sampling from a large ArrayBag: the original grab (which
+# removes the chosen value with remove, scanning and shifting the array),
+# the O(1) swap-with-last grab, and grab_many.
+#
+# Also profile constructing an ArrayBag from a list of n items (one
+# allocation and one slice copy) against adding the items one at a time,
+# and against Python's list(iterable).
+#
+# Also profile count, in and remove on an indexed ArrayBag against the
+# same operations on an ArrayBag that scans its array.
+
+__author__ = 'James Gohl'
+__student_number__ = '101299043'
+
+import random
+from time import perf_counter
+
+from lab3_arraybag import ArrayBag
+
+SIZES = [10 ** 5, 10 ** 6, 2 * 10 ** 6]
+GRABS = 1000
+REMOVE_GRABS = 3  # the original grab takes O(n) time
+INIT_SIZES = [10 ** 4, 10 ** 5, 10 ** 6]
+INDEX_SIZES = [10 ** 4, 10 ** 5, 10 ** 6]
+LOOKUPS = 20  # count, in and remove scan the unindexed bag
+
+
+def remove_grab(bag: ArrayBag) -> any:
+    """The original implementation of grab."""
+    index = random.randint(0, len(bag) - 1)
+    return bag.remove(bag._elems[index])
+
+
+def add_all(iterable) -> ArrayBag:
+    """Build an ArrayBag by adding the items one at a time (the original
+    implementation of __init__).
+    """
+    bag = ArrayBag()
+    for item in iterable:
+        bag.add(item)
+    return bag
+
+
+def throughput(function, iterable) -> float:
+    """Return the number of items per second that function(iterable)
+    copies, in millions.
+    """
+    start_time = perf_counter()
+    function(iterable)
+    return len(iterable) / (perf_counter() - start_time) / 1e6
+
+
+def per_grab(function, bag: ArrayBag, n: int) -> float:
+    """Return the average time of n calls of function(bag), in
+    microseconds.
+    """
+    start_time = perf_counter()
+    for i in range(n):
+        function(bag)
+    return (perf_counter() - start_time) / n * 1e6
+
+
+def per_lookup(bag: ArrayBag, items: list) -> tuple[float, float, float]:
+    """Return the average times of count(x), x in bag and remove(x) for
+    each x in items, in microseconds.
+    """
+    times = []
+    for operation in (bag.count, bag.__contains__, bag.remove):
+        start_time = perf_counter()
+        for x in items:
+            operation(x)
+        times.append((perf_counter() - start_time) / len(items) * 1e6)
+    return tuple(times)
+
+
+# You are permitted to change this script.
+if __name__ == '__main__':
+    random.seed(2100)
+    print("Profiling grabs from an ArrayBag (microseconds per item)")
+    for n in SIZES:
+        bag = ArrayBag(random.randrange(n) for i in range(n))
+        remove_time = per_grab(remove_grab, bag, REMOVE_GRABS)
+        grab_time = per_grab(ArrayBag.grab, bag, GRABS)
+        start_time = perf_counter()
+        bag.grab_many(GRABS)
+        many_time = (perf_counter() - start_time) / GRABS * 1e6
+        print(f"\t{n:8} items  remove: {remove_time:9.3f}  "
+              f"grab: {grab_time:6.3f}  grab_many: {many_time:6.3f}")
+
+    print("Profiling construction from a list (M items/sec)")
+    for n in INIT_SIZES:
+        items = list(range(n))
+        print(f"\t{n:8} items  add: {throughput(add_all, items):6.2f}  "
+              f"ArrayBag: {throughput(ArrayBag, items):6.2f}  "
+              f"typed ArrayBag: "
+              f"{throughput(lambda it: ArrayBag(it, 'q'), items):6.2f}  "
+              f"list: {throughput(list, items):6.2f}")
+
+    print("Profiling count, in and remove (microseconds per call)")
+    for n in INDEX_SIZES:
+        items = [random.randrange(n) for i in range(n)]
+        # Items that are near the end of the array, so in and remove scan
+        # most of it.
+        lookups = items[-LOOKUPS:]
+        for indexed in (False, True):
+            bag = ArrayBag(items, indexed=indexed)
+            count_time, in_time, remove_time = per_lookup(bag, lookups)
+            print(f"\t{n:8} items  indexed: {indexed!s:5}  "
+                  f"count: {count_time:9.3f}  in: {in_time:9.3f}  "
+                  f"remove: {remove_time:9.3f}")
@@ -2,22 +2,86 @@
 
 # Class ArrayList is an implementation of ADT List that uses an array as the
 # underlying data structure. The iterator is implemented by a generator.
-
-import ctypes  # To create the backing array.
+#
+# When the backing array is full, its capacity is increased by a growth
+# policy: a function that is passed the current capacity and the number of
+# elements that must fit, and returns the new capacity. grow_2x (the
+# default) doubles the capacity, grow_1_5x increases it by half (less
+# memory is unused, but more elements are copied), and grow_cpython
+# over-allocates the way CPython's list does, by about 1/8.
+#
+# The capacity is reduced when three-quarters or more of the backing array
+# is unused, to twice the number of elements. After a shrink the array is
+# half full, and after a growth it's more than half full, so a list whose
+# length goes up and down around either boundary isn't resized on every
+# change; it must double in size, or lose half its elements, first. Arrays
+# with a capacity of MIN_SHRINK_CAPACITY or less are never shrunk, because
+# a growth policy can over-allocate by a few elements (grow_cpython grows
+# an empty list to a capacity of 4).
+#
+# An ArrayList can also be used as a gap buffer (ArrayList(gap_buffer=True)),
+# for programs, such as text editors, that insert and delete elements near
+# a position that moves slowly through the list. The unused slots of the
+# backing array (the gap) are kept at the position of the last insertion
+# or deletion, instead of at the end of the array:
+#
+#    [ elements 0 .. g - 1 | gap | the last _tail elements ]
+#
+# Inserting or deleting an element at index i moves the gap to i, by
+# copying the elements between the gap and i, and then takes O(1) time, so
+# a run of edits near the same position costs O(1) amortized per edit
+# instead of O(n). Indexing maps indices after the gap past it. Operations
+# on the whole list (slices, in, ==, +, copying) first move the gap back to
+# the end of the array. A list that isn't a gap buffer always has
+# _tail == 0, so its layout is the usual one.
+
+from allocator import new_array as _new_array  # To create the backing array.
+from allocator import new_array_from as _new_array_from
 
 __author__ = 'James Gohl'
 __student_number__ = '101299043'
 
 
+# A list is shrunk when its capacity is at least this many times its length,
+# and greater than MIN_SHRINK_CAPACITY.
+SHRINK_FACTOR = 4
+MIN_SHRINK_CAPACITY = 8
+
+
+def grow_2x(capacity: int, needed: int) -> int:
+    """Return twice capacity, or needed if that's larger."""
+    return max(needed, 2 * capacity)
+
+
+def grow_1_5x(capacity: int, needed: int) -> int:
+    """Return 1.5 times capacity, or needed if that's larger."""
+    return max(needed, capacity + capacity // 2)
+
+
+def grow_cpython(capacity: int, needed: int) -> int:
+    """Return needed plus about 1/8 more, rounded up to a multiple of 4, as
+    CPython's list does (Objects/listobject.c).
+    """
+    return (needed + (needed >> 3) + 6) & ~3
+
+
 class ArrayList:
 
-    def __init__(self, iterable=[]) -> None:
+    def __init__(self, iterable=[], growth=grow_2x,
+                 gap_buffer: bool = False) -> None:
         """Initialize this ArrayList.
 
         If no iterable is provided, the new ArrayList is empty.
         Otherwise, initialize the ArrayList by appending the values
         provided by the iterable.
 
+        growth is the growth policy (e.g., grow_2x, grow_1_5x or
+        grow_cpython) used when the backing array is full.
+
+        If gap_buffer is True, the list keeps its unused slots at the
+        position of the last insertion or deletion, so edits near that
+        position are fast.
+
         >>> lst = ArrayList()
         >>> lst
         ArrayList([])
@@ -26,17 +90,40 @@ class ArrayList:
         ArrayList([1, 4, 3, 6])
         """
         self._num_items = 0  # of elements stored in the ArrayList
+        self._growth = growth
+        self._reserved = 0  # the capacity is never reduced below this
+        self._gap_buffer = gap_buffer
+        self._tail = 0  # of elements after the gap
         self._elems = _new_array(1)  # backing array
 
+        self.resizes = 0  # of times the backing array was replaced
+        self.elements_copied = 0  # by those resizes
+
         # Note: len(self._elems) is the capacity of the backing array,
         # and not the number of items in the ArrayList.
         # The capacity of the backing array is always >= the number of items
         # in the ArrayList.
 
-        for elem in iterable:
-            self.append(elem)
-            # append() updates self._num_items and increases the capacity of
-            # the backing array, as required.
+        if isinstance(iterable, ArrayList):
+            # Copy the other list's elements with one slice.
+            iterable._close_gap()
+            items = iterable._elems[0:iterable._num_items]
+        elif hasattr(iterable, '__len__'):
+            items = list(iterable)
+        else:
+            # The number of elements isn't known in advance.
+            for elem in iterable:
+                self.append(elem)
+                # append() updates self._num_items and increases the
+                # capacity of the backing array, as required.
+            return
+
+        # Allocate a backing array with exactly the required capacity, and
+        # copy all the elements into it at once, instead of calling append
+        # (and resizing the array about log2(n) times).
+        if len(items) > 0:
+            self._elems = _new_array_from(items)
+            self._num_items = len(items)
 
     def __str__(self) -> str:
         """Return a string representation of this ArrayList.
@@ -120,57 +207,83 @@ class ArrayList:
             # We could instead access the backing array directly; i.e,
             # yield self._elems[i]
 
-    def __getitem__(self, i: int) -> any:
-        """Return the element at index i.
+    def __getitem__(self, i: int | slice) -> any:
+        """Return the element at index i, or, if i is a slice, a new
+        ArrayList containing the elements in the slice.
 
-        Raises IndexError if the index is out of range
-        (i < 0 or i >= len(self)).
+        Like Python's built-in list type, negative indices count from the
+        end of the list, and slices can have any start, stop and step.
 
-        Note: Unlike Python's built-in list type, __getitem__() doesn't
-        support negative indices.
+        Raises IndexError if the index is out of range
+        (i < -len(self) or i >= len(self)).
 
         >>> lst = ArrayList([1, 4, 3, 6])
         >>> lst[0]
         1
-        >>> lst[3]
+        >>> lst[-1]
         6
+        >>> lst[1:3]
+        ArrayList([4, 3])
+        >>> lst[::-2]
+        ArrayList([6, 4])
         """
-        if 0 <= i < len(self):
-            return self._elems[i]
+        if isinstance(i, slice):
+            self._close_gap()
+            return self._from_list(self._get_slice(self._slice_range(i)))
 
-        raise IndexError('ArrayList: index out of range')
+        return self._elems[self._slot(i, 'index out of range')]
 
-    def __setitem__(self, i: int, x: any) -> None:
+    def __setitem__(self, i: int | slice, x: any) -> None:
         """Replace the element at index i with x.
 
-        Raises IndexError if the index is out of range
-        (i < 0 or i >= len(self)).
+        If i is a slice, replace the elements in the slice with the
+        elements provided by the iterable x. As with Python's built-in list
+        type, a slice with a step of 1 can be replaced by any number of
+        elements, so the list can grow or shrink; an extended slice must be
+        replaced by the same number of elements.
 
-        Note: Unlike Python's built-in list type, __setitem__() doesn't
-        support negative indices.
+        Raises IndexError if the index is out of range
+        (i < -len(self) or i >= len(self)).
+        Raises ValueError if an extended slice is replaced by a different
+        number of elements.
 
         >>> lst = ArrayList([1, 4, 3, 6])
         >>> lst[0] = 10
         >>> lst
         ArrayList([10, 4, 3, 6])
-        >>> lst[2] = 7
+        >>> lst[-2] = 7
         >>> lst
         ArrayList([10, 4, 7, 6])
+        >>> lst[1:3] = [20, 30, 40]
+        >>> lst
+        ArrayList([10, 20, 30, 40, 6])
         """
-        if 0 <= i < len(self):
-            self._elems[i] = x
+        if not isinstance(i, slice):
+            self._elems[self._slot(i, 'assignment index out of range')] = x
             return None
 
-        raise IndexError('ArrayList: assignment index out of range')
-
-    def __delitem__(self, i: int) -> None:
-        """Remove the element at index i.
+        values = list(x)  # also copies x if it's this list
+        self._close_gap()
+        r = self._slice_range(i)
+        if r.step == 1:
+            self._replace_run(r.start, max(r.start, r.stop), values)
+        elif len(values) != len(r):
+            raise ValueError('attempt to assign sequence of size {0} to '
+                             'extended slice of size {1}'.format(len(values),
+                                                                 len(r)))
+        elif r.step > 0:
+            self._elems[r.start:r.stop:r.step] = values
+        elif len(r) > 0:
+            values.reverse()
+            self._elems[r[-1]:r[0] + 1:-r.step] = values
+        return None
+
+    def __delitem__(self, i: int | slice) -> None:
+        """Remove the element at index i, or, if i is a slice, the elements
+        in the slice.
 
         Raises IndexError if the index is out of range
-        (i < 0 or i >= len(self)).
-
-        Note: Unlike Python's built-in list type, __delitem__() doesn't
-        support negative indices.
+        (i < -len(self) or i >= len(self)).
 
         >>> lst = ArrayList([1, 4, 3, 6])
         >>> del lst[0]
@@ -179,27 +292,52 @@ class ArrayList:
         >>> len(lst)
         3
 
-        >>> del lst[2]
+        >>> del lst[-1]
         >>> lst
         ArrayList([4, 3])
         >>> len(lst)
         2
-        """
-        if 0 <= i < len(self):
-            # Shift any subsequent elements one position to the left, to close
-            # the gap let when x is removed.
-            self._elems[i:self._num_items - 1] = \
-                self._elems[i + 1:self._num_items]
-            self._num_items -= 1
 
-            # Reduce the list's capacity when two-thirds or more of the
-            # array is unused.
-            if len(self._elems) >= 3 * len(self):
-                self._resize()
+        >>> lst = ArrayList(range(10))
+        >>> del lst[2:8]
+        >>> lst
+        ArrayList([0, 1, 8, 9])
+        """
+        if not isinstance(i, slice):
+            i = self._check_index(i, 'assignment index out of range')
+            if self._gap_buffer:
+                # Move the gap to just after element i, then widen it.
+                self._move_gap(i + 1)
+                self._elems[i] = None
+                self._num_items -= 1
+                self._shrink_if_sparse()
+            else:
+                self._replace_run(i, i + 1, [])
+            return None
 
+        self._close_gap()
+        r = self._slice_range(i)
+        if len(r) == 0:
+            return None
+        if r.step == 1 or r.step == -1:
+            # A contiguous run of elements.
+            self._replace_run(min(r), max(r) + 1, [])
             return None
 
-        raise IndexError('ArrayList: assignment index out of range')
+        # Remove the elements from a copy of the elements from the first
+        # one removed to the end (done in C, by list), then copy the rest
+        # back.
+        if r.step < 0:
+            r = r[::-1]
+        n = self._num_items
+        low = r.start
+        rest = self._elems[low:n]
+        del rest[0:r.stop - low:r.step]
+        self._elems[low:low + len(rest)] = rest
+        self._clear(low + len(rest), n)
+        self._num_items = low + len(rest)
+        self._shrink_if_sparse()
+        return None
 
     def __contains__(self, x: any) -> bool:
         """Return True if x is in this ArrayList; otherwise False.
@@ -215,6 +353,7 @@ class ArrayList:
         #         return True
         # return False
 
+        self._close_gap()
         for i in range(len(self)):   # IMPORTANT: for in range(len(self._elems)) IS WRONG!
             if self._elems[i] == x:
                 return True
@@ -248,9 +387,11 @@ class ArrayList:
         #        newlist.append(elem)
         #    return newlist
 
-        newlist = ArrayList()
+        self._close_gap()
+        other._close_gap()
+        newlist = ArrayList(growth=self._growth, gap_buffer=self._gap_buffer)
         n = len(self) + len(other)
-        newlist._elems = _new_array(n)
+        newlist._elems = _new_array(max(1, n))
         newlist._elems[0:len(self)] = self._elems[0:len(self)]
         newlist._elems[len(self):n] = other._elems[0:len(other)]
         newlist._num_items = n
@@ -283,6 +424,8 @@ class ArrayList:
         if len(other) != len(self):
             return False
 
+        self._close_gap()
+        other._close_gap()
         for i in range(len(self)):
             if self._elems[i] != other._elems[i]:
                 # Instead of accessing the backing arrays directly,
@@ -301,10 +444,11 @@ class ArrayList:
         >>> len(lst)
         5
         """
+        self._close_gap()
         if len(self) == len(self._elems):
             # The backing array is full, so replace it with one that
             # has more capacity.
-            self._resize()
+            self._grow(self._num_items + 1)
 
         self._elems[self._num_items] = x
         self._num_items += 1
@@ -331,15 +475,29 @@ class ArrayList:
         >>> len(lst)
         6
         """
-        if self._num_items == len(self._elems):
-            # The backing array is full, so replace it with one that
-            # has more capacity.
-            self._resize()
-
         if i < 0:
             raise IndexError('ArrayList: assignment index out of range')
 
-        if i < len(self):
+        if self._gap_buffer:
+            i = min(i, self._num_items)
+            if self._num_items == len(self._elems):
+                self._grow(self._num_items + 1)
+            # Move the gap to index i, then put x in its first slot.
+            self._move_gap(i)
+            self._elems[i] = x
+            self._num_items += 1
+        elif i < len(self) and self._num_items == len(self._elems):
+            # The backing array is full. Copy the elements into a larger
+            # array, leaving a gap for x at index i, instead of copying
+            # them all and then shifting the ones after index i.
+            n = self._num_items
+            arr = _new_array(self._growth(len(self._elems), n + 1))
+            arr[0:i] = self._elems[0:i]
+            arr[i] = x
+            arr[i + 1:n + 1] = self._elems[i:n]
+            self._replace_array(arr, n)
+            self._num_items += 1
+        elif i < len(self):
             # Elements in the list are stored at indices 0 .. num_items - 1,
             # inclusive.
             # Shift the element currently at index i and any subsequent
@@ -413,10 +571,7 @@ class ArrayList:
         >>> lst
         ArrayList([4, 3, 6])
         """
-        if i < 0:
-            i = len(self) - i * - 1
-        if i > (len(self) - 1):
-            raise IndexError("index out of range")
+        # self[i] raises IndexError if i is out of range.
         return_value = self[i]
         del self[i]
         return return_value
@@ -441,49 +596,190 @@ class ArrayList:
             # We could instead access the backing array directly; i.e,
             # yield self._elems[i]
 
-    def _resize(self) -> None:
-        """Change this ArrayList's capacity to 2 * n, where n is the number of
-        elements in the list. If the list is empty, change its capacity to 1.
+    def _check_index(self, i: int, message: str) -> int:
+        """Return index i as a non-negative index; a negative i counts from
+        the end of the list.
+
+        Raises IndexError with the specified message if i is out of range.
         """
-        # Allocate a new array with the required capacity.
-        arr = _new_array(max(1, 2 * self._num_items))
+        if i < 0:
+            i += self._num_items
+        if 0 <= i < self._num_items:
+            return i
+        raise IndexError('ArrayList: ' + message)
 
-        # Copy the _num_items elements in the current backing array to the
-        # new array.
-        arr[0:self._num_items] = self._elems[0:self._num_items]
+    def _slot(self, i: int, message: str) -> int:
+        """Return the slot of the backing array that holds the element at
+        index i; a negative i counts from the end of the list.
 
-        # Replace the current backing array.
-        self._elems = arr
+        Raises IndexError with the specified message if i is out of range.
+        """
+        i = self._check_index(i, message)
+        if i >= self._num_items - self._tail:
+            # The element is after the gap.
+            i += len(self._elems) - self._num_items
+        return i
+
+    def _move_gap(self, i: int) -> None:
+        """Move the gap so that it starts at index i (0 <= i <= n), by
+        copying the elements between the gap and index i across it.
+        """
+        n = self._num_items
+        gap = n - self._tail             # the index of the first slot
+        size = len(self._elems) - n      # the number of slots
+        if i < gap:
+            # Move elements i .. gap - 1 to the right of the gap.
+            self._elems[i + size:gap + size] = self._elems[i:gap]
+            self._clear(i, min(gap, i + size))
+        elif i > gap:
+            # Move the first i - gap elements after the gap to its left.
+            self._elems[gap:i] = self._elems[gap + size:i + size]
+            self._clear(max(i, gap + size), i + size)
+        self._tail = n - i
+
+    def _close_gap(self) -> None:
+        """Move the gap to the end of the backing array, so the elements
+        are at indices 0 .. n - 1.
+        """
+        if self._tail > 0:
+            self._move_gap(self._num_items)
+
+    def _slice_range(self, s: slice) -> range:
+        """Return the range of the indices of the elements in slice s."""
+        return range(*s.indices(self._num_items))
+
+    def _get_slice(self, r: range) -> list:
+        """Return a list of the elements at the indices in range r, copied
+        from the backing array by a single slice.
+        """
+        if r.step > 0:
+            return self._elems[r.start:r.stop:r.step]
+        if len(r) == 0:
+            return []
+        items = self._elems[r[-1]:r[0] + 1:-r.step]
+        items.reverse()
+        return items
+
+    def _from_list(self, items: list) -> 'ArrayList':
+        """Return a new ArrayList, with this list's growth policy,
+        that holds the elements in items.
+        """
+        newlist = ArrayList(growth=self._growth, gap_buffer=self._gap_buffer)
+        if len(items) > 0:
+            newlist._elems = _new_array_from(items)
+            newlist._num_items = len(items)
+        return newlist
+
+    def _replace_run(self, start: int, stop: int, values: list) -> None:
+        """Replace the elements at indices start .. stop - 1 with the
+        elements in values, shifting the elements that follow them once.
+        """
+        n = self._num_items
+        new_n = n - (stop - start) + len(values)
+        if new_n > len(self._elems):
+            # Copy the elements into a larger array, around the new values.
+            arr = _new_array(self._growth(len(self._elems), new_n))
+            arr[0:start] = self._elems[0:start]
+            arr[start:start + len(values)] = values
+            arr[start + len(values):new_n] = self._elems[stop:n]
+            self._replace_array(arr, n - (stop - start))
+            self._num_items = new_n
+            return
+
+        # The slice on the right is copied to a list before it's assigned,
+        # so the runs can overlap.
+        if new_n != n:
+            self._elems[start + len(values):new_n] = self._elems[stop:n]
+        self._elems[start:start + len(values)] = values
+        self._clear(new_n, n)
+        self._num_items = new_n
+        if new_n < n:
+            self._shrink_if_sparse()
+
+    def _clear(self, start: int, stop: int) -> None:
+        """Set the unused slots start .. stop - 1 of the backing array to
+        None, so they don't keep removed elements alive.
+        """
+        if start < stop:
+            self._elems[start:stop] = [None] * (stop - start)
 
+    @property
+    def capacity(self) -> int:
+        """The number of elements this ArrayList can hold before its backing
+        array must be replaced.
+        """
+        return len(self._elems)
 
-def _new_array(capacity: int) -> 'py_object_Array_<capacity>':
-    """Return a new array with the specified capacity that stores
-    references to Python objects. All elements are initialized to None.
+    def reserve(self, n: int) -> None:
+        """Increase this ArrayList's capacity to at least n, so that it can
+        grow to n elements without being resized. The capacity won't be
+        reduced below n when elements are removed, until shrink_to_fit is
+        called.
 
-    >>> arr = _new_array(10)
-    >>> len(arr)
-    10
+        >>> lst = ArrayList()
+        >>> lst.reserve(100)
+        >>> lst.capacity
+        100
+        """
+        self._reserved = n
+        if n > len(self._elems):
+            self._resize(n)
 
-    >>> for i in range(10):
-    ...      a[i] = 2 * i
-    ...
+    def shrink_to_fit(self) -> None:
+        """Reduce this ArrayList's capacity to the number of elements it
+        holds (1 if it's empty), and cancel any capacity set by reserve.
 
-    >>> arr[0]
-    0
-    >>> arr[9]
-    18
+        >>> lst = ArrayList([1, 4, 3, 6])
+        >>> lst.append(2)
+        >>> lst.shrink_to_fit()
+        >>> lst.capacity
+        5
+        """
+        self._reserved = 0
+        if len(self._elems) > max(1, self._num_items):
+            self._resize(max(1, self._num_items))
 
-    >>> 4 in arr
-    True
-    >>> 3 in arr
-    False
-    """
-    if capacity <= 0:
-        raise ValueError('new_array: capacity must be > 0')
+    def _grow(self, needed: int) -> None:
+        """Increase this ArrayList's capacity, as chosen by its growth
+        policy, so that it can hold at least needed elements.
+        """
+        self._resize(self._growth(len(self._elems), needed))
 
-    PyCArrayType = ctypes.py_object * capacity
-    a = PyCArrayType()
-    for i in range(len(a)):
-        a[i] = None
+    def _shrink_if_sparse(self) -> None:
+        """Reduce this ArrayList's capacity to 2 * n, where n is the number
+        of elements in the list, if the capacity is at least
+        SHRINK_FACTOR * n and greater than MIN_SHRINK_CAPACITY. The
+        capacity is never reduced below 1 or the capacity set by reserve.
+        """
+        capacity = max(1, 2 * self._num_items, self._reserved)
+        if (len(self._elems) > MIN_SHRINK_CAPACITY
+                and len(self._elems) >= SHRINK_FACTOR * self._num_items
+                and len(self._elems) > capacity):
+            self._resize(capacity)
+
+    def _resize(self, capacity: int) -> None:
+        """Change this ArrayList's capacity to capacity, which must be at
+        least the number of elements in the list.
+        """
+        # Allocate a new array with the required capacity.
+        arr = _new_array(capacity)
 
-    return a
+        # Copy the _num_items elements in the current backing array to the
+        # new array. The elements after the gap (if any) are copied to the
+        # end of the new array, so the gap doesn't move.
+        head = self._num_items - self._tail
+        arr[0:head] = self._elems[0:head]
+        if self._tail > 0:
+            arr[capacity - self._tail:capacity] = \
+                self._elems[len(self._elems) - self._tail:len(self._elems)]
+
+        self._replace_array(arr, self._num_items)
+
+    def _replace_array(self, arr: 'py_object_Array_<capacity>',
+                       copied: int) -> None:
+        """Replace the current backing array with arr, into which copied
+        elements have been copied.
+        """
+        self._elems = arr
+        self.resizes += 1
+        self.elements_copied += copied
@@ -0,0 +1,33 @@
+# SYSC 2100 Winter 2024 Lab 4: Unit tests for the allocator module.
+
+import sys
+import unittest
+
+from allocator import new_array, new_array_from
+
+
+class NewArrayTestCase(unittest.TestCase):
+    """Test new_array and new_array_from."""
+
+    def test_new_array1(self):
+        """Every element of a new array is None."""
+        for capacity in [1, 2, 10, 10000]:
+            arr = new_array(capacity)
+            self.assertEqual(len(arr), capacity)
+            self.assertEqual(arr[0:capacity], [None] * capacity)
+        with self.assertRaises(ValueError):
+            new_array(0)
+
+    def test_new_array2(self):
+        """Elements can be replaced, and the objects are kept alive."""
+        arr = new_array(10)
+        obj = object()
+        before = sys.getrefcount(obj)
+        arr[3] = obj
+        self.assertIs(arr[3], obj)
+        self.assertEqual(sys.getrefcount(obj), before + 1)
+        self.assertEqual(new_array_from([2, 4, 6])[0:3], [2, 4, 6])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -2,7 +2,7 @@
 
 import unittest
 
-from lab4_arraylist import ArrayList
+from lab4_arraylist import ArrayList, grow_1_5x, grow_2x, grow_cpython
 
 
 class IterTestCase(unittest.TestCase):
@@ -24,6 +24,35 @@ class IterTestCase(unittest.TestCase):
             elems.append(elem)
         self.assertEqual(sorted(elems), [1, 1, 4, 4, 4, 6, 6, 9])
 
+
+class InitTestCase(unittest.TestCase):
+    """Test __init__."""
+
+    def test_init1(self):
+        """An empty list has a backing array with capacity 1."""
+        for iterable in [[], (), iter([])]:
+            lst = ArrayList(iterable)
+            self.assertEqual(len(lst), 0)
+            self.assertEqual(len(lst._elems), 1)
+
+    def test_init2(self):
+        """A sized iterable is copied into an array of exactly its size."""
+        for iterable in [[1, 4, 3, 6], (1, 4, 3, 6), range(4), 'abcd']:
+            lst = ArrayList(iterable)
+            self.assertEqual(len(lst._elems), 4)
+            self.assertEqual(list(lst), list(iterable))
+
+    def test_init3(self):
+        """Copy another ArrayList, and a generator (size not known)."""
+        lst = ArrayList([1, 4, 3])
+        lst.append(6)
+        copy = ArrayList(lst)
+        self.assertEqual(copy, lst)
+        self.assertEqual(len(copy._elems), 4)
+        copy.append(7)
+        self.assertEqual(len(lst), 4)
+        self.assertEqual(list(ArrayList(x for x in [1, 4, 3])), [1, 4, 3])
+
 # The following classes test the ArrayList methods developed during Lab 4.
 
 
@@ -71,5 +100,199 @@ class ReversedTestCase(unittest.TestCase):
     # test mwthods for the reverse iterator.
 
 
+class ResizeTestCase(unittest.TestCase):
+    """Test growth policies, shrinking, reserve and shrink_to_fit."""
+
+    def test_growth1(self):
+        """Each growth policy's sequence of capacities."""
+        expected = {grow_2x: [1, 2, 4, 8, 16, 32],
+                    grow_1_5x: [1, 2, 3, 4, 6, 9, 13, 19, 28],
+                    grow_cpython: [1, 8, 16, 24, 32]}
+        for growth, capacities in expected.items():
+            lst = ArrayList(growth=growth)
+            seen = [lst.capacity]
+            for x in range(capacities[-1]):  # fills the last capacity
+                lst.append(x)
+                if lst.capacity != seen[-1]:
+                    seen.append(lst.capacity)
+            self.assertEqual(seen, capacities)
+            self.assertEqual(list(lst), list(range(capacities[-1])))
+
+    def test_growth2(self):
+        """The resizes and the elements they copied are counted."""
+        lst = ArrayList()
+        for x in range(16):
+            lst.append(x)
+        self.assertEqual(lst.resizes, 4)                 # 2, 4, 8, 16
+        self.assertEqual(lst.elements_copied, 1 + 2 + 4 + 8)
+
+    def test_shrink1(self):
+        """A list whose length goes up and down around a resize boundary is
+        resized once, not on every change.
+        """
+        for growth in [grow_2x, grow_1_5x, grow_cpython]:
+            for n in [1, 8, 64, 100]:
+                lst = ArrayList(range(n), growth=growth)  # full
+                for i in range(50):
+                    lst.append(i)
+                    lst.pop()
+                self.assertEqual(lst.resizes, 1)
+
+                lst = ArrayList(range(4 * n + 40), growth=growth)
+                while lst.resizes == 0:
+                    lst.pop()
+                for i in range(50):
+                    lst.append(i)
+                    lst.pop()
+                    lst.pop()
+                    lst.append(i)
+                self.assertEqual(lst.resizes, 1)
+
+    def test_shrink2(self):
+        """A list is shrunk when three-quarters of its array is unused."""
+        lst = ArrayList(range(64))
+        for i in range(47):
+            lst.pop()
+        self.assertEqual(lst.capacity, 64)
+        lst.pop()
+        self.assertEqual(lst.capacity, 32)
+        self.assertEqual(list(lst), list(range(16)))
+
+    def test_reserve(self):
+        """Test reserve and shrink_to_fit."""
+        lst = ArrayList()
+        lst.reserve(100)
+        self.assertEqual(lst.capacity, 100)
+        for x in range(100):
+            lst.append(x)
+        self.assertEqual(lst.resizes, 1)
+        while len(lst) > 0:
+            lst.pop()
+        self.assertEqual(lst.capacity, 100)
+        lst.shrink_to_fit()
+        self.assertEqual(lst.capacity, 1)
+        lst.append(1)
+        lst.append(2)
+        lst.append(3)
+        lst.shrink_to_fit()
+        self.assertEqual(lst.capacity, 3)
+        self.assertEqual(list(lst), [1, 2, 3])
+
+    def test_insert(self):
+        """insert checks the index before resizing, and inserts into a
+        full list with one copy.
+        """
+        lst = ArrayList([1, 2, 3, 4])
+        with self.assertRaises(IndexError):
+            lst.insert(-1, 0)
+        self.assertEqual(lst.capacity, 4)
+        lst.insert(2, 10)
+        self.assertEqual(list(lst), [1, 2, 10, 3, 4])
+        self.assertEqual((lst.capacity, lst.resizes, lst.elements_copied),
+                         (8, 1, 4))
+
+
+class SliceTestCase(unittest.TestCase):
+    """Test negative indices and slices."""
+
+    def test_slice1(self):
+        """Test __getitem__ with negative indices and slices."""
+        lst = ArrayList(range(10))
+        self.assertEqual(lst[-1], 9)
+        self.assertEqual(lst[-10], 0)
+        with self.assertRaises(IndexError):
+            lst[-11]
+        for s in [slice(2, 5), slice(None, None, -1), slice(-3, None),
+                  slice(1, 9, 3), slice(8, 1, -2), slice(5, 2),
+                  slice(-20, 20)]:
+            self.assertEqual(lst[s], ArrayList(list(range(10))[s]))
+
+    def test_slice2(self):
+        """Test __setitem__ with slices."""
+        lst = ArrayList(range(6))
+        lst[1:3] = 'abcd'  # grows the list
+        self.assertEqual(list(lst), [0, 'a', 'b', 'c', 'd', 3, 4, 5])
+        lst[2:7] = []      # shrinks the list
+        self.assertEqual(list(lst), [0, 'a', 5])
+        lst[::-2] = ['x', 'y']
+        self.assertEqual(list(lst), ['y', 'a', 'x'])
+        lst[:] = lst
+        self.assertEqual(list(lst), ['y', 'a', 'x'])
+        with self.assertRaises(ValueError):
+            lst[::2] = [1, 2, 3]
+
+    def test_slice3(self):
+        """Test __delitem__ with slices, and that unused slots are
+        cleared.
+        """
+        lst = ArrayList(range(10))
+        del lst[2:8]
+        self.assertEqual(list(lst), [0, 1, 8, 9])
+        lst = ArrayList(range(10))
+        del lst[::-3]
+        self.assertEqual(list(lst), [1, 2, 4, 5, 7, 8])
+        del lst[-1]
+        self.assertEqual(list(lst), [1, 2, 4, 5, 7])
+        for i in range(len(lst), lst.capacity):
+            self.assertIsNone(lst._elems[i])
+
+
+class GapBufferTestCase(unittest.TestCase):
+    """Test ArrayLists that are gap buffers."""
+
+    # The tests in this class access the "private" attributes in the
+    # ArrayList objects. This is done to verify where the gap is.
+
+    def test_gap1(self):
+        """Inserting and deleting moves the gap to the edit."""
+        lst = ArrayList(range(4), gap_buffer=True)
+        lst.insert(1, 'a')   # [0, 'a', | gap | 1, 2, 3]
+        self.assertEqual(list(lst), [0, 'a', 1, 2, 3])
+        self.assertEqual(lst._tail, 3)
+        lst.insert(2, 'b')
+        lst.insert(3, 'c')
+        del lst[3]
+        self.assertEqual(list(lst), [0, 'a', 'b', 1, 2, 3])
+        self.assertEqual(lst._tail, 3)
+        self.assertEqual((lst[3], lst[-1]), (1, 3))
+        lst[-1] = 'z'
+        self.assertEqual(list(lst), [0, 'a', 'b', 1, 2, 'z'])
+        self.assertEqual(lst.resizes, 1)
+
+    def test_gap2(self):
+        """The gap's slots hold None, and a resize keeps the gap in place."""
+        lst = ArrayList(range(8), gap_buffer=True)
+        for x in range(20):
+            lst.insert(4 + x, x)
+        self.assertEqual(lst._tail, 4)
+        self.assertEqual(list(lst), [0, 1, 2, 3] + list(range(20)) +
+                         [4, 5, 6, 7])
+        while len(lst) > 6:
+            del lst[2]
+        self.assertEqual(list(lst), [0, 1, 4, 5, 6, 7])
+        gap = len(lst) - lst._tail
+        for i in range(gap, gap + lst.capacity - len(lst)):
+            self.assertIsNone(lst._elems[i])
+
+    def test_gap3(self):
+        """Operations on the whole list give the same results as for an
+        ordinary ArrayList.
+        """
+        lst = ArrayList(range(6), gap_buffer=True)
+        lst.insert(2, 'a')
+        other = ArrayList([0, 1, 'a', 2, 3, 4, 5])
+        self.assertTrue(lst == other)
+        self.assertTrue(other == lst)
+        self.assertTrue('a' in lst)
+        self.assertEqual(lst[1:4], ArrayList([1, 'a', 2]))
+        self.assertEqual(list(lst + lst), list(other) * 2)
+        self.assertEqual(list(ArrayList(lst)), list(other))
+        lst.insert(1, 'b')
+        lst.append('c')
+        self.assertEqual(list(lst), [0, 'b', 1, 'a', 2, 3, 4, 5, 'c'])
+        self.assertEqual(lst.pop(1), 'b')
+        self.assertEqual(list(reversed(list(lst))), list(lst.__reversed__()))
+
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -0,0 +1,43 @@
+# SYSC 2100 Winter 2024 - Lab 4
+#
+# Profile the allocation of backing arrays with capacities from 1 to 10^7:
+# the original _new_array (which sets each element to None in a Python
+# loop) and allocator.new_array (which sets them with one slice
+# assignment).
+
+__author__ = 'James Gohl'
+__student_number__ = '101299043'
+
+import ctypes
+from time import perf_counter
+
+from allocator import new_array
+
+CAPACITIES = [1, 10, 100, 10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]
+
+
+def loop_array(capacity: int) -> 'py_object_Array_<capacity>':
+    """The original implementation of _new_array."""
+    a = (ctypes.py_object * capacity)()
+    for i in range(len(a)):
+        a[i] = None
+    return a
+
+
+def per_call(function, capacity: int) -> float:
+    """Return the average time of function(capacity), in microseconds,
+    over enough calls to take a measurable time.
+    """
+    calls = max(3, 10 ** 5 // capacity)
+    start_time = perf_counter()
+    for i in range(calls):
+        function(capacity)
+    return (perf_counter() - start_time) / calls * 1e6
+
+
+# You are permitted to change this script.
+if __name__ == '__main__':
+    print("Profiling array allocation (microseconds per array)")
+    for capacity in CAPACITIES:
+        print(f"\t{capacity:9}  loop: {per_call(loop_array, capacity):12.1f}  "
+              f"new_array: {per_call(new_array, capacity):12.1f}")
@@ -0,0 +1,95 @@
+# SYSC 2100 Winter 2024 - Lab 4
+#
+# Profile the construction of an ArrayList from a sized iterable (a list,
+# a range and another ArrayList), which allocates the backing array once
+# and copies the elements with one slice assignment, against appending
+# the elements one at a time and against Python's list(iterable).
+#
+# Also profile appending n elements with each growth policy: the time, the
+# number of resizes, the number of elements they copied, and the unused
+# capacity at the end.
+#
+# Also profile copying and deleting a run of half the elements with a
+# slice, against one element at a time.
+
+__author__ = 'James Gohl'
+__student_number__ = '101299043'
+
+from time import perf_counter
+
+from lab4_arraylist import ArrayList, grow_1_5x, grow_2x, grow_cpython
+
+SIZES = [10 ** 4, 10 ** 5, 10 ** 6]
+POLICIES = [grow_2x, grow_1_5x, grow_cpython]
+
+
+def append_all(iterable) -> ArrayList:
+    """Build an ArrayList by appending the elements one at a time (the
+    original implementation of __init__).
+    """
+    lst = ArrayList()
+    for elem in iterable:
+        lst.append(elem)
+    return lst
+
+
+def throughput(function, iterable) -> float:
+    """Return the number of elements per second that function(iterable)
+    copies, in millions.
+    """
+    start_time = perf_counter()
+    function(iterable)
+    return len(iterable) / (perf_counter() - start_time) / 1e6
+
+
+# You are permitted to change this script.
+if __name__ == '__main__':
+    print("Profiling construction from a sized iterable (M elements/sec)")
+    for n in SIZES:
+        source = list(range(n))
+        for label, iterable in [('list', source), ('range', range(n)),
+                                ('ArrayList', ArrayList(source))]:
+            print(f"\t{n:8} from {label:9}  "
+                  f"append: {throughput(append_all, iterable):7.2f}  "
+                  f"ArrayList: {throughput(ArrayList, iterable):7.2f}  "
+                  f"list: {throughput(list, iterable):7.2f}")
+
+    print("Profiling appends with each growth policy")
+    for n in SIZES:
+        for growth in POLICIES:
+            lst = ArrayList(growth=growth)
+            start_time = perf_counter()
+            for x in range(n):
+                lst.append(x)
+            elapsed = perf_counter() - start_time
+            print(f"\t{n:8} {growth.__name__:12}  time: {elapsed:6.3f} sec  "
+                  f"resizes: {lst.resizes:3}  "
+                  f"copied: {lst.elements_copied / n:5.2f} per element  "
+                  f"unused: {1 - n / lst.capacity:6.1%}")
+
+    print("Profiling slices of half the elements (sec)")
+    for n in SIZES:
+        lst = ArrayList(range(n))
+        start_time = perf_counter()
+        sub = ArrayList()
+        for i in range(n // 4, 3 * n // 4):
+            sub.append(lst[i])
+        loop_get = perf_counter() - start_time
+        start_time = perf_counter()
+        sub = lst[n // 4:3 * n // 4]
+        slice_get = perf_counter() - start_time
+
+        if n <= 10 ** 4:  # each del shifts the tail: O(n ** 2)
+            copy = ArrayList(lst)
+            start_time = perf_counter()
+            for i in range(n // 2):
+                del copy[n // 4]
+            loop_del = f"{perf_counter() - start_time:8.4f}"
+        else:
+            loop_del = f"{'-':>8}"
+        copy = ArrayList(lst)
+        start_time = perf_counter()
+        del copy[n // 4:3 * n // 4]
+        slice_del = perf_counter() - start_time
+        print(f"\t{n:8}  get: loop {loop_get:8.4f}  slice {slice_get:8.4f}"
+              f"   del: loop {loop_del}  slice {slice_del:8.4f}")
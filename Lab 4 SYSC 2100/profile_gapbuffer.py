@@ -0,0 +1,94 @@
+# SYSC 2100 Winter 2024 - Lab 4
+#
+# Profile insertions and deletions in an ArrayList, an ArrayList that is a
+# gap buffer, and Python's list, for three patterns of edits:
+#
+#    random       each edit is at a random index
+#    clustered    each edit is at a cursor that moves a few positions at a
+#                 time, as in a text editor
+#    front-heavy  each edit is at one of the first few indices
+#
+# Two-thirds of the edits are insertions and one-third are deletions.
+
+__author__ = 'James Gohl'
+__student_number__ = '101299043'
+
+import random
+from time import perf_counter
+
+from lab4_arraylist import ArrayList
+
+SIZES = [10 ** 3, 10 ** 4, 10 ** 5]
+SLOW_LIMIT = 10 ** 4  # edits that shift the tail take O(n) time
+EDITS = 2000
+CURSOR_STEP = 5  # the largest move of the cursor between clustered edits
+
+
+def random_positions(rng: random.Random, n: int) -> list[int]:
+    """Return the positions of EDITS edits at random indices."""
+    return [rng.randrange(n) for i in range(EDITS)]
+
+
+def clustered_positions(rng: random.Random, n: int) -> list[int]:
+    """Return the positions of EDITS edits at a cursor that starts in the
+    middle of the list and moves up to CURSOR_STEP positions at a time.
+    """
+    positions = []
+    cursor = n // 2
+    for i in range(EDITS):
+        cursor = min(max(cursor + rng.randint(-CURSOR_STEP, CURSOR_STEP), 0),
+                     n - 1)
+        positions.append(cursor)
+    return positions
+
+
+def front_positions(rng: random.Random, n: int) -> list[int]:
+    """Return the positions of EDITS edits at one of the first 10
+    indices.
+    """
+    return [rng.randrange(10) for i in range(EDITS)]
+
+
+PATTERNS = {'random': random_positions, 'clustered': clustered_positions,
+            'front-heavy': front_positions}
+
+
+def edit(lst, positions: list[int]) -> float:
+    """Insert at, or delete from, each of the positions in lst, and return
+    the time taken, in seconds.
+    """
+    start_time = perf_counter()
+    for k, i in enumerate(positions):
+        if k % 3 == 2:
+            del lst[min(i, len(lst) - 1)]
+        else:
+            lst.insert(i, k)
+    return perf_counter() - start_time
+
+
+def per_edit(make_list, positions: list[int], slow: bool) -> str:
+    """Return the average time per edit, in microseconds, of the edits at
+    positions to the list returned by make_list(), formatted for printing,
+    or '-' if slow is True.
+    """
+    if slow:
+        return '-'
+    return f"{edit(make_list(), positions) / EDITS * 1e6:.2f}"
+
+
+# You are permitted to change this script.
+if __name__ == '__main__':
+    rng = random.Random(2100)
+    print(f"Profiling {EDITS} edits (microseconds per edit)")
+    for n in SIZES:
+        slow = n > SLOW_LIMIT
+        for name, pattern in PATTERNS.items():
+            positions = pattern(rng, n)
+            array_time = per_edit(lambda: ArrayList(range(n)), positions,
+                                  slow)
+            gap_time = per_edit(
+                lambda: ArrayList(range(n), gap_buffer=True), positions,
+                slow and name == 'random')
+            list_time = per_edit(lambda: list(range(n)), positions, False)
+            print(f"\t{n:7} {name:12}  ArrayList: {array_time:>9}  "
+                  f"gap buffer: {gap_time:>9}  list: {list_time:>6}")
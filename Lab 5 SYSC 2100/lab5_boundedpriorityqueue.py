@@ -1,7 +1,8 @@
 # SYSC 2100 Winter 2024 Lab 5
 
 from collections import deque
-import ctypes
+
+from allocator import new_array as _new_array
 
 __author__ = 'James Gohl'
 __student_number__ = '101299043'
@@ -122,36 +123,3 @@ class BoundedPriorityQueue:
             if len(self._queues[i]) != 0:
                 self._num_items -= 1
                 return (self._queues[i]).popleft()
-
-
-def _new_array(capacity: int) -> 'py_object_Array_<capacity>':
-    """Return a new array with the specified capacity that stores
-    references to Python objects. All elements are initialized to None.
-
-    >>> arr = _new_array(10)
-    >>> len(arr)
-    10
-
-    >>> for i in range(10):
-    ...      a[i] = 2 * i
-    ...
-
-    >>> arr[0]
-    0
-    >>> arr[9]
-    18
-
-    >>> 4 in arr
-    True
-    >>> 3 in arr
-    False
-    """
-    if capacity <= 0:
-        raise ValueError('new_array: capacity must be > 0')
-
-    PyCArrayType = ctypes.py_object * capacity
-    a = PyCArrayType()
-    for i in range(len(a)):
-        a[i] = None
-
-    return a